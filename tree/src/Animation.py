@@ -0,0 +1,130 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    ANIMATION COMPILER                       CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Compiles any of our effects offline into a frame file (see 'Frame_File.py') and plays those files back on the tree.
+#   Heavy effects can be rendered on a workstation that is far faster than the Pi, the tree then only has to copy
+#   frames out of a memory mapped file so playback costs the same no matter how complex the effect was.
+#
+#   python src/Animation.py compile radial_rainbow --args "[0, 5, 1.0]" --frames 72 -o radial.frames
+#   python src/Animation.py play radial.frames --duration 60 --seek 1.5
+#
+# Compiling runs the effect as fast as it can against a sink that writes every frame into the file, so the effect
+#   only has to be deterministic in frames, not in wall clock time.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import argparse
+import contextlib
+import json
+import numpy as np
+from numbers import Real
+
+from Effects import LEDEffects
+from helpers.Frame_File import FrameFileReader, FrameFileWriter
+
+DEFAULT_FPS = 35
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Stands in for LEDController while compiling. Every frame goes straight into our 'writer', once we have
+             'frames' of them we ask the effect to stop and ignore anything else it hands us. Frames are 'shown'
+             exactly 1 / fps apart so the file animates just like it would live.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class CompileSink:
+    
+    def __init__(self, frames: int, fps: Real) -> None:
+        self.frames = frames
+        self.refresh_rate_hz = fps
+        self.effects = None
+        self.writer = None
+        self._slot = None
+        self._frames_handed = 0
+    
+    def next_frame_time(self) -> float:
+        return self._frames_handed / self.refresh_rate_hz
+    
+    def update_leds(self, led_array: list) -> None:
+        self._frames_handed += 1
+        if self.writer.frame_count < self.frames:
+            self.writer.write(np.asarray(led_array, dtype=np.uint8))
+            if self.writer.frame_count == self.frames:
+                self.effects.run_effect = False
+    
+    @contextlib.contextmanager
+    def frame_slot(self):
+        if self._slot is None:
+            self._slot = np.zeros((self.writer.num_leds, 3), dtype=np.uint8)
+        yield self._slot
+        self.update_leds(self._slot)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Renders 'frames' frames of an effect into a frame file.
+INPUT: effect_name - Name of the LEDEffects method to compile.
+       args - Args for that effect.
+       path - Frame file to write.
+       frames - Number of frames to render.
+       fps - Rate the file should be played back at.
+       loop_start - First frame of the section that repeats on playback.
+       loop_end - One past the last frame that repeats, 0 for the end of the file.
+       coords - Optional coords to render for, defaults to our real tree.
+OUTPUT: Header dict of the file we wrote.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def compile_effect(effect_name: str, args: tuple, path: str, frames: int, fps: Real=DEFAULT_FPS, loop_start: int=0
+                   , loop_end: int=0, coords: list[list[Real]]=None) -> dict:
+    sink = CompileSink(frames, fps)
+    sink.effects = LEDEffects(coords=coords, led_controller=sink)
+    sink.writer = FrameFileWriter(path, sink.effects.num_leds, fps, loop_start, loop_end)
+    
+    try:
+        sink.effects.run_effect = True
+        getattr(sink.effects, effect_name)(*args)
+    finally:
+        sink.writer.close()
+    return FrameFileReader(path).header
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile effects into frame files and play them back.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    compile_parser = commands.add_parser('compile', help="Render an effect into a frame file.")
+    compile_parser.add_argument('effect', help="Name of the LEDEffects method to compile.")
+    compile_parser.add_argument('--args', default='[]', help="JSON list of args for the effect.")
+    compile_parser.add_argument('--frames', type=int, required=True, help="Number of frames to render.")
+    compile_parser.add_argument('--fps', type=float, default=DEFAULT_FPS, help="Playback rate of the file.")
+    compile_parser.add_argument('--loop', type=int, nargs=2, default=(0, 0), metavar=('START', 'END')
+                                , help="Loop section of the file, END of 0 is the end of the file.")
+    compile_parser.add_argument('-o', '--output', required=True, help="Frame file to write.")
+    
+    play_parser = commands.add_parser('play', help="Play a frame file on the tree.")
+    play_parser.add_argument('path', help="Frame file to play.")
+    play_parser.add_argument('--duration', type=float, default=60, help="Seconds to play for.")
+    play_parser.add_argument('--seek', type=float, default=0.0, help="Seconds into the file to start at.")
+    play_parser.add_argument('--stop', type=int, default=None, help="Frame to stop at (exclusive).")
+    play_parser.add_argument('--no-loop', action='store_true', help="Play once instead of looping.")
+    play_parser.add_argument('--output', default=None, help="LED output to play on, see 'Led_Outputs.py'.")
+    args = parser.parse_args()
+    
+    if args.command == 'compile':
+        header = compile_effect(args.effect, tuple(json.loads(args.args)), args.output, args.frames, args.fps
+                                , *args.loop)
+        print(f"Wrote {header['frame_count']} frames of {header['num_leds']} LEDs at {header['fps']} fps to "
+              f"'{args.output}'.")
+    else:
+        led_effects = LEDEffects(output=args.output)
+        try:
+            start = FrameFileReader(args.path).frame_at(args.seek)
+            led_effects.run_effect_for_x_seconds(led_effects.play_animation, duration=args.duration
+                                                 , args=(args.path, start, args.stop, not args.no_loop))
+        finally:
+            led_effects.close()
+
+
+if __name__ == "__main__":
+    main()
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
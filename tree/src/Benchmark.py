@@ -0,0 +1,218 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    EFFECT BENCHMARKS                        CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Measures how fast each of our effects actually renders. Every effect is run for a fixed number of frames against a
+#   headless 'NullOutput' in this process with no frame pacing at all, so what we measure is purely the cost of
+#   rendering and writing out each frame. Each case runs in its own fresh process so peak RSS is per case.
+#
+# Cases can also be rendered by a render farm (see 'Render_Farm.py') with '--workers', 0 being our usual in-process
+#   rendering. Every case is then run once per worker count so we can see how each effect scales.
+#
+# For every case we report -
+#   fps                 - Frames rendered per second.
+#   frame_ms_pXX        - Frame time percentiles, time from one frame being handed off to the next.
+#   alloc_kib_per_frame - Average peak of short lived Python/ numpy allocations per frame (via 'tracemalloc').
+#   peak_rss_mib        - Peak resident memory of the process running the case, not counting render farm workers.
+#   speedup             - fps relative to the first worker count we ran the case at.
+#
+# 'NUM_LEDS' can be scaled with '--num-leds', anything other than our real tree is made up of our real coordinates
+#   resampled with a bit of jitter so effects still see a tree shaped point cloud.
+#
+#   python src/Benchmark.py --frames 300 --num-leds 650 2000 10000 --output bench.json
+#   python src/Benchmark.py --effects random_plane --num-leds 20000 --workers 1 2 3 4
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import argparse
+import contextlib
+import json
+import numpy as np
+import os
+import platform
+import resource
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from Coords import coordinates
+from Effects import LEDEffects
+from Led_Outputs import LEDOutput, NullOutput
+
+BENCHMARK_CASES = (('axis_rainbow', (0, 0.3, 0.5))
+                   , ('axis_rainbow', (2, -0.3, 0.5))
+                   , ('radial_rainbow', (0, 175, 1.0))
+                   , ('radial_rainbow', (2, 175, 0.5))
+                   , ('random_plane', (210,))
+                   , ('solid_color_rainbow', (175,)))
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Stands in for LEDController. Frames are written straight to 'output' in this process and timed, once we
+             have 'frames' of them we ask the effect to stop. Frames are 'shown' exactly 1 / refresh_rate_hz apart
+             however fast we render them so effects animate just like they would live.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class BenchmarkSink:
+    
+    def __init__(self, output: LEDOutput, frames: int, refresh_rate_hz: int=35) -> None:
+        self.output = output
+        self.frames = frames
+        self.refresh_rate_hz = refresh_rate_hz
+        self.effects = None
+        
+        self.frame_count = 0
+        self.frame_ns = np.zeros(self.frames, dtype=np.int64)
+        self.alloc_bytes = np.zeros(self.frames, dtype=np.int64)
+        self._slot = np.zeros((self.output.num_leds, 3), dtype=np.uint8)
+        self._alloc_base = 0
+        self._last_ns = time.perf_counter_ns()
+        self._frames_handed = 0
+    
+    def next_frame_time(self) -> float:
+        return self._frames_handed / self.refresh_rate_hz
+    
+    def update_leds(self, led_array: list) -> None:
+        self.output.write(np.asarray(led_array, dtype=np.uint8))
+        self.output.show()
+        self._frame_done()
+    
+    @contextlib.contextmanager
+    def frame_slot(self):
+        yield self._slot
+        self.update_leds(self._slot)
+    
+    def _frame_done(self) -> None:
+        now_ns = time.perf_counter_ns()
+        self._frames_handed += 1
+        if self.frame_count < self.frames:
+            self.frame_ns[self.frame_count] = now_ns - self._last_ns
+            if tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                self.alloc_bytes[self.frame_count] = peak - self._alloc_base
+                tracemalloc.reset_peak()
+                self._alloc_base = current
+            
+            self.frame_count += 1
+            if self.frame_count == self.frames:
+                self.effects.run_effect = False
+        self._last_ns = time.perf_counter_ns()
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Builds a set of 'num_leds' coordinates. Our real tree if the count matches, otherwise our real
+             coordinates resampled (with a fixed seed) and jittered so results are repeatable.
+INPUT: num_leds - Number of coordinates to generate.
+OUTPUT: List of XYZ coords.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def make_coords(num_leds: int) -> list[list[int]]:
+    if num_leds == len(coordinates):
+        return coordinates
+    
+    rng = np.random.default_rng(0)
+    base = np.array(coordinates)[rng.integers(0, len(coordinates), num_leds)]
+    return np.rint(base + rng.normal(0.0, 5.0, base.shape)).astype(int).tolist()
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Runs 'effect_name' for 'frames' frames, then a shorter second pass with 'tracemalloc' on to measure
+             allocations since tracing slows everything down a lot.
+INPUT: effect_name - Name of the LEDEffects method to benchmark.
+       args - Args for that effect.
+       num_leds - Number of LEDs to render.
+       frames - Number of frames to time.
+       alloc_frames - Number of frames to trace allocations over.
+       workers - Render farm workers to render with, 0 renders in-process.
+OUTPUT: Dict of results for this case.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def run_case(effect_name: str, args: tuple, num_leds: int, frames: int, alloc_frames: int, workers: int=0) -> dict:
+    coords = make_coords(num_leds)
+    
+    def _run(frame_count: int) -> BenchmarkSink:
+        sink = BenchmarkSink(NullOutput(num_leds=num_leds), frame_count)
+        sink.effects = LEDEffects(coords=coords, led_controller=sink, render_workers=workers)
+        sink.effects.run_effect = True
+        getattr(sink.effects, effect_name)(*args)
+        return sink
+    
+    sink = _run(frames)
+    frame_ms = sink.frame_ns[:sink.frame_count] / 1e6
+    
+    tracemalloc.start()
+    alloc_sink = _run(alloc_frames)
+    tracemalloc.stop()
+    
+    return {'effect': effect_name
+            , 'args': list(args)
+            , 'num_leds': num_leds
+            , 'workers': workers
+            , 'frames': int(sink.frame_count)
+            , 'fps': float(1000.0 / frame_ms.mean()) if frame_ms.size else 0.0
+            , 'frame_ms_p50': float(np.percentile(frame_ms, 50)) if frame_ms.size else 0.0
+            , 'frame_ms_p95': float(np.percentile(frame_ms, 95)) if frame_ms.size else 0.0
+            , 'frame_ms_p99': float(np.percentile(frame_ms, 99)) if frame_ms.size else 0.0
+            , 'alloc_kib_per_frame': float(alloc_sink.alloc_bytes[:alloc_sink.frame_count].mean() / 1024)
+                                     if alloc_sink.frame_count else 0.0
+            , 'peak_rss_mib': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Runs every one of our 'cases' at every LED count and worker count, each in its own fresh process. That
+             process isn't a 'multiprocessing.Pool' worker since those can't start render farm workers of their own.
+INPUT: cases - Tuple of (effect name, args) to run.
+       num_leds_list - LED counts to run every case at.
+       frames - Number of frames to time per case.
+       alloc_frames - Number of frames to trace allocations over per case.
+       workers_list - Render farm worker counts to run every case at, 0 renders in-process.
+OUTPUT: List of result dicts, see 'run_case'.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def run_benchmarks(cases: tuple, num_leds_list: list[int], frames: int, alloc_frames: int
+                   , workers_list: list[int]=(0,)) -> list[dict]:
+    results = []
+    for num_leds in num_leds_list:
+        for effect_name, args in cases:
+            baseline_fps = None
+            for workers in workers_list:
+                with ProcessPoolExecutor(1) as pool:
+                    result = pool.submit(run_case, effect_name, args, num_leds, frames, alloc_frames, workers).result()
+                baseline_fps = result['fps'] if baseline_fps is None else baseline_fps
+                result['speedup'] = result['fps'] / baseline_fps if baseline_fps else 0.0
+                print(f"{result['effect']:<20} {str(result['args']):<18} {result['num_leds']:>6} LEDs "
+                      f"{result['workers']:>2} workers {result['fps']:>10.1f} fps ({result['speedup']:4.2f}x)  "
+                      f"p50 {result['frame_ms_p50']:8.3f}ms  "
+                      f"p95 {result['frame_ms_p95']:8.3f}ms  p99 {result['frame_ms_p99']:8.3f}ms  "
+                      f"{result['alloc_kib_per_frame']:9.1f} KiB/frame  {result['peak_rss_mib']:7.1f} MiB")
+                results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every effect in LEDEffects against a headless output.")
+    parser.add_argument('--frames', type=int, default=300, help="Frames to time per case.")
+    parser.add_argument('--alloc-frames', type=int, default=50, help="Frames to trace allocations over per case.")
+    parser.add_argument('--num-leds', type=int, nargs='+', default=[len(coordinates)], help="LED counts to run.")
+    parser.add_argument('--effects', nargs='+', default=None, help="Only run these effects.")
+    parser.add_argument('--workers', type=int, nargs='+', default=[0]
+                        , help="Render farm worker counts to run, 0 renders in-process.")
+    parser.add_argument('--output', default=None, help="Path to write our JSON results to.")
+    args = parser.parse_args()
+    
+    cases = tuple(case for case in BENCHMARK_CASES if args.effects is None or case[0] in args.effects)
+    results = run_benchmarks(cases, args.num_leds, args.frames, args.alloc_frames, args.workers)
+    
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump({'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+                       , 'platform': platform.platform()
+                       , 'python': platform.python_version()
+                       , 'numpy': np.__version__
+                       , 'cpu_count': os.cpu_count()
+                       , 'frames': args.frames
+                       , 'results': results}, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -0,0 +1,444 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    DDP STREAMING                            CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Lets the tree act as a network pixel endpoint. Frames come in over UDP as DDP (Distributed Display Protocol, the one
+#   xLights, WLED, etc. speak) so heavy effects can be rendered on a workstation and streamed to the Pi at full rate.
+#
+# Every DDP packet carries a byte offset into the strip's RGB data and a chunk of it. A frame is usually a few packets,
+#   the last one has the 'push' flag set which means 'show it'. Packets also carry a 4 bit sequence number (1-15).
+#
+# 'DDPReceiver' runs its own thread that only ever talks to its socket, nothing on the LED side ever waits on the
+#   network. Packets are received into one preallocated buffer and copied straight to where they belong in our canvas,
+#   nothing is allocated per packet. Packets that arrive out of order are held on to (in preallocated buffers) until
+#   the ones before them show up, or are given up on as lost. Frames missing any packet are never shown. Finished
+#   frames go into a small jitter buffer and are only handed out once they are 'STREAM_JITTER_BUFFER_MS' old, so
+#   uneven arrival doesn't turn into uneven frames on the tree.
+#
+# 'LEDEffects.stream' plays whatever we receive like any other effect. 'DDPSender' is the other end, it can stream any
+#   of our effects from another machine (or over loopback to test).
+#
+#   python src/Ddp_Stream.py receive --duration 600
+#   python src/Ddp_Stream.py send 192.168.1.50 random_plane --args "[210]" --workers 4
+#
+# Only DDP's pixel data (RGB, 8 bits per channel, to the default display) is supported. Queries, replies, and
+#   storage are ignored. sACN/ E1.31 isn't supported, 650 LEDs would need 4 universes for no gain on our own network.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import argparse
+import collections
+import contextlib
+import json
+import logging
+import numpy as np
+import socket
+import struct
+import threading
+import time
+from numbers import Real
+
+from helpers.Frame_Stats import SharedCounters, SharedHistograms
+from helpers.Settings import Settings
+
+DDP_HEADER = struct.Struct('>BBBBIH')   # Flags, sequence, data type, destination, data offset, data length.
+DDP_TIMECODE_SIZE = 4                   # Optional timecode right after the header if 'DDP_FLAG_TIMECODE' is set.
+DDP_MAX_DATA = 1440                     # 480 RGB pixels, keeps each packet inside a standard 1500 byte MTU.
+DDP_MAX_PACKET = 65507                  # Largest UDP payload, senders are free to go past 'DDP_MAX_DATA'.
+DDP_VERSION_MASK = 0xC0
+DDP_VERSION_1 = 0x40
+DDP_FLAG_TIMECODE = 0x10
+DDP_FLAG_REPLY = 0x04
+DDP_FLAG_QUERY = 0x02
+DDP_FLAG_PUSH = 0x01
+DDP_TYPE_RGB8 = 0x0B
+DDP_ID_DISPLAY = 1
+DDP_ID_ALL = 255
+DDP_SEQUENCE_COUNT = 15                 # Sequence numbers run 1-15, 0 means the sender doesn't number its packets.
+
+RECEIVE_POLL_S = 0.05                   # How often our receiver thread wakes up when nothing is coming in.
+RECEIVE_BUFFER_BYTES = 1 << 20          # Socket buffer we ask for, plenty for a few frames of bursts.
+
+STREAM_STAT_FIELDS = ('packets_received', 'packets_out_of_order', 'packets_lost', 'packets_late', 'packets_malformed'
+                      , 'frames_completed', 'frames_incomplete', 'frames_overflowed', 'frames_repeated')
+# 'arrival' is the time between finished frames, 'assemble' from a frame's first packet to its last, and 'buffer'
+#   how long it then sat in our jitter buffer.
+STREAM_TIMING_STAGES = ('arrival', 'assemble', 'buffer')
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Receives DDP frames on 'port' from its own thread, see the top of this file. Frames are pulled out with
+             'read', 'stats' and 'timings' can be read at any time.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class DDPReceiver:
+    
+    def __init__(self, num_leds: int, port: int=Settings.DDP_PORT, host: str='', logger: logging.Logger=None
+                 , jitter_buffer_ms: Real=Settings.STREAM_JITTER_BUFFER_MS, depth: int=Settings.STREAM_BUFFER_FRAMES
+                 , reorder_packets: int=Settings.STREAM_REORDER_PACKETS) -> None:
+        self.logger = logger if logger is not None else logging.getLogger()
+        self.num_leds = num_leds
+        self.jitter_buffer_ns = int(jitter_buffer_ms * 1e6)
+        # Anything further ahead than half the sequence space can't be told apart from a late packet.
+        self.reorder_packets = min(max(reorder_packets, 0), DDP_SEQUENCE_COUNT // 2)
+        self.stats = SharedCounters(STREAM_STAT_FIELDS)
+        self.timings = SharedHistograms(STREAM_TIMING_STAGES)
+        
+        # Packets are drawn into 'canvas' which always holds the latest state of every LED, like a real DDP display.
+        #   Each finished frame is copied into a free slot of 'frames' until it's read. 'read' can be holding one
+        #   slot, so we need at least one more for the frame being queued to have somewhere to go.
+        self.canvas = np.zeros(self.num_leds * 3, dtype=np.uint8)
+        self.frames = np.zeros((max(depth, 1) + 1, self.num_leds, 3), dtype=np.uint8)
+        self.last_frame = np.zeros((self.num_leds, 3), dtype=np.uint8)
+        self._free = list(range(len(self.frames)))
+        self._ready = collections.deque()   # (slot, ns the frame was finished at), oldest first.
+        self._lock = threading.Lock()
+        
+        self._packet = bytearray(DDP_MAX_PACKET)
+        self._spare = [bytearray(DDP_MAX_PACKET) for _ in range(self.reorder_packets)]
+        self._held = {}                     # Sequence number -> (packet, size, ns it arrived at).
+        self._expected = None
+        self._late_run = 0
+        self._frame_lost = False
+        self._frame_start_ns = None
+        self._last_frame_ns = None
+        
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER_BYTES)
+        self.sock.bind((host, port))
+        self.sock.settimeout(RECEIVE_POLL_S)
+        self.port = self.sock.getsockname()[1]
+        
+        self._running = True
+        self._thread = threading.Thread(target=self._receive_loop, daemon=True)
+        self._thread.start()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Fills 'out' with the oldest frame that has been through our jitter buffer. If there isn't one we
+                 repeat the last frame we handed out, black until the first frame comes in. Never blocks on the
+                 network.
+    INPUT: out - (num_leds, 3) uint8 array to fill.
+    OUTPUT: True if 'out' is a new frame.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def read(self, out: np.ndarray) -> bool:
+        now_ns = time.monotonic_ns()
+        with self._lock:
+            ready = self._ready and now_ns - self._ready[0][1] >= self.jitter_buffer_ns
+            slot, finished_ns = self._ready.popleft() if ready else (None, None)
+        
+        if slot is None:
+            out[:] = self.last_frame
+            if self.stats['frames_completed']:
+                self.stats['frames_repeated'] += 1
+            return False
+        
+        self.last_frame[:] = self.frames[slot]
+        out[:] = self.last_frame
+        self.timings.record('buffer', now_ns - finished_ns)
+        with self._lock:
+            self._free.append(slot)
+        return True
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Copy of every one of our 'stats' counters.
+    INPUT: NA
+    OUTPUT: Dict of {field: value} for each of 'STREAM_STAT_FIELDS'.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_stats(self) -> dict[str, int]:
+        return self.stats.snapshot()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Summary of every one of our latency histograms.
+    INPUT: NA
+    OUTPUT: Dict of {stage: {'count', 'p50_us', 'p95_us', 'p99_us', 'max_us'}} for each of 'STREAM_TIMING_STAGES'.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_timings(self) -> dict[str, dict[str, Real]]:
+        return self.timings.summary()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Stops our thread and closes our socket, logging what we saw while we were open.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def close(self) -> None:
+        self._running = False
+        self._thread.join()
+        self.sock.close()
+        self.logger.info(f"DDP receiver on port {self.port} closed. {self.get_stats()} {self.get_timings()}")
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Our thread. Receives every packet into the same buffer and hands it on, giving up on held packets
+                 whenever nothing comes in for a while.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _receive_loop(self) -> None:
+        packet = memoryview(self._packet)
+        while self._running:
+            try:
+                size = self.sock.recv_into(self._packet)
+            except socket.timeout:
+                self._expire_held(time.monotonic_ns())
+                continue
+            self._handle_packet(packet, size, time.monotonic_ns())
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Checks a packet is pixel data for us and puts it in order by its sequence number. In order packets
+                 are drawn right away, ones ahead of what we expect are held, and ones behind it (duplicates, or
+                 packets we already gave up on) are thrown away. If everything is suddenly behind the sender has
+                 most likely restarted, so we start over from whatever it's sending now.
+    INPUT: packet - View of the receive buffer.
+           size - Size of the packet in bytes.
+           now_ns - When the packet arrived.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _handle_packet(self, packet: memoryview, size: int, now_ns: int) -> None:
+        self.stats['packets_received'] += 1
+        if size < DDP_HEADER.size or packet[0] & DDP_VERSION_MASK != DDP_VERSION_1:
+            self.stats['packets_malformed'] += 1
+            return
+        flags, sequence, _, destination, _, length = DDP_HEADER.unpack_from(packet)
+        if flags & (DDP_FLAG_QUERY | DDP_FLAG_REPLY) or destination not in (DDP_ID_DISPLAY, DDP_ID_ALL):
+            return
+        if _data_start(flags) + length > size:
+            self.stats['packets_malformed'] += 1
+            return
+        
+        sequence &= 0x0F
+        if sequence == 0:
+            self._draw(packet, now_ns)
+            return
+        if self._expected is None:
+            self._expected = sequence
+        
+        ahead = (sequence - self._expected) % DDP_SEQUENCE_COUNT
+        if ahead == 0:
+            self._late_run = 0
+            self._draw(packet, now_ns)
+            self._expected = _next_sequence(self._expected)
+            self._drain_held()
+        elif ahead <= DDP_SEQUENCE_COUNT // 2 and sequence not in self._held:
+            self._late_run = 0
+            self.stats['packets_out_of_order'] += 1
+            if len(self._held) == self.reorder_packets:
+                self._skip_missing()
+            if self._spare:
+                held = self._spare.pop()
+                held[:size] = packet[:size]
+                self._held[sequence] = (held, size, now_ns)
+            else:   # We can't hold anything, so everything before it is lost.
+                self.stats['packets_lost'] += ahead
+                self._frame_lost = True
+                self._draw(packet, now_ns)
+                self._expected = _next_sequence(sequence)
+            self._drain_held()
+        else:
+            self.stats['packets_late'] += 1
+            self._late_run += 1
+            if self._late_run > DDP_SEQUENCE_COUNT:
+                self._expected = None
+                self._skip_missing()
+        
+        if self._held:
+            self._expire_held(now_ns)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Draws held packets for as long as the next one we expect is among them.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _drain_held(self) -> None:
+        while self._expected in self._held:
+            held, size, arrived_ns = self._held.pop(self._expected)
+            self._draw(memoryview(held)[:size], arrived_ns)
+            self._spare.append(held)
+            self._expected = _next_sequence(self._expected)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Gives up on whatever packets we are still waiting for up to the first one we are holding, and
+                 draws from there. The frame being drawn can't be shown anymore.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _skip_missing(self) -> None:
+        if not self._held:
+            return
+        if self._expected is None:
+            self._expected = min(self._held)
+        while self._expected not in self._held:
+            self.stats['packets_lost'] += 1
+            self._frame_lost = True
+            self._expected = _next_sequence(self._expected)
+        self._drain_held()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Gives up on missing packets once the oldest packet held waiting on them is older than our jitter
+                 buffer, waiting any longer would make that frame late anyway.
+    INPUT: now_ns - Current time.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _expire_held(self, now_ns: int) -> None:
+        if self._held and now_ns - min(arrived_ns for _, _, arrived_ns in self._held.values()) > self.jitter_buffer_ns:
+            self._skip_missing()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Copies a packet's data into our canvas, anything past our last LED is ignored. A 'push' finishes
+                 the frame, if nothing went missing it is copied into a free slot and queued up to be read. If
+                 every slot is taken we throw away the oldest frame still waiting.
+    INPUT: packet - View of the packet.
+           arrived_ns - When the packet arrived.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _draw(self, packet: memoryview, arrived_ns: int) -> None:
+        flags, _, _, _, offset, length = DDP_HEADER.unpack_from(packet)
+        start = _data_start(flags)
+        if self._frame_start_ns is None:
+            self._frame_start_ns = arrived_ns
+        
+        end = min(offset + length, len(self.canvas))
+        if offset < end:
+            self.canvas[offset:end] = packet[start:start + end - offset]
+        if not flags & DDP_FLAG_PUSH:
+            return
+        
+        if self._frame_lost:
+            self.stats['frames_incomplete'] += 1
+        else:
+            with self._lock:
+                if self._free:
+                    slot = self._free.pop()
+                else:
+                    slot, _ = self._ready.popleft()
+                    self.stats['frames_overflowed'] += 1
+            self.frames[slot].reshape(-1)[:] = self.canvas
+            with self._lock:
+                self._ready.append((slot, arrived_ns))
+            
+            self.stats['frames_completed'] += 1
+            self.timings.record('assemble', arrived_ns - self._frame_start_ns)
+            if self._last_frame_ns is not None:
+                self.timings.record('arrival', arrived_ns - self._last_frame_ns)
+            self._last_frame_ns = arrived_ns
+        self._frame_lost = False
+        self._frame_start_ns = None
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Streams frames to a DDP display at 'host', ie. one of our 'DDPReceiver's. Every frame is split into
+             'DDP_MAX_DATA' sized packets that are sent straight out of the frame, only the header is our own.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class DDPSender:
+    
+    def __init__(self, host: str, port: int=Settings.DDP_PORT, destination: int=DDP_ID_DISPLAY) -> None:
+        self.address = (host, port)
+        self.destination = destination
+        self.sequence = 0
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._header = bytearray(DDP_HEADER.size)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Sends one whole frame, the last packet of it pushes it to the display.
+    INPUT: frame - (N, 3) uint8 RGB frame.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def send(self, frame: np.ndarray) -> None:
+        data = memoryview(np.ascontiguousarray(frame, dtype=np.uint8)).cast('B')
+        for offset in range(0, len(data), DDP_MAX_DATA):
+            chunk = data[offset:offset + DDP_MAX_DATA]
+            self.sequence = _next_sequence(self.sequence)
+            flags = DDP_VERSION_1 | (DDP_FLAG_PUSH if offset + len(chunk) == len(data) else 0)
+            DDP_HEADER.pack_into(self._header, 0, flags, self.sequence, DDP_TYPE_RGB8, self.destination, offset
+                                 , len(chunk))
+            self.sock.sendmsg([self._header, chunk], [], 0, self.address)
+    
+    def close(self) -> None:
+        self.sock.close()
+
+
+def _data_start(flags: int) -> int:
+    return DDP_HEADER.size + (DDP_TIMECODE_SIZE if flags & DDP_FLAG_TIMECODE else 0)
+
+
+def _next_sequence(sequence: int) -> int:
+    return sequence % DDP_SEQUENCE_COUNT + 1
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Stands in for LEDController while streaming an effect out. Every frame is sent to 'sender' as soon as
+             it's rendered and we then wait for its turn, so frames go out 1 / fps apart in real time.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class StreamSink:
+    
+    def __init__(self, sender: DDPSender, fps: Real, duration: Real) -> None:
+        self.sender = sender
+        self.refresh_rate_hz = fps
+        self.frames = round(duration * fps)
+        self.effects = None
+        self._slot = None
+        self._frames_handed = 0
+        self._start = None
+    
+    def next_frame_time(self) -> float:
+        return self._frames_handed / self.refresh_rate_hz
+    
+    @contextlib.contextmanager
+    def frame_slot(self):
+        if self._slot is None:
+            self._slot = np.zeros((self.effects.num_leds, 3), dtype=np.uint8)
+        yield self._slot
+        if self._start is None:
+            self._start = time.monotonic()
+        self.sender.send(self._slot)
+        self._frames_handed += 1
+        if self._frames_handed >= self.frames:
+            self.effects.run_effect = False
+        time.sleep(max(self._start + self.next_frame_time() - time.monotonic(), 0.0))
+
+
+def main():
+    # Imported here since 'Effects' imports us for 'LEDEffects.stream'.
+    from Effects import LEDEffects
+    
+    parser = argparse.ArgumentParser(description="Stream frames to and from the tree over DDP.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    receive_parser = commands.add_parser('receive', help="Show whatever is streamed to us on the tree.")
+    receive_parser.add_argument('--port', type=int, default=Settings.DDP_PORT, help="UDP port to listen on.")
+    receive_parser.add_argument('--duration', type=float, default=600, help="Seconds to listen for.")
+    receive_parser.add_argument('--output', default=None, help="LED output to show on, see 'Led_Outputs.py'.")
+    
+    send_parser = commands.add_parser('send', help="Render an effect here and stream it to a tree.")
+    send_parser.add_argument('host', help="Host to stream to.")
+    send_parser.add_argument('effect', help="Name of the LEDEffects method to stream.")
+    send_parser.add_argument('--args', default='[]', help="JSON list of args for the effect.")
+    send_parser.add_argument('--port', type=int, default=Settings.DDP_PORT, help="UDP port to stream to.")
+    send_parser.add_argument('--fps', type=float, default=35, help="Frames per second to stream at.")
+    send_parser.add_argument('--duration', type=float, default=60, help="Seconds to stream for.")
+    send_parser.add_argument('--workers', type=int, default=Settings.RENDER_FARM_WORKERS
+                             , help="Render farm workers to render with, 0 renders in-process.")
+    args = parser.parse_args()
+    
+    if args.command == 'receive':
+        led_effects = LEDEffects(output=args.output)
+        try:
+            led_effects.run_effect_for_x_seconds(led_effects.stream, duration=args.duration, args=(args.port,))
+        finally:
+            led_effects.close()
+    else:
+        sender = DDPSender(args.host, args.port)
+        sink = StreamSink(sender, args.fps, args.duration)
+        sink.effects = LEDEffects(led_controller=sink, render_workers=args.workers)
+        try:
+            sink.effects.run_effect = True
+            getattr(sink.effects, args.effect)(*json.loads(args.args))
+        finally:
+            sender.close()
+
+
+if __name__ == "__main__":
+    main()
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -12,22 +12,54 @@
 #
 # Important note that the runner of our effects should never have to worry about LEDController, so any management of
 #   that should be handled within this class as well.
+#
+# Effects are renderers (see 'Renderers.py') that draw one frame whenever they're asked to. Our engine
+#   ('run_renderer') owns everything else, it pulls frames out of the renderer into the controller, keeps time, and
+#   tells the renderer to stop once 'run_effect' is cleared. Each effect method just builds its renderer
+#   ('make_renderer') and hands it to the engine.
+#
+# Effects are stopped at frame granularity. Frames go through our own 'frame_slot', which cuts the effect off once it's
+#   past its stop deadline. Effects that want to wrap up gracefully (ie. fade out) declare how long they need with
+#   'exit_budget'.
+#
+# Heavy effects can be rendered across several processes instead of in the effect thread, see 'render_workers' and
+#   'Render_Farm.py'.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import contextlib
+import json
 import logging
 import math
-import random
+import numpy as np
+import signal
 import sys
 import threading
 import time
+import weakref
 from numbers import Real
 
 import helpers.Color_Helpers as CH
 import helpers.Math_Helpers as MH
 
+from helpers.Cycle_Cache import CycleCache, LazyCycle
 from helpers.decorators import *
+from helpers.Frame_File import FrameFileReader
+from helpers.Profiling import run_profiled
 from helpers.Settings import Settings
-from Coords import coordinates
-from Led_Controller import LEDController        
+from Ddp_Stream import DDPReceiver
+from Geometry import Geometry, tree_geometry
+from Led_Controller import LEDController
+from Led_Outputs import LEDOutput
+from Render_Farm import RenderFarm, split_for
+from Renderers import CycleRenderer, FrameFileRenderer, RandomPlaneRenderer, Renderer, StreamRenderer
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Raised out of 'LEDEffects.frame_slot' into an effect that is past its stop deadline. It's a
+             'BaseException' so it unwinds straight through the effect (and our logging decorators) like a
+             'KeyboardInterrupt' would, 'run_effect_for_x_seconds' is the only one that catches it.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class EffectStopped(BaseException):
+    pass
 
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
@@ -35,35 +67,197 @@ DESCRIPTION: Collection of LED effects and the handler of our LEDController.
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 class LEDEffects(LogAllMethods):
     
-    def __init__(self, logger: logging.Logger=None) -> None:
+    def __init__(self, logger: logging.Logger=None, output: LEDOutput | str=None, coords: list[list[Real]]=None
+                 , led_controller: LEDController=None, render_workers: int=Settings.RENDER_FARM_WORKERS) -> None:
         self.logger = logger if logger is not None else logging.getLogger()
         
-        self.pixel_data = [(0, 0, 0)] * Settings.NUM_LEDS
-        self.min_and_max = (self.find_min_max(coordinates, 0)
-                            , self.find_min_max(coordinates, 1)
-                            , self.find_min_max(coordinates, 2))
+        self.geometry = Geometry(coords) if coords is not None else tree_geometry
+        self.num_leds = self.geometry.num_leds
+        self.pixel_data = np.zeros((self.num_leds, 3), dtype=np.uint8)
+        self.rotation_cache = MH.RotationCache()
+        self.cycle_cache = CycleCache(logger=self.logger)
         
-        self.led_controller = LEDController(refresh_rate_hz=35, logger=self.logger)
+        self.led_controller = led_controller if led_controller is not None else \
+            LEDController(refresh_rate_hz=35, logger=self.logger, output=output, num_leds=self.num_leds)
+        self._owns_controller = led_controller is None
         
+        self.render_workers = render_workers
         self.run_effect = True
+        self.effect_timings = {}
+        self._stop_deadline = None
+        self._abandoned_threads = weakref.WeakSet()
     
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    DESCRIPTION: Spins up a new thread to run a given effect for 'duration' seconds. NOTE: It will hold the thread 
-                 even when the time is done so it's on the function to check for the run_effect and exit gracefully.
+    DESCRIPTION: Spins up a new thread to run a given effect for 'duration' seconds. Once the time is up we clear
+                 'run_effect' and, by default, flush whatever frames the effect still had queued so the switch shows
+                 up right away. The effect then has its 'exit_budget' (if any) to wrap up, after that it is cut off
+                 at the next frame it hands us. If it still hasn't returned 'EFFECT_STOP_TIMEOUT_S' later we give up
+                 on the thread and move on, it will never get another frame on the strip.
+                 Our controller's timing histograms are reset when the effect starts and saved into 'effect_timings'
+                 once it ends.
     INPUT: effect_func - Function ref that we will be using for our effect.
            duration - Number of seconds we will run this effect.
            args - Tuple of optional args that we can pass to our 'effect_func'
+           profile - Optionally run the effect under a profiler, one of 'PROFILE_MODES' (see 'Profiling.py').
+           crossfade - Seconds to crossfade from whatever was showing into this effect, 0 cuts straight to it.
+           flush - Throw away this effect's queued frames as soon as it's told to stop.
     OUTPUT: NA
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    def run_effect_for_x_seconds(self, effect_func, duration: int=10, args: tuple=()) -> None:
+    def run_effect_for_x_seconds(self, effect_func, duration: int=10, args: tuple=(), profile: str=None
+                                 , crossfade: Real=0.0, flush: bool=Settings.FLUSH_ON_SWITCH) -> None:
         self.run_effect = True
+        self._stop_deadline = None
+        effect_name = f"{effect_func.__name__}{args}"
+        self.led_controller.reset_timings()
+        if crossfade > 0:
+            self.led_controller.crossfade(crossfade)
 
-        thread = threading.Thread(target=effect_func, args=args, daemon=True)
+        target, target_args = effect_func, args
+        if profile is not None:
+            target, target_args = run_profiled, (effect_func, args, profile, effect_func.__name__)
+        
+        thread = threading.Thread(target=self._run_until_stopped, args=(target, target_args), daemon=True)
         thread.start()
         time.sleep(duration)
 
+        budget = getattr(effect_func, '_exit_budget_s', Settings.EFFECT_EXIT_BUDGET_S)
+        self._stop_deadline = time.monotonic() + budget
         self.run_effect = False
-        thread.join()
+        if flush:
+            self.led_controller.flush_frames()
+        thread.join(budget + Settings.EFFECT_STOP_TIMEOUT_S)
+        if thread.is_alive():
+            self.logger.warning(f"{effect_name} didn't stop within {budget + Settings.EFFECT_STOP_TIMEOUT_S}s of "
+                                f"being told to, giving up on it.")
+            self._abandoned_threads.add(thread)
+        self._stop_deadline = None
+        
+        self.effect_timings[effect_name] = self.led_controller.get_timings()
+        if Settings.TIMING_DUMP_EACH_EFFECT:
+            self.dump_timings()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Thread target of 'run_effect_for_x_seconds', an effect being cut off is a normal way for it to end.
+    INPUT: target - Function to run.
+           args - Args to run it with.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _run_until_stopped(self, target, args: tuple) -> None:
+        try:
+            target(*args)
+        except EffectStopped:
+            self.logger.debug(f"{getattr(target, '__name__', target)} was cut off at its stop deadline.")
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Hands out the controller's next frame slot to draw into, the same as 'LEDController.frame_slot'.
+                 Every effect should draw through this one instead so we can cut it off once it's past its stop
+                 deadline, or if we've already given up on it.
+                 ie. with self.frame_slot() as frame: frame[:] = ...
+    INPUT: NA
+    OUTPUT: (NUM_LEDS, 3) uint8 view of the slot.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @no_log
+    @contextlib.contextmanager
+    def frame_slot(self):
+        if self._stop_deadline is not None and time.monotonic() >= self._stop_deadline \
+                or self._abandoned_threads and threading.current_thread() in self._abandoned_threads:
+            raise EffectStopped()
+        with self.led_controller.frame_slot() as frame:
+            yield frame
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Writes the timing histograms of every effect we've run, plus whatever is running right now, to a
+                 JSON file.
+    INPUT: path - File to write to.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def dump_timings(self, path: str=Settings.TIMING_DUMP_PATH) -> None:
+        with open(path, 'w') as file:
+            json.dump({'effects': self.effect_timings
+                       , 'current': self.led_controller.get_timings()
+                       , 'writer': self.led_controller.get_stats()}, file, indent=2)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Dumps our timings (see 'dump_timings') whenever this process gets 'signum'.
+                 ie. kill -USR1 <pid>
+    INPUT: signum - Signal to dump on.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def install_timing_dump_signal(self, signum: int=signal.SIGUSR1) -> None:
+        signal.signal(signum, lambda _signum, _frame: self.dump_timings())
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Does all of the setup an effect needs ahead of time so it can start instantly, ie. while another
+                 effect is still running. Periodic effects get their whole cycle rendered into our 'cycle_cache' and
+                 everything else gets the geometry views it uses built. Safe to call from a background thread.
+    INPUT: effect_name - Name of the effect we'll be running.
+           args - Args we'll be running it with.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def prepare(self, effect_name: str, args: tuple=()) -> None:
+        cycle_func = getattr(self, f"_{effect_name}_cycle", None)
+        if cycle_func is not None:
+            cycle_func(*args)
+        elif effect_name == 'random_plane':
+            self.geometry.spatial_index
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Builds the renderer (see 'Renderers.py') behind one of our effects, without running it. Periodic
+                 effects play their cached cycle, everything else has its own '_<effect>_renderer'. With
+                 'render_workers' set the effect is farmed out to that many processes instead (see 'RenderFarm'),
+                 as long as its renderer can be split up at all. 'cheap' renderers, ie. cached cycles, are always
+                 drawn in-process since every worker would only rebuild them to copy frames back to us.
+    INPUT: effect_name - Name of the effect.
+           args - Args for the effect.
+    OUTPUT: Renderer of the effect.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def make_renderer(self, effect_name: str, args: tuple=()) -> Renderer:
+        cycle_func = getattr(self, f"_{effect_name}_cycle", None)
+        if cycle_func is not None:
+            renderer = CycleRenderer(*cycle_func(*args))
+        else:
+            renderer = getattr(self, f"_{effect_name}_renderer")(*args)
+        
+        if self.render_workers <= 0 or renderer.cheap:
+            return renderer
+        split = split_for(renderer)
+        if split is None:
+            self.logger.warning(f"{effect_name} can't be split across processes, rendering it in-process.")
+            return renderer
+        renderer.close()
+        return RenderFarm(self, effect_name, args, split, self.render_workers)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Our effect engine. Draws 'renderer' into the controller one frame at a time until it's done, asking
+                 it to 'stop' as soon as 'run_effect' is cleared, and closes it once we are done with it. Each frame
+                 is rendered for the time it will actually be shown at (see 'LEDController.next_frame_time'),
+                 relative to our first frame. Frames are never less than one refresh interval apart, that estimate
+                 can come up a frame short if we ask right while the writer is handing a frame off, but anything
+                 beyond that (dropped frames, a slow render) is followed exactly.
+    INPUT: renderer - Renderer to run.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def run_renderer(self, renderer: Renderer) -> None:
+        interval = 1.0 / self.led_controller.refresh_rate_hz
+        start, t, dt, stopping = None, 0.0, 0.0, False
+        try:
+            while not renderer.done:
+                if not self.run_effect and not stopping:
+                    stopping = True
+                    renderer.stop()
+                    continue
+                with self.frame_slot() as frame:
+                    shown_at = self.led_controller.next_frame_time()
+                    if start is None:
+                        start = shown_at
+                    else:
+                        dt = max(shown_at - start - t, interval)
+                        t += dt
+                    renderer.render(t, dt, frame)
+        finally:
+            if not renderer.done:
+                renderer.stop()
+            renderer.close()
     
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: We often need the range of values we are working with given a certain axis. This function just finds
@@ -81,123 +275,174 @@ class LEDEffects(LogAllMethods):
     OUTPUT: NA
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     def turn_off(self) -> None:
-        self.pixel_data = [(0, 0, 0)] * Settings.NUM_LEDS
+        self.pixel_data = np.zeros((self.num_leds, 3), dtype=np.uint8)
         self.led_controller.update_leds(self.pixel_data)
     
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    DESCRIPTION: Generic rainbow generator that takes a given 'hue_step' and uses the 'distance_values' to know how
-                 'far' the current hue is from our base hue. We then can calculate what hue each pixel should be since
-                 we know the 'step' it takes for each given unit and how many units it is away from 'distance_values'.
-    INPUT: hue_step - How much each given 'unit' of distance correlates to a change in hue. For example we wanted to 
-                      itterate over 100 evenly spaced LEDs and have 1 full spectrum. The 'hue_step' would be 100/360.
-           distance_values - The 'unit' distance each pixel is away from our reference point we animate from.
+    DESCRIPTION: Turns the LEDs off and shuts down our controller (see 'LEDController.close'), as long as it's one we
+                 made ourselves. Anyone running us from the command line should call this on their way out.
+    INPUT: NA
     OUTPUT: NA
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    def _rainbow(self, hue_step: int, distance_values: list[Real]) -> None:
-        for hue in range(0, int(math.copysign(360, hue_step)), hue_step):
-            for pixel in range(Settings.NUM_LEDS):
-                val = (hue + distance_values[pixel]) % 360
-                self.pixel_data[pixel] = CH.gamma_correct(hsv=(val / 360.0, 1.0, 1.0))
-            self.led_controller.update_leds(self.pixel_data)
+    def close(self) -> None:
+        if not self._owns_controller:
+            return
+        self.turn_off()
+        self.led_controller.close()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Splits one full trip around the color wheel at 'speed' degrees per second into frames. We use one
+                 frame per frame of our refresh rate, so the cycle is exactly as smooth as what we can show, but never
+                 more than 'max_frames'. Past one frame per step of the palette the cycle is drawn from, frames would
+                 barely differ, slow fades just show each frame for a few refreshes instead.
+    INPUT: speed - Degrees of hue per second, negative runs the other way.
+           max_frames - Most frames the cycle can have, normally the size of the palette it's drawn from.
+    OUTPUT: Tuple of (hue offset in degrees of every frame, seconds the cycle takes).
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _hue_cycle(self, speed: Real, max_frames: int=Settings.HUE_PALETTE_FINE_SIZE) -> tuple[np.ndarray, Real]:
+        if speed == 0:
+            return np.zeros(1), math.inf
+        period = 360 / abs(speed)
+        frames = min(max(1, round(period * self.led_controller.refresh_rate_hz)), max_frames)
+        return np.arange(frames) * math.copysign(360 / frames, speed), period
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Generic rainbow generator that takes the hue offset of every frame and uses the 'distance_values' to
+                 know how 'far' each pixel's hue is from that base hue. All of the frames are rendered at once with a
+                 single lookup into our precomputed 'fine' hue palette.
+    INPUT: hue_offsets - Base hue in degrees of every frame we render, see '_hue_cycle'.
+           distance_values - The distance in degrees of hue each pixel is away from our reference point we animate
+                             from. For example 100 evenly spaced LEDs showing 1 full spectrum would be 0, 3.6, 7.2...
+    OUTPUT: (frames, N, 3) uint8 array of our rainbow at each of 'hue_offsets'.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _rainbow_cycle(self, hue_offsets: np.ndarray, distance_values: np.ndarray) -> np.ndarray:
+        hue_offsets = hue_offsets.astype(distance_values.dtype)
+        hues = (distance_values[np.newaxis, :] + hue_offsets[:, np.newaxis]) / 360.0
+        return CH.hue_palette_lookup(hues, CH.hue_palette_fine)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs one full cycle of a periodic effect from our 'cycle_cache', rendering it if we haven't yet.
+                 Cycles are split up by our refresh rate so that is part of the key as well. A cycle too big for the
+                 cache comes back as a 'LazyCycle' that renders each frame as it's shown instead.
+    INPUT: effect_name - Name of the effect, along with 'args' this is what the cycle is cached under.
+           args - Args of the effect.
+           num_frames - Number of frames in the cycle.
+           render_frames - Function that renders the frames at an array of frame indices as a (len, N, 3) uint8 array.
+    OUTPUT: (frames, N, 3) uint8 array of one full cycle, or a 'LazyCycle' of it.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _cached_cycle(self, effect_name: str, args: tuple, num_frames: int, render_frames) -> np.ndarray | LazyCycle:
+        key = (effect_name, args, self.geometry.fingerprint, self.led_controller.refresh_rate_hz, Settings.GAMMA_RED
+               , Settings.GAMMA_GREEN, Settings.GAMMA_BLUE, Settings.HUE_PALETTE_FINE_SIZE)
+        return self.cycle_cache.get_or_render_frames(key, num_frames, (self.num_leds, 3), render_frames)
     
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Runs a "rainbow" effect on the cartesian coords. The given 'axis' will define the "direction" change.
     INPUT: axis - X, Y, or Z (0, 1, 2), which axis we will be changing the color against.
-           step - Basically how 'fast' the effect moves. Needs trial and error.
+           speed - Full spectrums per second the colors move at, negative runs the other way.
            width - How "much" of the full color spectrum you see at one time. 
     OUTPUT: NA
-    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""      
-    def axis_rainbow(self, axis:int, step:Real, width:Real) -> None:
-        height = self.min_and_max[axis][1] - self.min_and_max[axis][0]
-        hue_step = int(360 * step)
-        dis_vals = [360*width*((coordinates[pixel][axis] + self.min_and_max[axis][0]) / height) 
-                    for pixel in range(Settings.NUM_LEDS)]
-        
-        while self.run_effect:
-            self._rainbow(hue_step, dis_vals)
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def axis_rainbow(self, axis:int, speed:Real, width:Real) -> None:
+        self.run_renderer(self.make_renderer('axis_rainbow', (axis, speed, width)))
+    
+    def _axis_rainbow_cycle(self, axis: int, speed: Real, width: Real) -> tuple[np.ndarray | LazyCycle, Real]:
+        hue_offsets, period = self._hue_cycle(360 * speed)
+        dis_vals = 360 * width * self.geometry.normalized[:, axis]
+        return self._cached_cycle('axis_rainbow', (axis, speed, width), len(hue_offsets)
+                                  , lambda frames: self._rainbow_cycle(hue_offsets[frames], dis_vals)), period
 
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Runs a "rainbow" effect on 2D polar coords. The specified 'axis' being the one we "ignore". It then
                  simply runs on the theta portion of our polar coord with no regard to radius.
     INPUT: axis - X, Y, or Z (0, 1, 2), which axis we will be disregarding to compute our polar coords.
-           step - Basically how 'fast' the effect moves. Needs trial and error.
+           speed - Degrees of hue per second the colors move at, negative runs the other way.
            width - How "much" of the full color spectrum you see at one time. 
     OUTPUT: NA
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    def radial_rainbow(self, axis:int, step:int, width:Real) -> None:
-        coords = MH.to_2D_polar_coords(coordinates, axis)
-        dis_vals = [width*(coords[pixel][1]) for pixel in range(Settings.NUM_LEDS)]
-        
-        while self.run_effect:
-           self._rainbow(step, dis_vals)
+    def radial_rainbow(self, axis:int, speed:Real, width:Real) -> None:
+        self.run_renderer(self.make_renderer('radial_rainbow', (axis, speed, width)))
+    
+    def _radial_rainbow_cycle(self, axis: int, speed: Real, width: Real) -> tuple[np.ndarray | LazyCycle, Real]:
+        hue_offsets, period = self._hue_cycle(speed)
+        dis_vals = width * self.geometry.polar(axis)[:, 1]
+        return self._cached_cycle('radial_rainbow', (axis, speed, width), len(hue_offsets)
+                                  , lambda frames: self._rainbow_cycle(hue_offsets[frames], dis_vals)), period
     
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Sweeps a plane across the tree of a random color and random orientation. Also fades the plane as it 
-                 passes through.
-    INPUT: step - How "fast" the plane travels across the tree. Needs trial and error.
+                 passes through. Once stopped it fades out whatever is still lit, within its 'exit_budget'.
+    INPUT: speed - Units (same as our coords) per second the plane travels across the tree at.
     OUTPUT: NA
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    def random_plane(self, step: int) -> None:
-        # Values are normalized between 0.0 and 1.0
-        hsv_values = [[0.0, 0.0, 0.0]] * Settings.NUM_LEDS
-        cur_hue = random.uniform(0.0, 1.0)
-        coords = coordinates
-        
-        """Helper function to fade, gamma correct, and limit brightness of our LEDs."""
-        def _fade_helper():
-            for pixel, hsv in enumerate(hsv_values):
-                if hsv[2] > 0.001:
-                    hsv[2] /= random.uniform(1.0, 1.3)  # Apply fade
-                    self.pixel_data[pixel] = CH.gamma_correct(hsv=hsv)
-                else: # Reset if too dim
-                    hsv_values[pixel] = [0.0, 0.0, 0.0]  
-                    self.pixel_data[pixel] = (0, 0, 0)
+    @exit_budget(1.5)
+    def random_plane(self, speed: Real) -> None:
+        self.run_renderer(self.make_renderer('random_plane', (speed,)))
+    
+    def _random_plane_renderer(self, speed: Real) -> RandomPlaneRenderer:
+        return RandomPlaneRenderer(self.geometry, self.rotation_cache, speed)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Changes the entire LED strip to one single color and runs that color through the spectrum.
+    INPUT: speed - Degrees of hue per second the color changes at.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def solid_color_rainbow(self, speed: Real) -> None:
+        self.run_renderer(self.make_renderer('solid_color_rainbow', (speed,)))
+    
+    def _solid_color_rainbow_cycle(self, speed: Real) -> tuple[np.ndarray | LazyCycle, Real]:
+        hue_offsets, period = self._hue_cycle(speed, max_frames=Settings.HUE_PALETTE_SIZE)
+        def _render(frames):
+            colors = CH.hue_palette[(np.mod(hue_offsets[frames], 360) * Settings.HUE_PALETTE_SIZE // 360).astype(int)]
+            return np.repeat(colors[:, np.newaxis, :], self.num_leds, axis=1)
+        return self._cached_cycle('solid_color_rainbow', (speed,), len(hue_offsets), _render), period
 
-            self.led_controller.update_leds(self.pixel_data)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Plays back a frame file (see 'Frame_File.py' and 'Animation.py'). Frames are memory mapped and copied
+                 straight into our controller, nothing is decoded so it costs the same however heavy the effect that
+                 made it was. We play [start, stop) once, then keep repeating the file's loop section (clipped to
+                 [start, stop)) until the effect is stopped. Frames are picked by time so the file always plays at
+                 its own speed, whatever our refresh rate is.
+    INPUT: path - Path to our frame file.
+           start - Frame to start from, see 'FrameFileReader.frame_at' to seek by time.
+           stop - One past the last frame we'll play, 'None' plays to the end of the file.
+           loop - Whether to keep looping after our first pass.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def play_animation(self, path: str, start: int=0, stop: int=None, loop: bool=True) -> None:
+        self.run_renderer(self.make_renderer('play_animation', (path, start, stop, loop)))
+    
+    def _play_animation_renderer(self, path: str, start: int=0, stop: int=None, loop: bool=True) -> FrameFileRenderer:
+        reader = FrameFileReader(path)
+        if reader.num_leds != self.num_leds:
+            raise ValueError(f"'{path}' has {reader.num_leds} LEDs per frame, we have {self.num_leds}.")
+        if reader.fps != self.led_controller.refresh_rate_hz:
+            self.logger.info(f"'{path}' was made at {reader.fps} fps but we are running at "
+                             f"{self.led_controller.refresh_rate_hz} fps, frames will be repeated or skipped.")
         
-        while self.run_effect:
-            # Rotate coordinates randomly around three axes
-            random_angles = [random.uniform(0, 360) for _ in range(3)]
-            coords = [MH.rotate_point(coord, random_angles) for coord in coords]
-
-            # Grab min and max along the given axis
-            min_val, max_val = self.find_min_max(coords, 0)
-
-            for height in range(int(min_val), int(max_val), step):
-                for pixel in range(Settings.NUM_LEDS):
-                    # Apply hue or fade effect based on pixel height range
-                    if height <= coords[pixel][0] < height + 50:
-                        hsv_values[pixel] = list(CH.blend_hsv(
-                            hsv_values[pixel], [cur_hue, 1.0, 1.0],
-                            sat_val=1.0, val_val=1.0
-                        )) if hsv_values[pixel][2] >= 0.01 else [cur_hue, 1.0, 1.0]
-                        
-                # Update the pixels and fade values
-                _fade_helper()
-            
-            # Randomize the hue for the next iteration
-            cur_hue = CH.random_hue_away_from(cur_hue)
-
-        # Gracefully fade out remaining pixels
-        while any(fade[2] > 0.01 for fade in hsv_values):
-            _fade_helper()
+        stop = reader.frame_count if stop is None else min(stop, reader.frame_count)
+        loop_start, loop_end = max(reader.loop_start, start), min(reader.loop_end, stop)
+        if loop_start >= loop_end:
+            loop_start, loop_end = start, stop
+        return FrameFileRenderer(reader, start, stop, loop_start, loop_end, loop)
     
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    DESCRIPTION: Changes the entire LED strip to one single color and runs that color through the spectrum.
-    INPUT: step - How "fast" the animation changes.
+    DESCRIPTION: Shows frames streamed to us over the network as DDP (see 'Ddp_Stream.py'), ie. an effect rendered on
+                 another machine. Runs until stopped. For the lowest latency run it with the 'mailbox' backpressure
+                 policy so received frames never queue up behind each other.
+    INPUT: port - UDP port to listen on.
     OUTPUT: NA
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    def solid_color_rainbow(self, step: int) -> None:
-        while self.run_effect:
-            for hue in range(0, 360, step):
-                self.pixel_data = [CH.gamma_correct(hsv=((hue / 360.0), 1.0, 1.0))] * Settings.NUM_LEDS
-                self.led_controller.update_leds(self.pixel_data)
+    def stream(self, port: int=Settings.DDP_PORT) -> None:
+        self.run_renderer(self.make_renderer('stream', (port,)))
+    
+    def _stream_renderer(self, port: int=Settings.DDP_PORT) -> StreamRenderer:
+        return StreamRenderer(DDPReceiver(self.num_leds, port, logger=self.logger))
 
 
 if __name__ == "__main__":
     led_effects = LEDEffects()
-    led_effects.turn_off()
-    time.sleep(0.2)
+    led_effects.close()
 
 
 # FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -0,0 +1,132 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    TREE GEOMETRY                            CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Array backed model of where every LED on the tree is. Our raw 'coordinates' are just a list of Python lists and
+#   every effect used to rebuild whatever it needed from them (bounds, polar coords, etc.) on every single call. 
+#   'Geometry' holds them once as an (N, 3) float32 array and computes every derived view lazily the first time it is
+#   asked for, after that it's just handed back. All of the views are read only since every effect shares them.
+#
+# 'tree_geometry' is the shared instance for our real tree, effects should use that unless they were handed some
+#   other set of coordinates.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import functools
+import hashlib
+import numpy as np
+from numbers import Real
+
+from Coords import coordinates
+from Spatial_Index import SpatialIndex
+
+# Map of each axis to the two axes that are left when we "ignore" it.
+OTHER_AXES = {0: (1, 2), 1: (0, 2), 2: (0, 1)}
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Read only array view of 'array'.
+INPUT: array - Numpy array we want to share.
+OUTPUT: Read only view of 'array'.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def _read_only(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: LED coordinates and all of the cached views we derive from them.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class Geometry:
+    
+    def __init__(self, coords: list[list[Real]]) -> None:
+        self.points = _read_only(np.array(coords, dtype=np.float32).reshape(-1, 3))
+        self.num_leds = len(self.points)
+        self._polar = {}
+        self._cylindrical = {}
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: (2, 3) array of the min (row 0) and max (row 1) value along each axis.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @functools.cached_property
+    def bounds(self) -> np.ndarray:
+        return _read_only(np.stack((self.points.min(axis=0), self.points.max(axis=0))))
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: (3,) array of how far our points span along each axis.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @functools.cached_property
+    def extent(self) -> np.ndarray:
+        return _read_only(self.bounds[1] - self.bounds[0])
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Tuple of (min, max) for each axis, ie. min_and_max[axis][0] is the min along 'axis'.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @functools.cached_property
+    def min_and_max(self) -> tuple[tuple[float, float], ...]:
+        return tuple((float(self.bounds[0, axis]), float(self.bounds[1, axis])) for axis in range(3))
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: (N, 3) array of our points scaled so each axis runs from 0.0 (its min) to 1.0 (its max).
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @functools.cached_property
+    def normalized(self) -> np.ndarray:
+        return _read_only((self.points - self.bounds[0]) / np.where(self.extent > 0, self.extent, 1.0))
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: (N, 3) array of spherical coords around the origin, (radius, azimuth, inclination). Angles are in 
+                 degrees, azimuth is measured in the YZ plane and inclination is measured off of the X axis.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @functools.cached_property
+    def spherical(self) -> np.ndarray:
+        radius = np.linalg.norm(self.points, axis=1)
+        azimuth = np.degrees(np.arctan2(self.points[:, 2], self.points[:, 1]))
+        inclination = np.degrees(np.arccos(np.divide(self.points[:, 0], radius, out=np.ones_like(radius)
+                                                     , where=radius > 0)))
+        return _read_only(np.stack((radius, azimuth, inclination), axis=1).astype(np.float32))
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Short hash of our points, handy for keying anything we compute from them. ie. cached cycles.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @functools.cached_property
+    def fingerprint(self) -> str:
+        return hashlib.sha1(self.points.tobytes()).hexdigest()[:16]
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Spatial index over our points for slab, box, sphere, and nearest neighbor queries.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @functools.cached_property
+    def spatial_index(self) -> SpatialIndex:
+        return SpatialIndex(self.points)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: (N, 2) array of 2D polar coords (radius, theta in degrees) ignoring the given 'axis'. Same values as
+                 'MH.to_2D_polar_coords' but cached per axis.
+    INPUT: axis - X, Y, or Z (0, 1, 2), which axis we will be disregarding.
+    OUTPUT: (N, 2) float32 array of (radius, theta).
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def polar(self, axis: int) -> np.ndarray:
+        if axis not in self._polar:
+            u = self.points[:, OTHER_AXES[axis][0]]
+            v = self.points[:, OTHER_AXES[axis][1]]
+            self._polar[axis] = _read_only(np.stack((np.hypot(u, v), np.degrees(np.arctan2(v, u))), axis=1))
+        return self._polar[axis]
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: (N, 3) array of cylindrical coords (radius, theta in degrees, height) around the given 'axis'.
+    INPUT: axis - X, Y, or Z (0, 1, 2), which axis our cylinder runs along.
+    OUTPUT: (N, 3) float32 array of (radius, theta, height).
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def cylindrical(self, axis: int) -> np.ndarray:
+        if axis not in self._cylindrical:
+            self._cylindrical[axis] = _read_only(np.column_stack((self.polar(axis), self.points[:, axis])))
+        return self._cylindrical[axis]
+
+
+# Shared Geometry Of Our Real Tree
+tree_geometry = Geometry(coordinates)
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -10,93 +10,328 @@
 #   multiple CPU cores. This allows one core of the system to solely be dedicated to updating the LED's while the main
 #   thread can worry about calculating the next values needed to be displayed. 
 #
-# It also implements a backlog queue of values to be written to the strip. This way the thread responsible for
+# It also implements a backlog ring of frames to be written to the strip. This way the thread responsible for
 #   computing the next 'frame' can work ahead a little bit. This allows for frequent hits to performance on not only
 #   the system as a whole, but more importantly the thread calculating our next 'frame'. Let's say every 10s the 
-#   feature we are running needs 1 full second of processing time. Without a backlog frame queue we would simply have
+#   feature we are running needs 1 full second of processing time. Without a backlog frame ring we would simply have
 #   no data for that 1s. Now it can take that performance hit and show no sign to the user assuming under "normal"
 #   operation the calcuation is faster than our 'refresh_rate_hz'.
+#
+# The backlog lives in shared memory (see 'FrameRing') so handing a frame to the LED process is just writing pixels
+#   into a preallocated slot. Effects can even render straight into that slot through 'frame_slot'. That memory isn't
+#   freed until 'close' is called (or the controller is used as a context manager), so always close us on the way out.
+#
+# How the backlog behaves once it's full is selectable through our backpressure policy (see 'FrameRing'). The default
+#   'block' keeps the classic FIFO behaviour, 'drop_oldest' and 'mailbox' never block the caller and are paced to our
+#   refresh rate instead, 'mailbox' giving us the lowest latency for live control.
+#
+# Frames are pushed out through an 'LEDOutput' (see 'Led_Outputs.py'), normally our real ws281x strip but it can be
+#   swapped out for a headless output so everything can run and be profiled on any machine. Long strips can be split
+#   across several physical outputs with 'LED_SEGMENTS' so they don't cap our refresh rate.
+#
+# Switching effects can throw away whatever the old effect still had queued (see 'flush_frames') so the switch shows
+#   up right away instead of a whole backlog later. They can also crossfade (see 'crossfade'), the writer blends the
+#   last frame it showed into the first frames of the new effect so there is never a hard cut or a dark gap.
+#
+# Effects are animated against the time their frames will actually be shown at (see 'next_frame_time'), not how fast
+#   they happen to be rendered, so backlog, dropped frames, or a different refresh rate don't change how they look.
+#
+# Every stage a frame goes through is timed into 'timings' histograms (see 'TIMING_STAGES'). The effect side 'render'
+#   (time between handing us frames) and 'blocked' (time stuck inside 'update_leds'), and the writer side 'queue'
+#   (time a frame sat in the ring), 'pack', and 'show'.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import contextlib
 import logging
 import multiprocessing
 import numpy as np
 import time
-from rpi_ws281x import PixelStrip, Color
+from numbers import Real
+
+import helpers.Color_Helpers as CH
 
 from helpers.decorators import *
+from helpers.Frame_Ring import FrameRing, POLICY_BLOCK, POLICY_MAILBOX
+from helpers.Frame_Scheduler import FrameScheduler
+from helpers.Frame_Stats import SharedCounters, SharedHistograms
 from helpers.Settings import Settings
+from Led_Outputs import LEDOutput, create_output
+
+WRITER_STAT_FIELDS = ('frames_written', 'pushes_skipped', 'pack_ns_last', 'pack_ns_total', 'show_ns_last'
+                      , 'show_ns_total')
+TIMING_STAGES = ('render', 'blocked', 'queue', 'pack', 'show')
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Basic multithreaded LED controller.
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 class LEDController(LogAllMethods):
-    def __init__(self, refresh_rate_hz: int=30, logger: logging.Logger=None):
+    def __init__(self, refresh_rate_hz: int=30, logger: logging.Logger=None
+                 , backpressure_policy: str=Settings.BACKPRESSURE_POLICY, output: LEDOutput | str=None
+                 , num_leds: int=Settings.NUM_LEDS):
         self.logger = logger if logger is not None else logging.getLogger()
         self.refresh_rate_hz = refresh_rate_hz
         self.refresh_interval = 1.0 / self.refresh_rate_hz
+        self.num_leds = num_leds
         
-        self.strip = PixelStrip(Settings.NUM_LEDS, Settings.LED_PIN, Settings.LED_FREQ_HZ, Settings.LED_DMA
-                                , Settings.LED_INVERT, Settings.LED_BRIGHTNESS, Settings.LED_CHANNEL)
-        self.strip.begin()
+        self.output = output if isinstance(output, LEDOutput) else \
+            create_output(output or Settings.LED_OUTPUT, Settings.LED_SEGMENTS, num_leds=self.num_leds)
+        self.output.begin(self.refresh_rate_hz)
+        if self.output.wire_time_s > self.refresh_interval:
+            self.logger.warning(f"Our output takes {self.output.wire_time_s * 1e3:.1f}ms to show a frame, it can't "
+                                f"keep up with {self.refresh_rate_hz}Hz. Try splitting it up with 'LED_SEGMENTS'.")
         
-        self.update_queue = multiprocessing.Queue(maxsize=Settings.UPDATE_QUEUE_SIZE)
+        self.stats = SharedCounters(WRITER_STAT_FIELDS)
+        self.timings = SharedHistograms(TIMING_STAGES)
+        self._crossfade = multiprocessing.RawArray('q', (-1, 0))  # First frame (sequence number) and length of a fade.
+        self._last_handoff_ns = None
+        self.scheduler = FrameScheduler(self.refresh_rate_hz)
+        
+        self.frame_ring = FrameRing(Settings.UPDATE_QUEUE_SIZE, self.num_leds, backpressure_policy)
+        self._producer_deadline_ns = None
         self.led_update_process = multiprocessing.Process(target=self._write_queue_to_leds_process, daemon=True)
         self.running = multiprocessing.Value('b', True)
         
+        self._closed = False
         self.led_update_process.start()
-        self.update_queue.cancel_join_thread()
-        
+    
+    def __enter__(self):
+        return self
+    
     def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close(drain=exc_type is None)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Stops our LED process and frees our 'frame_ring'. By default we first give the writer the time it
+                 needs to show whatever is still queued, ie. the black frame from turning the LEDs off. Safe to call
+                 more than once, the controller can't be used afterwards.
+    INPUT: drain - Wait for queued frames to be shown first instead of throwing them away.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def close(self, drain: bool=True) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        
+        deadline = time.monotonic() + (self.frame_ring.pending() + 1) * self.refresh_interval \
+            + Settings.EFFECT_STOP_TIMEOUT_S
+        while drain and self.frame_ring.pending() and self.led_update_process.is_alive() \
+                and time.monotonic() < deadline:
+            time.sleep(self.refresh_interval / 4)
         self.running.value = False
         self.led_update_process.join()
         
-        # If you don't empty queues they won't "stop" even when you close them.
-        while not self.update_queue.empty():
-            self.update_queue.get()
-        self.update_queue.close()
-        self.update_queue.join_thread()
+        self.frame_ring.close()
+        self.frame_ring.unlink()
 
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    DESCRIPTION: Process function that takes our 'update_queue' and writes it to our led strip. If we want to end this
-                 process you need to set self.running.value to 'False'.
+    DESCRIPTION: Process function that takes frames off our 'frame_ring' and writes them to our 'output'. If we want
+                 to end this process you need to set self.running.value to 'False'. Each frame is fully prepared
+                 before our 'scheduler' waits for its deadline so 'show()' lands as close to on time as possible.
+                 Records how long the pack ('output.write') and 'show()' steps take for every frame in 'stats'.
+                 
+                 Frames identical to the last one we pushed are skipped entirely (no pack, no 'show()'), other than
+                 a keep alive push every 'KEEPALIVE_INTERVAL_S' in case the strip ever glitches. They still take up
+                 their slot in the schedule so timing doesn't change.
     INPUT: NA
     OUTPUT: NA
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     def _write_queue_to_leds_process(self) -> None:
+        last_frame = np.zeros((self.num_leds, 3), dtype=np.uint8)
+        fade_from = np.zeros((self.num_leds, 3), dtype=np.uint8)
+        fade_frame = np.zeros((self.num_leds, 3), dtype=np.uint8)
+        fade_start = -1
+        last_push_ns = None
+        keepalive_ns = int(Settings.KEEPALIVE_INTERVAL_S * 1e9)
+        
         while self.running.value:
-            start_time = time.time()
-            data = self.update_queue.get()
+            data = self.frame_ring.acquire_read_slot(timeout=self.refresh_interval)
+            if data is None:
+                self.scheduler.resync()
+                continue
+            self.timings.record('queue', time.monotonic_ns() - self.frame_ring.read_commit_ns())
+            
+            seq, (start, length) = self.frame_ring.read_seq(), self._crossfade[:]
+            if 0 <= start <= seq < start + length:
+                if fade_start != start:  # First frame of a new fade, fade from whatever we showed last.
+                    fade_start = start
+                    fade_from[:] = last_frame
+                data = CH.blend_rgb_array(fade_from, data, (seq - start + 1) / (length + 1), out=fade_frame)
             
-            for idx in range(Settings.NUM_LEDS):
-                if idx in Settings.BAD_LEDS:
-                    color = Color(0, 0, 0)
-                else:
-                    # Assumes color order is (R, G, B). Need to cast to ints from uint8.
-                    color = Color(int(data[idx, 0]), int(data[idx, 1]), int(data[idx, 2]))
-                
-                self.strip.setPixelColor(idx, color)
+            unchanged = Settings.SKIP_UNCHANGED_FRAMES and last_push_ns is not None \
+                and time.monotonic_ns() - last_push_ns < keepalive_ns and np.array_equal(data, last_frame)
+            if not unchanged:
+                pack_start = time.perf_counter_ns()
+                self.output.write(data)
+                pack_end = time.perf_counter_ns()
+                self.timings.record('pack', pack_end - pack_start)
+                last_frame[:] = data
+            self.frame_ring.release_read()
             
-            self.strip.show()
-            elapsed_time = time.time() - start_time
-            if elapsed_time > self.refresh_interval:
-                self.logger.warning(f"Update took too long. Frame dropped. {elapsed_time:.2f}s")
+            dropped = self.scheduler.wait_for_next_frame()
+            if dropped:
+                self.logger.warning(f"LED writer fell behind. {dropped} frame(s) dropped.")
             
-            # Wait for the remaining time to maintain the refresh rate
-            time_to_wait = self.refresh_interval - elapsed_time
-            if time_to_wait > 0:
-                time.sleep(time_to_wait)
+            if unchanged:
+                self.stats['pushes_skipped'] += 1
+                continue
+            
+            last_push_ns = time.monotonic_ns()
+            show_start = time.perf_counter_ns()
+            self.output.show()
+            show_end = time.perf_counter_ns()
+            self.timings.record('show', show_end - show_start)
+            
+            self.stats['frames_written'] += 1
+            self.stats['pack_ns_last'] = pack_end - pack_start
+            self.stats['pack_ns_total'] += pack_end - pack_start
+            self.stats['show_ns_last'] = show_end - show_start
+            self.stats['show_ns_total'] += show_end - show_start
+        
+        self.output.close()
 
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    DESCRIPTION: Puts our 'led_array' onto our 'update_queue' and then checks to see if we should wait before 
-                 returning to prevent the caller to overwhelm the controller.
-    INPUT: led_array - List of values for our led strip that we will queue to be updated.
+    DESCRIPTION: Copies our 'led_array' into the next free slot of our 'frame_ring'. Blocks while the ring is full to 
+                 prevent the caller to overwhelm the controller.
+    INPUT: led_array - List or (NUM_LEDS, 3) array of values for our led strip that we will queue to be updated.
     OUTPUT: NA
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @no_log
     def update_leds(self, led_array: list) -> None:
+        start_ns = time.perf_counter_ns()
         if type(led_array) is list:
             led_array = np.array(led_array, dtype=np.uint8)
 
-        self.update_queue.put(led_array)
+        self.frame_ring.put(led_array)
+        self._pace_producer()
+        self._record_handoff(start_ns, time.perf_counter_ns() - start_ns)
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Zero copy alternative to 'update_leds'. Hands out the next free slot of our 'frame_ring' to draw into
+                 and queues it once the 'with' block exits. If the block raises, the slot is never queued.
+                 ie. with led_controller.frame_slot() as frame: frame[:] = ...
+    INPUT: NA
+    OUTPUT: (NUM_LEDS, 3) uint8 view of the slot.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @no_log
+    @contextlib.contextmanager
+    def frame_slot(self):
+        start_ns = time.perf_counter_ns()
+        frame = self.frame_ring.acquire_write_slot()
+        acquired_ns = time.perf_counter_ns()
+        yield frame
+        commit_ns = time.perf_counter_ns()
+        self.frame_ring.commit_write()
+        self._pace_producer()
+        self._record_handoff(start_ns, acquired_ns - start_ns + time.perf_counter_ns() - commit_ns)
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Records the effect side timings of a frame handed to us. Whatever time since the last handoff that
+                 wasn't spent blocked in here was spent rendering.
+    INPUT: start_ns - 'perf_counter_ns' of when this handoff started.
+           blocked_ns - How long the caller was blocked in total during this handoff.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @no_log
+    def _record_handoff(self, start_ns: int, blocked_ns: int) -> None:
+        end_ns = time.perf_counter_ns()
+        if self._last_handoff_ns is not None:
+            self.timings.record('render', end_ns - self._last_handoff_ns - blocked_ns)
+        self.timings.record('blocked', blocked_ns)
+        self._last_handoff_ns = end_ns
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: With a non blocking backpressure policy nothing would stop an effect from rendering as fast as it
+                 possibly can, so we hold the caller to our refresh rate ourselves. Does nothing under 'block' since
+                 the ring already paces the caller for us.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @no_log
+    def _pace_producer(self) -> None:
+        if self.frame_ring.policy == POLICY_BLOCK:
+            self._producer_deadline_ns = None
+            return
+        
+        now_ns = time.monotonic_ns()
+        deadline_ns = self._producer_deadline_ns
+        if deadline_ns is None or now_ns > deadline_ns + self.scheduler.interval_ns:
+            deadline_ns = now_ns
+        self._producer_deadline_ns = deadline_ns + self.scheduler.interval_ns
+        if self._producer_deadline_ns > now_ns:
+            time.sleep((self._producer_deadline_ns - now_ns) / 1e9)
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: When the next frame we're handed is going to be shown. That's our scheduler's next deadline plus one
+                 interval for every frame already waiting ahead of it, or just the next deadline in 'mailbox' mode
+                 where the newest frame always wins. If the writer is idle or behind it's shown as soon as possible.
+    INPUT: NA
+    OUTPUT: 'time.monotonic' seconds the next frame will be shown at.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @no_log
+    def next_frame_time(self) -> float:
+        now_ns = time.monotonic_ns()
+        deadline_ns = self.scheduler.next_deadline_ns
+        if deadline_ns is None or deadline_ns < now_ns:
+            deadline_ns = now_ns
+        pending = 0 if self.frame_ring.policy == POLICY_MAILBOX else self.frame_ring.pending()
+        return (deadline_ns + pending * self.scheduler.interval_ns) / 1e9
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Switches how 'update_leds' behaves once our backlog is full, see 'FrameRing' for the policies.
+    INPUT: policy - 'block', 'drop_oldest', or 'mailbox'.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def set_backpressure_policy(self, policy: str) -> None:
+        self.frame_ring.set_policy(policy)
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs the current write, scheduler, and backlog statistics from our LED process along with average
+                 pack/ show times.
+    INPUT: NA
+    OUTPUT: Dict of all our 'WRITER_STAT_FIELDS', 'FrameScheduler' and 'FrameRing' stats, plus 'pack_ms_avg' and 
+            'show_ms_avg'.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_stats(self) -> dict[str, Real]:
+        stats = self.stats.snapshot() | self.scheduler.get_stats() | self.frame_ring.stats.snapshot()
+        frames = max(stats['frames_written'], 1)
+        stats['pack_ms_avg'] = stats['pack_ns_total'] / frames / 1e6
+        stats['show_ms_avg'] = stats['show_ns_total'] / frames / 1e6
+        return stats
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Throws away every frame still waiting to be shown, whatever is on the strip right now stays up until
+                 the next frame we're handed. Also wakes up a producer blocked on a full backlog.
+    INPUT: NA
+    OUTPUT: Number of frames thrown away.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def flush_frames(self) -> int:
+        return self.frame_ring.flush()
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Crossfades from the last frame shown into the next 'seconds' worth of frames we're handed. Call it
+                 right before the first frame of a new effect.
+    INPUT: seconds - Length of the fade.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def crossfade(self, seconds: Real) -> None:
+        self._crossfade[1] = max(1, round(seconds * self.refresh_rate_hz))
+        self._crossfade[0] = self.frame_ring.write_seq()
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Clears every timing histogram, ie. at the start of a new effect.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def reset_timings(self) -> None:
+        self.timings.reset()
+        self._last_handoff_ns = None
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Summary of every timing histogram since the last 'reset_timings'.
+    INPUT: NA
+    OUTPUT: Dict of {stage: {'count', 'p50_us', 'p95_us', 'p99_us', 'max_us'}} for each of 'TIMING_STAGES'.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_timings(self) -> dict[str, dict[str, Real]]:
+        return self.timings.summary()
 
 
 # FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -0,0 +1,381 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    LED OUTPUT BACKENDS                      CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Everything our LEDController can push frames out to. The controller only ever talks to the 'LEDOutput' interface so
+#   the exact same effect and controller code can run on the Pi, on a build box with no LEDs, or while recording.
+#
+#   'ws281x'    - The real strip through 'rpi_ws281x'. Only imported when actually used so nothing else here needs
+#                 the library installed.
+#   'null'      - Throws frames away. Only counts and times them, optionally pretending to take as long as the real
+#                 strip would to clock the data out.
+#   'recording' - Appends every shown frame to a compact binary frame file (see 'helpers/Frame_File.py').
+#
+# One WS281x chain can only be clocked out so fast (~30us per pixel), so a long strip caps our refresh rate. Outputs can
+#   be split up with a segment map, ie. 'LED_SEGMENTS', of (num_leds, pin, channel) per physical chain in LED order.
+#   Each output decides what that means for it ('from_segments'), by default it becomes a 'SegmentedOutput' of one
+#   output per segment. Frames are handed to every segment as zero-copy slices and all of them are shown together, so
+#   a frame takes as long as the longest segment instead of all of them back to back. 'ws281x' instead drives both PWM
+#   channels of a single controller, which the hardware clocks out in parallel off one 'show()'.
+#
+# Outputs are created in the main process and then used from our LED process, so anything that can't survive a fork
+#   (buffers, file handles, etc.) should be set up lazily on first use.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import ctypes
+import numpy as np
+import threading
+import time
+from numbers import Real
+
+from helpers.Frame_File import FrameFileWriter
+from helpers.Settings import Settings
+
+# Rough time to clock one WS281x pixel out (24 bits at 800kHz) and the latch/ reset time after every frame.
+WS281X_PIXEL_TIME_S = 30e-6
+WS281X_RESET_TIME_S = 300e-6
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Checks a segment map covers exactly 'num_leds' LEDs and works out where each segment starts and stops.
+INPUT: segments - Tuple of (num_leds, pin, channel) per segment, in LED order.
+       num_leds - Total number of LEDs the segments should add up to.
+OUTPUT: List of (start, stop) of every segment.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def segment_bounds(segments: tuple[tuple[int, int, int], ...], num_leds: int) -> list[tuple[int, int]]:
+    counts = [segment[0] for segment in segments]
+    if not counts or min(counts) <= 0 or sum(counts) != num_leds:
+        raise ValueError(f"Segments {segments} don't split {num_leds} LEDs into non empty segments.")
+    stops = np.cumsum(counts).tolist()
+    return list(zip([0] + stops[:-1], stops))
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Packs an (N, 3) uint8 RGB frame into the 32 bit 0x00RRGGBB words 'Color()' would give us, the strip 
+             itself takes care of the final color order. Done completely in place on 'out' so nothing is allocated.
+INPUT: frame - (N, 3) uint8 RGB frame to pack.
+       out - (N,) uint32 array we will pack 'frame' into.
+       mask - (N,) uint32 array that is ANDed with our words, 0 for LEDs that should never turn on.
+OUTPUT: NA
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def pack_frame(frame: np.ndarray, out: np.ndarray, mask: np.ndarray) -> None:
+    out[:] = frame[:, 0]
+    out <<= 8
+    out |= frame[:, 1]
+    out <<= 8
+    out |= frame[:, 2]
+    out &= mask
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Base class/ interface for all of our outputs. Subclasses need to implement 'write' and 'show', 'begin'
+             and 'close' are optional.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class LEDOutput:
+    
+    def __init__(self, num_leds: int=Settings.NUM_LEDS, bad_leds: tuple[int]=Settings.BAD_LEDS) -> None:
+        self.num_leds = num_leds
+        self.bad_leds = np.array([led for led in bad_leds if led < self.num_leds], dtype=np.intp)
+        self.frames_shown = 0
+        self.wire_time_s = 0.0  # How long 'show' keeps the wire busy, caps the refresh rate we can run at.
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Builds this kind of output split up by a segment map. By default that's a 'SegmentedOutput' with one
+                 of us per segment, each only knowing about its own LEDs.
+    INPUT: segments - Tuple of (num_leds, pin, channel) per segment, in LED order.
+           num_leds - Total number of LEDs, the segments have to add up to it.
+           bad_leds - Tuple of LEDs (across the whole strip) that should never turn on.
+           kwargs - Any extra args for each segment's constructor.
+    OUTPUT: The new LEDOutput.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @classmethod
+    def from_segments(cls, segments: tuple[tuple[int, int, int], ...], num_leds: int=Settings.NUM_LEDS
+                      , bad_leds: tuple[int]=Settings.BAD_LEDS, **kwargs) -> 'LEDOutput':
+        return SegmentedOutput([cls(num_leds=stop - start, bad_leds=[led - start for led in bad_leds
+                                                                     if start <= led < stop], **kwargs)
+                                for start, stop in segment_bounds(segments, num_leds)])
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Called once from the main process before our LED process is started.
+    INPUT: refresh_rate_hz - Rate our controller will be showing frames at.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def begin(self, refresh_rate_hz: Real) -> None:
+        pass
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Stages 'frame' to be shown on the next 'show'. Must not hold on to 'frame' since it is a slot of our
+                 frame ring that will be reused as soon as we return. 'bad_leds' must always end up off.
+    INPUT: frame - (num_leds, 3) uint8 RGB frame.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def write(self, frame: np.ndarray) -> None:
+        raise NotImplementedError
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Actually displays whatever was last staged with 'write'.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def show(self) -> None:
+        raise NotImplementedError
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Called from our LED process once it is shutting down.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def close(self) -> None:
+        pass
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Our real strip. Frames are packed into the strip's 32 bit color words in one vectorized step and copied
+             straight into the strip's LED buffers, falling back to setting them one LED at a time if we can't get at
+             those buffers. With 'segments' the strip is split across both PWM channels of the one controller, the
+             first 'num_leds' of the first segment go out on its pin and the rest on the other. Both channels are
+             clocked out in parallel by every 'show()' so the frame takes as long as the longest of the two.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class WS281xOutput(LEDOutput):
+    
+    def __init__(self, num_leds: int=Settings.NUM_LEDS, bad_leds: tuple[int]=Settings.BAD_LEDS
+                 , pin: int=Settings.LED_PIN, channel: int=Settings.LED_CHANNEL, dma: int=Settings.LED_DMA
+                 , segments: tuple[tuple[int, int, int], ...]=None) -> None:
+        super().__init__(num_leds, bad_leds)
+        from rpi_ws281x import PixelStrip, ws
+        
+        self.segments = tuple(segments) if segments else ((self.num_leds, pin, channel),)
+        self.bounds = segment_bounds(self.segments, self.num_leds)
+        if len({channel for _, _, channel in self.segments}) != len(self.segments):
+            raise ValueError(f"Segments {self.segments} need one PWM channel each, a controller only has 0 and 1.")
+        self.wire_time_s = max(count for count, _, _ in self.segments) * WS281X_PIXEL_TIME_S + WS281X_RESET_TIME_S
+        
+        # Every channel gets the same color order, the strip reorders our (R, G, B) words into it.
+        strip_type = getattr(ws, f"WS2811_STRIP_{Settings.LED_ORDER.upper()}")
+        (count, pin, channel), *others = self.segments
+        self.strip = PixelStrip(count, pin, Settings.LED_FREQ_HZ, dma, Settings.LED_INVERT
+                                , Settings.LED_BRIGHTNESS, channel, strip_type=strip_type)
+        self.channels = [self.strip._channel]
+        # 'PixelStrip' only sets up the one channel, the other one is configured on the same controller by hand.
+        for count, pin, channel in others:
+            other = ws.ws2811_channel_get(self.strip._leds, channel)
+            ws.ws2811_channel_t_count_set(other, count)
+            ws.ws2811_channel_t_gpionum_set(other, pin)
+            ws.ws2811_channel_t_invert_set(other, 1 if Settings.LED_INVERT else 0)
+            ws.ws2811_channel_t_brightness_set(other, Settings.LED_BRIGHTNESS)
+            ws.ws2811_channel_t_strip_type_set(other, strip_type)
+            self.channels.append(other)
+        
+        self.led_mask = np.full(self.num_leds, 0xFFFFFFFF, dtype=np.uint32)
+        self.led_mask[self.bad_leds] = 0
+        self._packed = np.zeros(self.num_leds, dtype=np.uint32)
+        self._led_buffers = None
+    
+    @classmethod
+    def from_segments(cls, segments: tuple[tuple[int, int, int], ...], num_leds: int=Settings.NUM_LEDS
+                      , bad_leds: tuple[int]=Settings.BAD_LEDS, **kwargs) -> 'WS281xOutput':
+        return cls(num_leds=num_leds, bad_leds=bad_leds, segments=segments, **kwargs)
+    
+    def begin(self, refresh_rate_hz: Real) -> None:
+        self.strip.begin()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs a numpy view directly on top of a channel's internal LED buffer so a whole segment can be
+                 written with one copy. Needs to be called after 'strip.begin()' since that is what allocates the
+                 buffer.
+    INPUT: channel - The channel's 'ws2811_channel_t'.
+           count - Number of LEDs on that channel.
+    OUTPUT: (count,) uint32 view of the channel's LED buffer, or 'None' if the strip doesn't give us access to it.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _get_led_buffer(self, channel, count: int) -> np.ndarray:
+        from rpi_ws281x import ws
+        try:
+            leds_ptr = int(ws.ws2811_channel_t_leds_get(channel))
+        except (AttributeError, TypeError):
+            return None
+        if not leds_ptr:
+            return None
+        return np.ctypeslib.as_array((ctypes.c_uint32 * count).from_address(leds_ptr))
+    
+    def write(self, frame: np.ndarray) -> None:
+        if self._led_buffers is None:
+            self._led_buffers = [self._get_led_buffer(channel, stop - start)
+                                 for channel, (start, stop) in zip(self.channels, self.bounds)]
+        
+        # Assumes color order is (R, G, B).
+        pack_frame(frame, self._packed, self.led_mask)
+        for channel, buffer, (start, stop) in zip(self.channels, self._led_buffers, self.bounds):
+            if buffer is not None:
+                buffer[:] = self._packed[start:stop]
+            else:
+                from rpi_ws281x import ws
+                for idx, color in enumerate(self._packed[start:stop].tolist()):
+                    ws.ws2811_led_set(channel, idx, color)
+    
+    def show(self) -> None:
+        self.strip.show()
+        self.frames_shown += 1
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Headless output that throws every frame away. Handy for measuring render throughput on any machine. If
+             'simulate_wire_time' is set each 'show' takes as long as clocking 'num_leds' pixels out to a real strip.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class NullOutput(LEDOutput):
+    
+    def __init__(self, num_leds: int=Settings.NUM_LEDS, bad_leds: tuple[int]=Settings.BAD_LEDS
+                 , simulate_wire_time: bool=False) -> None:
+        super().__init__(num_leds, bad_leds)
+        self.wire_time_s = self.num_leds * WS281X_PIXEL_TIME_S + WS281X_RESET_TIME_S if simulate_wire_time else 0.0
+    
+    def write(self, frame: np.ndarray) -> None:
+        pass
+    
+    def show(self) -> None:
+        if self.wire_time_s:
+            time.sleep(self.wire_time_s)
+        self.frames_shown += 1
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Headless output that appends every shown frame to a frame file at 'path'. The file is only opened from
+             our LED process on the first frame. Segment maps don't mean anything for a file, we always record the
+             whole frame.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class RecordingOutput(LEDOutput):
+    
+    def __init__(self, num_leds: int=Settings.NUM_LEDS, bad_leds: tuple[int]=Settings.BAD_LEDS
+                 , path: str=Settings.RECORDING_PATH, fps: Real=None) -> None:
+        super().__init__(num_leds, bad_leds)
+        self.path = path
+        self.fps = fps
+        self._frame = np.zeros((self.num_leds, 3), dtype=np.uint8)
+        self._writer = None
+    
+    @classmethod
+    def from_segments(cls, segments: tuple[tuple[int, int, int], ...], num_leds: int=Settings.NUM_LEDS
+                      , bad_leds: tuple[int]=Settings.BAD_LEDS, **kwargs) -> 'RecordingOutput':
+        return cls(num_leds=num_leds, bad_leds=bad_leds, **kwargs)
+    
+    def begin(self, refresh_rate_hz: Real) -> None:
+        if self.fps is None:
+            self.fps = refresh_rate_hz
+    
+    def write(self, frame: np.ndarray) -> None:
+        self._frame[:] = frame
+        self._frame[self.bad_leds] = 0
+    
+    def show(self) -> None:
+        if self._writer is None:
+            self._writer = FrameFileWriter(self.path, self.num_leds, self.fps)
+        self._writer.write(self._frame)
+        self.frames_shown += 1
+    
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Splits one logical strip across several outputs, each driving the next 'num_leds' LEDs in order. Every
+             frame is handed to each output as a zero-copy slice. Their 'show()'s are started together, each from its
+             own thread (the first one from ours), and we only return once all of them are done. So outputs that
+             block while their data goes out (another controller, another process, a simulated wire) overlap instead
+             of adding up. Our helper threads are started lazily since we are built before our LED process forks.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class SegmentedOutput(LEDOutput):
+    
+    def __init__(self, outputs: list[LEDOutput]) -> None:
+        super().__init__(sum(output.num_leds for output in outputs), ())
+        self.outputs = list(outputs)
+        self.bounds = segment_bounds(tuple((output.num_leds, None, None) for output in self.outputs), self.num_leds)
+        self.bad_leds = np.array([start + led for output, (start, _) in zip(self.outputs, self.bounds)
+                                  for led in output.bad_leds], dtype=np.intp)
+        self.wire_time_s = max(output.wire_time_s for output in self.outputs)
+        
+        self._threads = None
+        self._start = self._finish = None
+        self._errors = [None] * len(self.outputs)
+        self._closing = False
+    
+    def begin(self, refresh_rate_hz: Real) -> None:
+        for output in self.outputs:
+            output.begin(refresh_rate_hz)
+    
+    def write(self, frame: np.ndarray) -> None:
+        for output, (start, stop) in zip(self.outputs, self.bounds):
+            output.write(frame[start:stop])
+    
+    def show(self) -> None:
+        if len(self.outputs) == 1:
+            self.outputs[0].show()
+        else:
+            if self._threads is None:
+                self._start_threads()
+            self._start.wait()
+            try:
+                self.outputs[0].show()
+            finally:
+                # Always meet our helpers at the finish, otherwise they'd never make it back to the start.
+                self._finish.wait()
+                errors, self._errors = self._errors, [None] * len(self.outputs)
+            
+            error = next((error for error in errors if error is not None), None)
+            if error is not None:
+                raise error
+        self.frames_shown += 1
+    
+    def close(self) -> None:
+        if self._threads is not None:
+            self._closing = True
+            self._start.wait()
+            for thread in self._threads:
+                thread.join()
+        for output in self.outputs:
+            output.close()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Starts one thread per output other than our first, each waiting to show its output with us.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _start_threads(self) -> None:
+        self._start = threading.Barrier(len(self.outputs))
+        self._finish = threading.Barrier(len(self.outputs))
+        self._threads = [threading.Thread(target=self._show_loop, args=(idx,), daemon=True)
+                         for idx in range(1, len(self.outputs))]
+        for thread in self._threads:
+            thread.start()
+    
+    def _show_loop(self, idx: int) -> None:
+        while True:
+            self._start.wait()
+            if self._closing:
+                return
+            try:
+                self.outputs[idx].show()
+            except Exception as error:
+                self._errors[idx] = error
+            self._finish.wait()
+
+
+OUTPUTS = {'ws281x': WS281xOutput, 'null': NullOutput, 'recording': RecordingOutput}
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Builds one of our 'OUTPUTS' by name, split up by 'segments' if we have any (see 'from_segments').
+INPUT: name - Key into 'OUTPUTS'.
+       segments - Tuple of (num_leds, pin, channel) per segment in LED order, empty for one single output.
+       kwargs - Any extra args for that output's constructor.
+OUTPUT: The new LEDOutput.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def create_output(name: str, segments: tuple[tuple[int, int, int], ...]=(), **kwargs) -> LEDOutput:
+    if name not in OUTPUTS:
+        raise ValueError(f"Unknown LED output '{name}', expected one of {tuple(OUTPUTS)}.")
+    if segments:
+        return OUTPUTS[name].from_segments(segments, **kwargs)
+    return OUTPUTS[name](**kwargs)
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
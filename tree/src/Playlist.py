@@ -0,0 +1,100 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    PLAYLIST                                 CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Declarative playlist of effects for the tree. A playlist is just a sequence of 'PlaylistEntry's, either written in
+#   Python (see 'Tree.py') or loaded from a JSON file -
+#
+#   [{"effect": "radial_rainbow", "duration": 5, "args": [0, 175, 1.0]},
+#    {"effect": "random_plane", "duration": 10, "args": [210], "crossfade": 2.0}]
+#
+# While one effect is playing, the next one is prepared on a background thread (see 'LEDEffects.prepare') so there is
+#   no stall at the switch, and every switch crossfades from the old effect into the new one.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import json
+import threading
+from dataclasses import dataclass
+from numbers import Real
+
+from Effects import LEDEffects
+from helpers.Settings import Settings
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Single effect in a playlist.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+@dataclass(frozen=True)
+class PlaylistEntry:
+    effect: str                                     # Name of the LEDEffects method to run.
+    duration: Real                                  # Seconds to run it for.
+    args: tuple = ()                                # Args for the effect.
+    crossfade: Real = Settings.PLAYLIST_CROSSFADE_S # Seconds to crossfade in from the previous effect.
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Loads a playlist from a JSON file, a list of objects with the same fields as 'PlaylistEntry'.
+INPUT: path - Path to our JSON playlist.
+OUTPUT: Tuple of PlaylistEntry.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def load_playlist(path: str) -> tuple[PlaylistEntry]:
+    with open(path) as file:
+        entries = json.load(file)
+    return tuple(PlaylistEntry(**(entry | {'args': tuple(entry.get('args', ()))})) for entry in entries)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Plays a playlist through an 'LEDEffects', preparing each effect in the background while the one before
+             it is still running.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class PlaylistPlayer:
+    
+    def __init__(self, led_effects: LEDEffects, entries: tuple[PlaylistEntry]) -> None:
+        if not entries:
+            raise ValueError("Playlist is empty.")
+        for entry in entries:
+            if not callable(getattr(led_effects, entry.effect, None)):
+                raise ValueError(f"Unknown effect '{entry.effect}' in playlist.")
+        
+        self.led_effects = led_effects
+        self.entries = tuple(entries)
+        self._prepare_thread = None
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Starts preparing 'entry' on a background thread.
+    INPUT: entry - Entry we'll be playing next.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _prepare_in_background(self, entry: PlaylistEntry) -> None:
+        self._prepare_thread = threading.Thread(target=self.led_effects.prepare, args=(entry.effect, entry.args)
+                                                , daemon=True)
+        self._prepare_thread.start()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Plays every entry in order, preparing the next entry while the current one runs.
+    INPUT: loop - Keep starting over from the top once we reach the end.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def run(self, loop: bool=True) -> None:
+        self.led_effects.prepare(self.entries[0].effect, self.entries[0].args)
+        idx = 0
+        while True:
+            entry = self.entries[idx]
+            next_idx = (idx + 1) % len(self.entries)
+            if next_idx or loop:
+                self._prepare_in_background(self.entries[next_idx])
+            
+            self.led_effects.run_effect_for_x_seconds(getattr(self.led_effects, entry.effect), duration=entry.duration
+                                                      , args=entry.args, crossfade=entry.crossfade)
+            
+            if self._prepare_thread is not None:
+                self._prepare_thread.join()
+                self._prepare_thread = None
+            if next_idx == 0 and not loop:
+                return
+            idx = next_idx
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
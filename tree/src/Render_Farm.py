@@ -0,0 +1,271 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    RENDER FARM                              CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Renders an effect's frames across a pool of worker processes so heavy effects can use every core instead of fighting
+#   over one under the GIL. Every worker builds its own copy of the effect's renderer (see 'Renderers.py') and draws
+#   straight into a ring of frame slots in 'multiprocessing.shared_memory', we only ever send it which frame to draw.
+#
+# How the work is split depends on the renderer -
+#   'time' - Seekable renderers. Frame 'k' goes to worker 'k % workers', every worker draws whole frames.
+#   'leds' - Partitionable renderers. Every worker draws every frame but only its own contiguous block of LEDs. All
+#            workers are seeded the same way so they agree on anything random that isn't per LED.
+#
+# Either way we are a renderer ourselves, so the engine drives us like any other effect. Frames always come back out in
+#   order and we never work on more than 'lookahead' frames ahead of the one being shown, frame 'k' always lives in slot
+#   'k % lookahead'. Frames we work on ahead of time are drawn for when they should be shown if nothing gets dropped in
+#   between. In 'time' mode a guess that turns out to be off by more than half a frame is simply redrawn, in 'leds' mode
+#   workers keep state so the next frames we hand out catch back up instead.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import multiprocessing
+import multiprocessing.connection
+import numpy as np
+import random
+import signal
+import traceback
+from multiprocessing import shared_memory
+from numbers import Real
+
+import helpers.Math_Helpers as MH
+
+from helpers.Settings import Settings
+from Renderers import Renderer
+
+SPLIT_TIME = 'time'
+SPLIT_LEDS = 'leds'
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Picks how we would split up a given renderer.
+INPUT: renderer - Renderer we want to farm out.
+OUTPUT: 'SPLIT_TIME', 'SPLIT_LEDS', or 'None' if it can't be split at all.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def split_for(renderer: Renderer) -> str | None:
+    if renderer.seekable:
+        return SPLIT_TIME
+    if renderer.partitionable:
+        return SPLIT_LEDS
+    return None
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Stands in for 'LEDController' inside our workers, effects only ever need to know our refresh rate to
+             build their renderers.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class _FarmClock:
+    
+    def __init__(self, refresh_rate_hz: Real) -> None:
+        self.refresh_rate_hz = refresh_rate_hz
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Entry point of every worker. Attaches to the frame ring and serves frames until we are told to exit.
+INPUT: conn - Our end of the pipe to the farm.
+       shm_name - Name of the shared memory block holding the frame ring.
+       shape - Shape of the frame ring, (lookahead, num_leds, 3).
+       *args - Passed on to '_serve_frames'.
+OUTPUT: NA
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def _farm_worker(conn: multiprocessing.connection.Connection, shm_name: str, shape: tuple[int, int, int]
+                 , *args) -> None:
+    # Ctrl-C is the main process's to deal with, it shuts us down through 'RenderFarm.close'.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        _serve_frames(conn, np.ndarray(shape, dtype=np.uint8, buffer=shm.buf), *args)
+    finally:
+        conn.close()
+        shm.close()
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Builds our copy of the renderer and draws whatever frames we are sent into 'frames'. Every frame is
+             answered with '(k, done, error)', 'error' being the traceback if anything went wrong, after which we
+             stop serving. 'stop' stops our renderer and 'None' tells us to exit.
+INPUT: conn - Our end of the pipe to the farm.
+       frames - The frame ring.
+       effects_class - 'LEDEffects' or a subclass of it, used to build the renderer.
+       points - Coordinates of every LED.
+       refresh_rate_hz - Refresh rate we are rendering at.
+       effect_name - Name of the effect.
+       args - Args for the effect.
+       seed - Seed for anything random, the same for every worker.
+       leds - (start, stop) of the LEDs we draw, 'None' draws whole frames.
+OUTPUT: NA
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def _serve_frames(conn: multiprocessing.connection.Connection, frames: np.ndarray, effects_class: type
+                  , points: np.ndarray, refresh_rate_hz: Real, effect_name: str, args: tuple, seed: int
+                  , leds: tuple[int, int] | None) -> None:
+    renderer = None
+    try:
+        random.seed(seed)
+        effects = effects_class(coords=points, led_controller=_FarmClock(refresh_rate_hz), render_workers=0)
+        effects.rotation_cache = MH.RotationCache(rng=np.random.default_rng(seed))
+        renderer = effects.make_renderer(effect_name, args)
+        if leds is not None:
+            renderer.restrict(*leds)
+            frames = frames[:, leds[0]:leds[1]]
+        
+        while (message := conn.recv()) is not None:
+            if message == 'stop':
+                renderer.stop()
+                continue
+            
+            k, t, dt = message
+            # Seekable renderers only know whether the last frame they drew was past their end.
+            if leds is None:
+                renderer.done = False
+            if renderer.done:
+                frames[k % len(frames)] = 0
+            else:
+                renderer.render(t, dt, frames[k % len(frames)])
+            conn.send((k, renderer.done, None))
+    except Exception:
+        conn.send((None, True, traceback.format_exc()))
+    finally:
+        if renderer is not None:
+            renderer.close()
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Renderer that farms an effect out to 'workers' processes, see the top of this file.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class RenderFarm(Renderer):
+    
+    def __init__(self, effects, effect_name: str, args: tuple, split: str, workers: int
+                 , lookahead: int=Settings.RENDER_FARM_LOOKAHEAD) -> None:
+        super().__init__()
+        if split not in (SPLIT_TIME, SPLIT_LEDS):
+            raise ValueError(f"Unknown split '{split}', expected '{SPLIT_TIME}' or '{SPLIT_LEDS}'.")
+        if workers < 1 or lookahead < 1:
+            raise ValueError(f"Need at least one worker and one frame of lookahead, got {workers} and {lookahead}.")
+        
+        self.split = split
+        self.lookahead = lookahead
+        self.interval = 1.0 / effects.led_controller.refresh_rate_hz
+        
+        self._shm = shared_memory.SharedMemory(create=True, size=lookahead * effects.num_leds * 3)
+        self.frames = np.ndarray((lookahead, effects.num_leds, 3), dtype=np.uint8, buffer=self._shm.buf)
+        
+        parts = [None] * workers
+        if split == SPLIT_LEDS:
+            parts = [(int(part[0]), int(part[-1]) + 1)
+                     for part in np.array_split(np.arange(effects.num_leds), workers) if len(part)]
+        
+        seed = random.getrandbits(32)
+        self.conns, self.workers = [], []
+        for leds in parts:
+            conn, worker_conn = multiprocessing.Pipe()
+            worker = multiprocessing.Process(target=_farm_worker, daemon=True
+                                             , args=(worker_conn, self._shm.name, self.frames.shape, type(effects)
+                                                     , effects.geometry.points, effects.led_controller.refresh_rate_hz
+                                                     , effect_name, args, seed, leds))
+            worker.start()
+            worker_conn.close()
+            self.conns.append(conn)
+            self.workers.append(worker)
+        
+        self._in_flight = {}    # Frame -> [replies we are still waiting on, replies saying 'done', 't' it was sent at]
+        self._next = 0
+        self._sent_t = 0.0
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Hands frame 'k' out to whichever workers draw it.
+    INPUT: k - Frame number.
+           t - Time the frame is drawn for.
+           dt - Time since the last frame we handed out.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _dispatch(self, k: int, t: Real, dt: Real) -> None:
+        conns = [self.conns[k % len(self.conns)]] if self.split == SPLIT_TIME else self.conns
+        for conn in conns:
+            conn.send((k, t, dt))
+        self._in_flight[k] = [len(conns), 0, t]
+        self._sent_t = t
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Waits until every worker drawing frame 'k' is done with it. Replies for other frames that come in
+                 along the way are booked as well.
+    INPUT: k - Frame number.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _collect(self, k: int) -> None:
+        while self._in_flight[k][0]:
+            for conn in multiprocessing.connection.wait(self.conns):
+                try:
+                    frame, done, error = conn.recv()
+                except EOFError:
+                    raise RuntimeError("A render farm worker died.") from None
+                if error is not None:
+                    raise RuntimeError(f"A render farm worker failed -\n{error}")
+                self._in_flight[frame][0] -= 1
+                self._in_flight[frame][1] += done
+    
+    def render(self, t: Real, dt: Real, out: np.ndarray) -> None:
+        k = self._next
+        if k not in self._in_flight:
+            self._dispatch(k, t, dt)
+        elif self.split == SPLIT_TIME and abs(self._in_flight[k][2] - t) > self.interval / 2:
+            self._collect(k)
+            self._dispatch(k, t, dt)
+        
+        for ahead in range(k + 1, k + self.lookahead):
+            if ahead not in self._in_flight:
+                target = t + (ahead - k) * self.interval
+                self._dispatch(ahead, target, max(target - self._sent_t, 0.0))
+        
+        self._collect(k)
+        done = self._in_flight.pop(k)[1]
+        out[:] = self.frames[k % self.lookahead]
+        self._next += 1
+        self.done = done == (1 if self.split == SPLIT_TIME else len(self.conns))
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Seekable renderers have nothing to wrap up so in 'time' mode we are done right away. Otherwise every
+                 worker is asked to stop, starting with the next frame we hand out.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def stop(self) -> None:
+        if self.split == SPLIT_TIME:
+            self.done = True
+            return
+        self._broadcast('stop')
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Shuts every worker down and frees the frame ring. Workers that don't exit within
+                 'EFFECT_STOP_TIMEOUT_S' (ie. stuck drawing a frame) are killed.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def close(self) -> None:
+        self._broadcast(None)
+        for worker in self.workers:
+            worker.join(Settings.EFFECT_STOP_TIMEOUT_S)
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+        for conn in self.conns:
+            conn.close()
+        
+        del self.frames
+        self._shm.close()
+        self._shm.unlink()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Sends 'message' to every worker that is still around to hear it.
+    INPUT: message - Message to send.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _broadcast(self, message) -> None:
+        for conn in self.conns:
+            try:
+                conn.send(message)
+            except OSError:
+                pass
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
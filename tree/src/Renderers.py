@@ -0,0 +1,266 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    RENDERERS                                CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Pull based effect protocol. A renderer is a stateful object that draws a single frame whenever it's asked to, it
+#   never loops, sleeps, or touches LEDController itself. Whoever drives it (normally 'LEDEffects.run_renderer') owns
+#   timing, buffering, cancellation, and output. That way the same renderer can be played live, run ahead of time, or
+#   driven at whatever rate we want.
+#
+# Every renderer has -
+#   render(t, dt, out) - Draws the frame shown 't' seconds after the effect started into 'out', a (N, 3) uint8 array.
+#                        'dt' is the time since the previous frame (0 for the first one).
+#   stop()             - Asks the renderer to wrap up. It keeps getting rendered until 'done', ie. to fade out.
+#   done               - True once there is nothing left to draw, either after 'stop' or because it simply ran out.
+#   close()            - Releases anything we hold on to. Called once whoever drives us is done with us, however that
+#                        came about.
+#
+# Renderers can also say how they can be split up across processes (see 'Render_Farm.py') -
+#   seekable           - Every frame depends on 't' alone, so any number of copies can render frames in any order.
+#   partitionable      - Every LED is independent of the others, see 'restrict'.
+#   cheap              - Drawing a frame is next to free, ie. copying it out of a cached cycle. Farming us out would
+#                        only add the cost of sending every frame back, so we're always drawn in-process.
+#
+# Renderers animate off 't' and 'dt' alone, never off how many frames they've drawn, and their speeds are given in
+#   units per second. So an effect looks the same at any refresh rate, when frames get dropped, or when it's rendered
+#   ahead of time.
+#
+# Plain generators (or any iterator) that yield whole frames work as well, just wrap them in 'GeneratorRenderer'. Those
+#   are the one exception to the above, they simply get one frame pulled per frame shown.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import numpy as np
+import random
+from collections.abc import Iterator
+from numbers import Real
+
+import helpers.Color_Helpers as CH
+import helpers.Math_Helpers as MH
+
+from helpers.Fade_Engine import FadeEngine
+from helpers.Frame_File import FrameFileReader
+from Ddp_Stream import DDPReceiver
+from Geometry import Geometry
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Base renderer, see the top of this file for the protocol. Subclasses only have to implement 'render'.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class Renderer:
+    seekable = False
+    partitionable = False
+    cheap = False
+    
+    def __init__(self) -> None:
+        self.done = False
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Draws the frame at 't' into 'out'. Called once per frame so it should do as little as it can.
+    INPUT: t - Seconds since the effect started that this frame will be shown at.
+           dt - Seconds since the previous frame, 0 for the first one.
+           out - (N, 3) uint8 array to draw into.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def render(self, t: Real, dt: Real, out: np.ndarray) -> None:
+        raise NotImplementedError
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Asks us to wrap up. By default we are done right away, renderers that want to exit gracefully
+                 override this and set 'done' themselves once they are finished.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def stop(self) -> None:
+        self.done = True
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Only renders LEDs [start, stop) from now on, 'out' is then just those LEDs. Only called before our
+                 first frame and only if we are 'partitionable'. Any randomness that isn't per LED has to come from
+                 the 'random' module or our geometry's 'rotation_cache' so every partition seeded the same way draws
+                 the same thing.
+    INPUT: start - First LED we render.
+           stop - One past the last LED we render.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def restrict(self, start: int, stop: int) -> None:
+        raise NotImplementedError
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Releases anything we hold on to, nothing by default.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def close(self) -> None:
+        pass
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Adapts any iterator of whole frames into a renderer. We always hold on to the next frame so we know
+             we're 'done' before we are asked for a frame we don't have. Closing closes the iterator if it can be,
+             so generators get to run their 'finally' blocks.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class GeneratorRenderer(Renderer):
+    
+    def __init__(self, frames: Iterator[np.ndarray]) -> None:
+        super().__init__()
+        self.frames = frames
+        self._next = next(self.frames, None)
+        self.done = self._next is None
+    
+    def render(self, t: Real, dt: Real, out: np.ndarray) -> None:
+        out[:] = self._next
+        self._next = next(self.frames, None)
+        self.done = self._next is None
+    
+    def close(self) -> None:
+        if hasattr(self.frames, 'close'):
+            self.frames.close()
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Loops a fully rendered cycle of frames, ie. from 'LEDEffects._cached_cycle', evenly spread over
+             'period' seconds. Nothing is computed per frame, we just copy whichever frame is closest to 't'. Cycles
+             too big to cache are a 'LazyCycle' that renders just that frame instead.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class CycleRenderer(Renderer):
+    seekable = True
+    cheap = True
+    
+    def __init__(self, cycle: np.ndarray, period: Real) -> None:
+        super().__init__()
+        self.cycle = cycle
+        self.period = period
+    
+    def render(self, t: Real, dt: Real, out: np.ndarray) -> None:
+        out[:] = self.cycle[round(t / self.period * len(self.cycle)) % len(self.cycle)]
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Plays frames [start, stop) of a frame file once, then keeps repeating [loop_start, loop_end) if we are
+             looping, otherwise we're done after the last frame. Frames are picked by time against the file's own
+             fps so it plays at the right speed whatever rate we are running at.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class FrameFileRenderer(Renderer):
+    seekable = True
+    cheap = True
+    
+    def __init__(self, reader: FrameFileReader, start: int, stop: int, loop_start: int, loop_end: int
+                 , loop: bool) -> None:
+        super().__init__()
+        self.reader = reader
+        self.start, self.stop_frame = start, stop
+        self.loop_start, self.loop_end = loop_start, loop_end
+        self.loop = loop and loop_start < loop_end
+        self.done = self.start >= self.stop_frame
+    
+    def render(self, t: Real, dt: Real, out: np.ndarray) -> None:
+        frame = round(t * self.reader.fps)
+        first_pass = self.stop_frame - self.start
+        if frame < first_pass:
+            index = self.start + frame
+        elif self.loop:
+            index = self.loop_start + (frame - first_pass) % (self.loop_end - self.loop_start)
+        else:
+            index = self.stop_frame - 1
+        out[:] = self.reader[index]
+        
+        if not self.loop and frame >= first_pass - 1:
+            self.done = True
+    
+    def close(self) -> None:
+        self.reader.close()
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Sweeps a plane of a random color and random orientation across the tree at 'speed' units per second,
+             leaving a fading trail. Every sweep picks a new orientation and a new hue. Once stopped we fade out
+             whatever is still lit.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class RandomPlaneRenderer(Renderer):
+    partitionable = True
+    PLANE_THICKNESS = 50
+    
+    def __init__(self, geometry: Geometry, rotation_cache: MH.RotationCache, speed: Real) -> None:
+        super().__init__()
+        if speed <= 0:
+            raise ValueError(f"random_plane needs a positive speed, got {speed}.")
+        self.geometry = geometry
+        self.rotation_cache = rotation_cache
+        self.speed = speed
+        
+        self.fade = FadeEngine(self.geometry.num_leds)
+        self.leds = None
+        self.hue = random.uniform(0.0, 1.0)
+        self.sweep = None
+        self._sweep_start = 0.0
+        self._last_height = None
+        self._stopping = False
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Starts the next sweep at 't'. Along the X axis of a random orientation, row 0 of the rotation
+                 matrix, only the LEDs inside the plane get touched each frame instead of checking all of them.
+    INPUT: t - Time the sweep starts at.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _next_sweep(self, t: Real) -> None:
+        if self.sweep is not None:
+            self.hue = CH.random_hue_away_from(self.hue)
+        self.sweep = self.geometry.spatial_index.sweep(self.rotation_cache.random()[0])
+        self._sweep_start = t
+        self._last_height = None
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Paints the plane wherever it is at 't' and fades everything by 'dt'. If the plane moved further than
+                 its own thickness since the last frame (ie. dropped frames) we paint everything it passed through
+                 so the trail never has gaps.
+    INPUT: See 'Renderer.render'.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def render(self, t: Real, dt: Real, out: np.ndarray) -> None:
+        if not self._stopping:
+            if self.sweep is None \
+                    or (height := self.sweep.min + self.speed * (t - self._sweep_start)) >= self.sweep.max:
+                self._next_sweep(t)
+                height = self.sweep.min
+            
+            low = height if self._last_height is None else min(height, self._last_height + self.PLANE_THICKNESS)
+            where = self.sweep.slab(low, height + self.PLANE_THICKNESS)
+            if self.leds is not None:
+                where = where[(where >= self.leds.start) & (where < self.leds.stop)] - self.leds.start
+            self.fade.paint(where, (self.hue, 1.0, 1.0), sat_val=1.0, val_val=1.0)
+            self._last_height = height
+        
+        self.fade.step(out=out, dt=dt)
+        if self._stopping:
+            self.done = not self.fade.is_lit()
+    
+    def stop(self) -> None:
+        self._stopping = True
+        self.done = not self.fade.is_lit()
+    
+    def restrict(self, start: int, stop: int) -> None:
+        self.leds = slice(start, stop)
+        self.fade = FadeEngine(stop - start)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Shows whatever frames 'receiver' has ready (see 'Ddp_Stream.py'), repeating the last one whenever nothing
+             new came in. Runs until it's stopped, the receiver is closed along with us.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class StreamRenderer(Renderer):
+    cheap = True
+    
+    def __init__(self, receiver: DDPReceiver) -> None:
+        super().__init__()
+        self.receiver = receiver
+    
+    def render(self, t: Real, dt: Real, out: np.ndarray) -> None:
+        self.receiver.read(out)
+    
+    def close(self) -> None:
+        self.receiver.close()
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -11,7 +11,7 @@
 import sys
 import time
 
-from Coords import coordinates
+from Geometry import tree_geometry
 from Led_Controller import LEDController
 from helpers.Settings import Settings
 
@@ -22,15 +22,15 @@ INPUT: NA
 OUTPUT: NA
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 def one_led():
-    led_controller = LEDController()
-    pixel_data = [(0, 0, 0)] * Settings.NUM_LEDS
-    led_controller.update_leds(pixel_data)
-    
-    for cur_led in range(Settings.NUM_LEDS):
+    with LEDController() as led_controller:
         pixel_data = [(0, 0, 0)] * Settings.NUM_LEDS
-        pixel_data[cur_led] = (255, 255, 255)
         led_controller.update_leds(pixel_data)
-        input(f"LED: {cur_led} Press Enter to continue...")
+    
+        for cur_led in range(Settings.NUM_LEDS):
+            pixel_data = [(0, 0, 0)] * Settings.NUM_LEDS
+            pixel_data[cur_led] = (255, 255, 255)
+            led_controller.update_leds(pixel_data)
+            input(f"LED: {cur_led} Press Enter to continue...")
 
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
@@ -40,21 +40,19 @@ INPUT: axis - XYZ (0, 1, or 2) axis we will itterate over and show LEDs that int
 OUTPUT: NA
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 def slide_grid(axis=0, width=50):
-    led_controller = LEDController()
-    pixel_data = [(0, 0, 0)] * Settings.NUM_LEDS
-    led_controller.update_leds(pixel_data)
+    with LEDController() as led_controller:
+        pixel_data = [(0, 0, 0)] * Settings.NUM_LEDS
+        led_controller.update_leds(pixel_data)
 
-    axis_coords = [coord[axis] for coord in coordinates]
-    min_val, max_val = min(axis_coords), max(axis_coords)
+        min_val, max_val = tree_geometry.min_and_max[axis]
 
-    for val in range(min_val, max_val, width):
-        pixel_data = [(0, 0, 0)] * Settings.NUM_LEDS
-        for led in range(Settings.NUM_LEDS):
-            if coordinates[led][axis] >= val and coordinates[led][axis] <= val + width:
+        for val in range(int(min_val), int(max_val), width):
+            pixel_data = [(0, 0, 0)] * Settings.NUM_LEDS
+            for led in sorted(tree_geometry.spatial_index.slab(axis, val, val + width, inclusive=True).tolist()):
                 print(f"{led}: {val}")
                 pixel_data[led] = (0, 0, 255)
-        led_controller.update_leds(pixel_data)
-        input(f"Showing {val}-{val+width}...")
+            led_controller.update_leds(pixel_data)
+            input(f"Showing {val}-{val+width}...")
 
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
@@ -66,16 +64,16 @@ INPUT: starting_index - Which LED index we will start displaying from.
 OUTPUT: NA
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 def find_bad_led(starting_index, ending_index, step):
-    led_controller = LEDController()
-    pixel_data = [(0, 0, 0)] * Settings.NUM_LEDS
-    led_controller.update_leds(pixel_data)
-
-    for val in range(starting_index, ending_index, step):
+    with LEDController() as led_controller:
         pixel_data = [(0, 0, 0)] * Settings.NUM_LEDS
-        for led in range(val, val+step):
-            pixel_data[led] = (0, 0, 255)
         led_controller.update_leds(pixel_data)
-        input(f"Showing {val}-{val+step}...")
+
+        for val in range(starting_index, ending_index, step):
+            pixel_data = [(0, 0, 0)] * Settings.NUM_LEDS
+            for led in range(val, val+step):
+                pixel_data[led] = (0, 0, 255)
+            led_controller.update_leds(pixel_data)
+            input(f"Showing {val}-{val+step}...")
     
 
 def main():
@@ -0,0 +1,162 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    SPATIAL INDEX                            CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Spatial index over our LED coordinates for "which LEDs are in this region" style questions. Scanning every pixel in
+#   Python for each query is fine at 650 LEDs but falls apart once we add more strands, here each query only costs in
+#   proportion to the LEDs it actually touches.
+#
+#   Slabs   - Every axis keeps its own sorted order so a slab is two binary searches and a slice. Slabs along any 
+#             other direction go through a 'SlabSweep', built once per direction and then queried per step.
+#   Regions - Boxes, spheres, and k nearest neighbors go through a uniform voxel grid. Points are sorted by voxel so 
+#             each row of voxels in a query is one contiguous slice of indices.
+#
+# Every query returns an array of LED indices. Build one through 'Geometry.spatial_index' rather than directly so it
+#   is shared between all of our effects.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import numpy as np
+from numbers import Real
+
+from helpers.Settings import Settings
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Sorted projection of our points onto a single direction, built once and then queried for any number of
+             slabs along that direction. ie. a plane sweeping across the tree.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class SlabSweep:
+    
+    def __init__(self, values: np.ndarray) -> None:
+        self.order = np.argsort(values, kind='stable')
+        self.sorted_values = np.asarray(values)[self.order]
+        self.min = float(self.sorted_values[0]) if len(self.sorted_values) else 0.0
+        self.max = float(self.sorted_values[-1]) if len(self.sorted_values) else 0.0
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Finds every point whose projection falls within [lo, hi), or [lo, hi] if 'inclusive'.
+    INPUT: lo - Lower bound of our slab.
+           hi - Upper bound of our slab.
+           inclusive - Whether points sitting exactly on 'hi' are included.
+    OUTPUT: Array of LED indices in the slab, in order of their projection.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def slab(self, lo: Real, hi: Real, inclusive: bool=False) -> np.ndarray:
+        start = np.searchsorted(self.sorted_values, lo, side='left')
+        end = np.searchsorted(self.sorted_values, hi, side='right' if inclusive else 'left')
+        return self.order[start:end]
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Uniform voxel grid plus per axis sorted orders over a fixed set of points.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class SpatialIndex:
+    
+    def __init__(self, points: np.ndarray, cell_size: Real=Settings.SPATIAL_INDEX_CELL_SIZE) -> None:
+        self.points = np.asarray(points, dtype=np.float32)
+        self.cell_size = float(cell_size)
+        self.axis_sweeps = tuple(SlabSweep(self.points[:, axis]) for axis in range(3))
+        
+        # Voxel grid, cell (i, j, k) has linear key (i * dims[1] + j) * dims[2] + k.
+        self.origin = self.points.min(axis=0)
+        self.dims = (np.floor((self.points.max(axis=0) - self.origin) / self.cell_size).astype(np.intp) + 1)
+        keys = self._cell_keys(self._cells_of(self.points))
+        self.cell_order = np.argsort(keys, kind='stable')
+        self.cell_starts = np.searchsorted(keys[self.cell_order], np.arange(np.prod(self.dims) + 1))
+    
+    def _cells_of(self, points: np.ndarray) -> np.ndarray:
+        cells = np.floor((np.asarray(points) - self.origin) / self.cell_size).astype(np.intp)
+        return np.clip(cells, 0, self.dims - 1)
+    
+    def _cell_keys(self, cells: np.ndarray) -> np.ndarray:
+        return (cells[..., 0] * self.dims[1] + cells[..., 1]) * self.dims[2] + cells[..., 2]
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Finds every point in [lo, hi) (or [lo, hi] if 'inclusive') along the given 'axis'.
+    INPUT: axis - X, Y, or Z (0, 1, 2), which axis our slab is across.
+           lo - Lower bound of our slab.
+           hi - Upper bound of our slab.
+           inclusive - Whether points sitting exactly on 'hi' are included.
+    OUTPUT: Array of LED indices in the slab, in order along 'axis'.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def slab(self, axis: int, lo: Real, hi: Real, inclusive: bool=False) -> np.ndarray:
+        return self.axis_sweeps[axis].slab(lo, hi, inclusive)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Builds a 'SlabSweep' along any 'direction'. Costs one sort, after that every slab is O(log N).
+    INPUT: direction - XYZ vector to sweep along, does not need to be normalized but slab bounds are then in units of
+                       its length.
+    OUTPUT: SlabSweep along 'direction'.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def sweep(self, direction: np.ndarray) -> SlabSweep:
+        return SlabSweep(self.points @ np.asarray(direction, dtype=np.float32))
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs every point in every voxel overlapping the box [lo, hi]. A superset of the points actually 
+                 inside the box that callers then filter exactly.
+    INPUT: lo - XYZ min corner.
+           hi - XYZ max corner.
+    OUTPUT: Array of candidate LED indices.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _candidates(self, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        if np.any(np.asarray(hi) < self.origin) or np.any(np.asarray(lo) > self.points.max(axis=0)):
+            return np.empty(0, dtype=np.intp)
+        
+        cell_lo, cell_hi = self._cells_of(lo), self._cells_of(hi)
+        slices = []
+        for i in range(cell_lo[0], cell_hi[0] + 1):
+            for j in range(cell_lo[1], cell_hi[1] + 1):
+                # Along 'k' the keys are consecutive so the whole row is one slice.
+                start = self.cell_starts[self._cell_keys(np.array((i, j, cell_lo[2])))]
+                end = self.cell_starts[self._cell_keys(np.array((i, j, cell_hi[2]))) + 1]
+                slices.append(self.cell_order[start:end])
+        return np.concatenate(slices) if slices else np.empty(0, dtype=np.intp)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Finds every point inside the axis aligned box [lo, hi].
+    INPUT: lo - XYZ min corner.
+           hi - XYZ max corner.
+    OUTPUT: Array of LED indices in the box.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def box(self, lo: tuple[Real, Real, Real], hi: tuple[Real, Real, Real]) -> np.ndarray:
+        candidates = self._candidates(lo, hi)
+        points = self.points[candidates]
+        return candidates[np.all((points >= lo) & (points <= hi), axis=1)]
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Finds every point within 'radius' of 'center'.
+    INPUT: center - XYZ center of our sphere.
+           radius - Radius of our sphere.
+    OUTPUT: Array of LED indices in the sphere.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def sphere(self, center: tuple[Real, Real, Real], radius: Real) -> np.ndarray:
+        center = np.asarray(center, dtype=np.float32)
+        candidates = self._candidates(center - radius, center + radius)
+        dist_sq = np.sum((self.points[candidates] - center) ** 2, axis=1)
+        return candidates[dist_sq <= radius * radius]
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Finds the 'k' points closest to 'point'. We search a box around 'point' that doubles in size until it
+                 holds 'k' points that are closer than anything outside of it could possibly be.
+    INPUT: point - XYZ point to search around.
+           k - Number of neighbors to find.
+    OUTPUT: Array of up to 'k' LED indices, closest first.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def nearest(self, point: tuple[Real, Real, Real], k: int=1) -> np.ndarray:
+        point = np.asarray(point, dtype=np.float32)
+        k = min(k, len(self.points))
+        radius = self.cell_size
+        while True:
+            candidates = self._candidates(point - radius, point + radius)
+            dist_sq = np.sum((self.points[candidates] - point) ** 2, axis=1)
+            inside = dist_sq <= radius * radius
+            if np.count_nonzero(inside) >= k or len(candidates) == len(self.points):
+                break
+            radius *= 2
+        
+        closest = np.argsort(dist_sq, kind='stable')[:k]
+        return candidates[closest]
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
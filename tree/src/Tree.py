@@ -9,23 +9,31 @@
 # This file defines what we effects we actually want to run on the Christmas Tree and for how long. 
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 import sys
-import time
+
 from Effects import LEDEffects
+from Playlist import PlaylistEntry, PlaylistPlayer, load_playlist
+
+# Our default show, any JSON playlist passed on the command line replaces it (see 'Playlist.py').
+DEFAULT_PLAYLIST = (PlaylistEntry('radial_rainbow', 2, (0, 175, 1.0))
+                    , PlaylistEntry('radial_rainbow', 2, (0, -175, 1.0))
+                    , PlaylistEntry('radial_rainbow', 5, (1, 175, 1.0))
+                    , PlaylistEntry('radial_rainbow', 5, (2, 175, 0.5))
+                    , PlaylistEntry('random_plane', 10, (210,))
+                    , PlaylistEntry('axis_rainbow', 2, (0, -0.3, 0.5))
+                    , PlaylistEntry('axis_rainbow', 2, (0, 0.3, 0.5))
+                    , PlaylistEntry('axis_rainbow', 2, (1, -0.3, 0.5))
+                    , PlaylistEntry('axis_rainbow', 2, (1, 0.3, 0.5))
+                    , PlaylistEntry('axis_rainbow', 2, (2, -0.3, 0.5))
+                    , PlaylistEntry('axis_rainbow', 2, (2, 0.3, 0.5)))
 
 def main():
     led_effects = LEDEffects()
-    while True:
-        led_effects.run_effect_for_x_seconds(led_effects.radial_rainbow, duration=2, args=(0, 5, 1.0))
-        led_effects.run_effect_for_x_seconds(led_effects.radial_rainbow, duration=2, args=(0, -5, 1.0))
-        led_effects.run_effect_for_x_seconds(led_effects.radial_rainbow, duration=5, args=(1, 5, 1.0))
-        led_effects.run_effect_for_x_seconds(led_effects.radial_rainbow, duration=5, args=(2, 5, 0.5))
-        led_effects.run_effect_for_x_seconds(led_effects.random_plane, duration=10, args=(6,))
-        led_effects.run_effect_for_x_seconds(led_effects.axis_rainbow, duration=2, args=(0, -0.01, 0.5))
-        led_effects.run_effect_for_x_seconds(led_effects.axis_rainbow, duration=2, args=(0, 0.01, 0.5))
-        led_effects.run_effect_for_x_seconds(led_effects.axis_rainbow, duration=2, args=(1, -0.01, 0.5))
-        led_effects.run_effect_for_x_seconds(led_effects.axis_rainbow, duration=2, args=(1, 0.01, 0.5))
-        led_effects.run_effect_for_x_seconds(led_effects.axis_rainbow, duration=2, args=(2, -0.01, 0.5))
-        led_effects.run_effect_for_x_seconds(led_effects.axis_rainbow, duration=2, args=(2, 0.01, 0.5))
+    led_effects.install_timing_dump_signal()
+    playlist = load_playlist(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PLAYLIST
+    try:
+        PlaylistPlayer(led_effects, playlist).run()
+    finally:
+        led_effects.close()
         
 
 if __name__ == "__main__":
@@ -7,9 +7,12 @@
 # ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
 # ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
 # Various color helpers to do things like hue -> RGB conversions, gamma correction, and many others.
+#
+# Most helpers come in two flavors, a scalar one for a single color and an '_array' one that works on a whole (N, 3)
+#   frame at once. Effects should stick to the array versions, the scalar ones are just thin wrappers around them.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
-import colorsys
-import math
+import functools
+import numpy as np
 import random
 from numbers import Real
 
@@ -20,16 +23,58 @@ DESCRIPTION: Generates a gamma corrected table for RGB values. The format is a 2
              So you just look up each RGB value individually. ie. (100, 200, 1) gamma corrected would take the 100th
              element [0] for red, the 200th element [1] for blue, and the 1st element [2] for green. Giving you an RGB
              tuple that is gamma corrected according to our gamma correction values.
-INPUT: NA
+INPUT: gamma - Optional (R, G, B) gamma values to build the table for, defaults to the ones in Settings.
 OUTPUT: RGB lookup table to gamma correct any int rgb tuple.
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
-def generate_combined_rgb_lookup() -> list[tuple[Real, Real, Real]]:
-    return [(int((i / 255.0) ** Settings.GAMMA_RED * 255)
-             , int((i / 255.0) ** Settings.GAMMA_GREEN * 255)
-             , int((i / 255.0) ** Settings.GAMMA_BLUE * 255))
+def generate_combined_rgb_lookup(gamma: tuple[float, float, float]=None) -> list[tuple[Real, Real, Real]]:
+    gamma_red, gamma_green, gamma_blue = gamma if gamma is not None \
+        else (Settings.GAMMA_RED, Settings.GAMMA_GREEN, Settings.GAMMA_BLUE)
+    return [(int((i / 255.0) ** gamma_red * 255)
+             , int((i / 255.0) ** gamma_green * 255)
+             , int((i / 255.0) ** gamma_blue * 255))
             for i in range(256)]
 
 
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Generates a palette of fully saturated, full value hues that are already gamma corrected. Index 'i' of
+             the palette holds the color for hue 'i / resolution'. Rainbow style effects only ever use these colors so
+             they can turn a whole frame of hues into RGB with a single gather. Palettes are cached per resolution and
+             gamma setting and are read only since every caller shares the same array.
+INPUT: resolution - Number of entries in the palette, ie. how many steps the full hue circle is split into.
+       gamma - Optional (R, G, B) gamma values to build the palette for, defaults to the ones in Settings.
+OUTPUT: (resolution, 3) uint8 array of gamma corrected RGB (0->255) values.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+@functools.lru_cache(maxsize=None)
+def generate_hue_palette(resolution: int=Settings.HUE_PALETTE_SIZE
+                         , gamma: tuple[float, float, float]=None) -> np.ndarray:
+    lookup = np.array(generate_combined_rgb_lookup(gamma), dtype=np.uint8)
+    palette = lookup[hue_to_rgb_array(np.arange(resolution) / resolution), _CHANNELS]
+    palette.flags.writeable = False
+    return palette
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Grabs the cached hue palette for our current Settings gamma values.
+INPUT: fine - Use the 'HUE_PALETTE_FINE_SIZE' palette instead, handy for smooth gradients and slow fades.
+OUTPUT: (resolution, 3) uint8 array of gamma corrected RGB (0->255) values.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def get_hue_palette(fine: bool=False) -> np.ndarray:
+    return generate_hue_palette(Settings.HUE_PALETTE_FINE_SIZE if fine else Settings.HUE_PALETTE_SIZE)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Turns a frame of normalized hues into gamma corrected RGB values with one lookup into 'palette'.
+INPUT: hues - Array of normalized (0.0->1.0) hues, values outside of that range are wrapped.
+       palette - Hue palette from 'generate_hue_palette' to look our colors up in.
+       out - Optional (N, 3) uint8 array to write our colors into instead of allocating a new one.
+OUTPUT: (N, 3) uint8 array of gamma corrected RGB (0->255) values.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def hue_palette_lookup(hues: np.ndarray, palette: np.ndarray, out: np.ndarray=None) -> np.ndarray:
+    indices = (np.asarray(hues) % 1.0 * len(palette)).astype(np.intp)
+    indices %= len(palette)  # Float rounding can land a hue just under 1.0 on 'len(palette)'.
+    return np.take(palette, indices, axis=0, out=out)
+
+
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Takes a given 'hsv' or 'rgb' value and returns the gamma corrected RGB value.
 INPUT: hsv - Tuple of Normalized (0.0->1.0) HSV values.
@@ -40,12 +85,8 @@ def gamma_correct(hsv: tuple[float, float, float]=None, rgb: tuple[int, int, int
     if hsv is None and rgb is None:
         raise ValueError("Either 'hsv' or 'rgb' must be provided.")
     
-    res_rgb = rgb
-    if hsv is not None:
-        r, g, b = colorsys.hsv_to_rgb(*hsv)
-        res_rgb = (int(r * 255), int(g * 255), int(b * 255))
-
-    return tuple(rgb_lookup_table[int(channel)][idx] for idx, channel in enumerate(res_rgb))
+    res_rgb = hsv_to_rgb_array(np.array((hsv,))) if hsv is not None else np.array((rgb,), dtype=np.intp)
+    return tuple(int(channel) for channel in gamma_correct_array(res_rgb)[0])
 
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
@@ -60,30 +101,10 @@ OUTPUT: Tuple of blended normalized HSV value.
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 def blend_hsv(hsv1: tuple[float, float, float], hsv2: tuple[float, float, float]
               , sat_val: float=None, val_val: float=None) -> tuple[float, float, float]:
-    h1, s1, v1 = hsv1
-    h2, s2, v2 = hsv2
-    
-    # Compute weights based on brightness
-    total_value = v1 + v2
-    if total_value == 0:
+    if hsv1[2] + hsv2[2] == 0:
         return hsv1  # Avoid division by zero; return first color if both are black.
-
-    weight1 = v1 / total_value
-    weight2 = v2 / total_value
-
-    # Convert hues to radians and calculate weighted circular mean
-    h1_rad = h1 * 2 * math.pi
-    h2_rad = h2 * 2 * math.pi
-    avg_hue_rad = math.atan2(weight1 * math.sin(h1_rad) + weight2 * math.sin(h2_rad)
-                           , weight1 * math.cos(h1_rad) + weight2 * math.cos(h2_rad))
     
-    avg_hue = avg_hue_rad / (2 * math.pi) % 1.0  # Normalize to 0-1 range
-
-    # Calculate weighted averages for saturation and value, using optional overrides
-    avg_saturation = sat_val if sat_val is not None else s1 * weight1 + s2 * weight2
-    avg_value = val_val if val_val is not None else v1 * weight1 + v2 * weight2
-
-    return avg_hue, avg_saturation, avg_value
+    return tuple(float(channel) for channel in blend_hsv_array(np.array((hsv1,)), hsv2, sat_val, val_val)[0])
 
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
@@ -108,8 +129,149 @@ def random_hue_away_from(hue: float, min_distance: float=0.1) -> float:
     return rand_hue
 
 
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Vectorized version of 'colorsys.hsv_to_rgb' for fully saturated, full value hues, see
+             'hsv_to_rgb_array'.
+INPUT: hues - Array of normalized (0.0->1.0) hues, values outside of that range are wrapped.
+OUTPUT: (N, 3) uint8 array of RGB (0->255) values.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def hue_to_rgb_array(hues: np.ndarray) -> np.ndarray:
+    hues = np.asarray(hues, dtype=np.float64)
+    return hsv_to_rgb_array(np.stack((hues, np.ones_like(hues), np.ones_like(hues)), axis=1))
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Array version of 'gamma_correct' for RGB values. Does a single gather from our lookup table instead of
+             indexing it once per channel per pixel.
+INPUT: rgb - (N, 3) array of int (0->255) RGB values.
+       out - Optional (N, 3) uint8 array to write into, can be 'rgb' itself to gamma correct in place.
+OUTPUT: (N, 3) uint8 array of gamma corrected RGB (0->255) values.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def gamma_correct_array(rgb: np.ndarray, out: np.ndarray=None) -> np.ndarray:
+    if out is None:
+        return rgb_lookup_array[rgb, _CHANNELS]
+    for channel in range(3):
+        np.take(rgb_lookup_array[:, channel], rgb[:, channel], out=out[:, channel])
+    return out
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Vectorized version of 'colorsys.hsv_to_rgb' for any saturation and value. Every pixel picks its hue
+             sector's (v, q, t, p) terms with a single gather so the whole frame is computed without a Python loop.
+             The terms are built with the exact same float64 operations 'colorsys' uses and truncated the same way
+             'gamma_correct' does, so results match the scalar path bit for bit.
+INPUT: hsv - (N, 3) array of normalized (0.0->1.0) HSV values, hues outside of that range are wrapped.
+       out - Optional (N, 3) uint8 array to write into instead of allocating a new one.
+OUTPUT: (N, 3) uint8 array of RGB (0->255) values.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def hsv_to_rgb_array(hsv: np.ndarray, out: np.ndarray=None) -> np.ndarray:
+    hsv = np.asarray(hsv, dtype=np.float64)
+    sat, val = hsv[:, 1], hsv[:, 2]
+    hue_6 = hsv[:, 0] % 1.0 * 6.0
+    sector = hue_6.astype(np.intp)
+    frac = hue_6 - sector
+    sector %= 6  # A hue just under 1.0 can round up to 6.0, 'colorsys' wraps that back to sector 0 the same way.
+    terms = np.stack((val, val * (1.0 - sat * frac), val * (1.0 - sat * (1.0 - frac)), val * (1.0 - sat)), axis=1)
+    rgb = np.take_along_axis(terms, _HSV_SECTORS[sector], axis=1)
+    rgb *= 255
+    if out is None:
+        return rgb.astype(np.uint8)
+    np.copyto(out, rgb, casting='unsafe')
+    return out
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Vectorized version of 'colorsys.rgb_to_hsv'.
+INPUT: rgb - (N, 3) array of int (0->255) RGB values.
+       out - Optional (N, 3) float32 array to write into instead of allocating a new one.
+OUTPUT: (N, 3) float32 array of normalized (0.0->1.0) HSV values.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def rgb_to_hsv_array(rgb: np.ndarray, out: np.ndarray=None) -> np.ndarray:
+    rgb = np.asarray(rgb, dtype=np.float32) / 255.0
+    out = np.empty_like(rgb) if out is None else out
+    max_c = rgb.max(axis=1)
+    delta = max_c - rgb.min(axis=1)
+    gray = delta == 0
+    
+    # How far each channel is from the max, (max - c) / delta, gray pixels have no hue so we just leave them at 0.
+    dist = np.divide(max_c[:, np.newaxis] - rgb, delta[:, np.newaxis], out=np.zeros_like(rgb)
+                     , where=~gray[:, np.newaxis])
+    red, green, blue = dist[:, 0], dist[:, 1], dist[:, 2]
+    hue = np.where(rgb[:, 0] == max_c, blue - green
+                   , np.where(rgb[:, 1] == max_c, 2.0 + red - blue, 4.0 + green - red))
+    
+    out[:, 0] = np.where(gray, 0.0, hue / 6.0 % 1.0)
+    np.divide(delta, max_c, out=out[:, 1], where=max_c > 0)
+    out[max_c == 0, 1] = 0.0
+    out[:, 2] = max_c
+    return out
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Array version of 'blend_hsv'. Blends every row of 'hsv1' with 'hsv2', hues are averaged on the circle
+             weighted by each color's value. Rows where both colors are black are left as 'hsv1'.
+INPUT: hsv1 - (N, 3) array of normalized HSV values we will be blending.
+       hsv2 - (N, 3) array or single normalized HSV value we will be blending in.
+       sat_val - Saturation value we can supply if we wish to disregard averaging the 'hsv1' and 'hsv2' values.
+       val_val - Value value we can supply if we wish to disregard averaging the 'hsv1' and 'hsv2' values.
+       out - Optional (N, 3) float array to write into, can be 'hsv1' itself to blend in place.
+OUTPUT: (N, 3) float64 array of blended normalized HSV values, or 'out' if one was given.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def blend_hsv_array(hsv1: np.ndarray, hsv2: np.ndarray, sat_val: float=None, val_val: float=None
+                    , out: np.ndarray=None) -> np.ndarray:
+    hsv1 = np.asarray(hsv1, dtype=np.float64)
+    hsv2 = np.broadcast_to(np.asarray(hsv2, dtype=np.float64), hsv1.shape)
+    out = np.empty_like(hsv1) if out is None else out
+    
+    total_value = hsv1[:, 2] + hsv2[:, 2]
+    black = total_value == 0
+    weight1 = np.divide(hsv1[:, 2], total_value, out=np.ones_like(total_value), where=~black)
+    weight2 = np.divide(hsv2[:, 2], total_value, out=np.zeros_like(total_value), where=~black)
+    
+    h1_rad = hsv1[:, 0] * (2 * np.pi)
+    h2_rad = hsv2[:, 0] * (2 * np.pi)
+    avg_hue_rad = np.arctan2(weight1 * np.sin(h1_rad) + weight2 * np.sin(h2_rad)
+                             , weight1 * np.cos(h1_rad) + weight2 * np.cos(h2_rad))
+    
+    # Everything reads from 'hsv1' before we write so 'out' is free to be 'hsv1'.
+    black_hsv = hsv1[black]
+    sat = sat_val if sat_val is not None else hsv1[:, 1] * weight1 + hsv2[:, 1] * weight2
+    val = val_val if val_val is not None else hsv1[:, 2] * weight1 + hsv2[:, 2] * weight2
+    out[:, 0] = avg_hue_rad / (2 * np.pi) % 1.0
+    out[:, 1] = sat
+    out[:, 2] = val
+    out[black] = black_hsv
+    return out
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Linear blend between two RGB frames, ie. one step of a crossfade. Done in 8 bit fixed point so a whole
+             frame is just a couple of integer multiplies.
+INPUT: rgb1 - (N, 3) uint8 array we are blending from.
+       rgb2 - (N, 3) uint8 array we are blending to.
+       alpha - How far (0.0->1.0) we are from 'rgb1' to 'rgb2'.
+       out - Optional (N, 3) uint8 array to write into, can be either input.
+OUTPUT: (N, 3) uint8 array of blended RGB values.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def blend_rgb_array(rgb1: np.ndarray, rgb2: np.ndarray, alpha: float, out: np.ndarray=None) -> np.ndarray:
+    weight = int(round(min(max(alpha, 0.0), 1.0) * 256))
+    mix = np.asarray(rgb1).astype(np.uint16) * np.uint16(256 - weight)
+    mix += np.asarray(rgb2).astype(np.uint16) * np.uint16(weight)
+    mix >>= 8
+    if out is None:
+        return mix.astype(np.uint8)
+    np.copyto(out, mix, casting='unsafe')
+    return out
+
+
 # Generate Lookup Tables On Startup
 rgb_lookup_table = generate_combined_rgb_lookup()
+rgb_lookup_array = np.array(rgb_lookup_table, dtype=np.uint8)
+_CHANNELS = np.arange(3)
+# Which of the (v, q, t, p) terms feeds R, G and B in each of the six hue sectors, same table as 'colorsys'.
+_HSV_SECTORS = np.array(((0, 2, 3), (1, 0, 3), (3, 0, 2), (3, 1, 0), (2, 3, 0), (0, 3, 1)), dtype=np.intp)
+hue_palette = get_hue_palette()
+hue_palette_fine = get_hue_palette(fine=True)
 
 
 # FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
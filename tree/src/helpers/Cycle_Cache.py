@@ -0,0 +1,183 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    CYCLE CACHE                              CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Cache of fully rendered animation cycles. A lot of our effects are strictly periodic, for the same args they render
+#   the exact same frames every single loop. Those effects can render one cycle into a contiguous (frames, N, 3) uint8
+#   array once and from then on just replay it, no per frame compute at all.
+#
+# The cache is limited to a memory budget and evicts the least recently used cycle once it's over. Optionally cycles
+#   are also saved into 'cache_dir' as '.npy' files so they survive a restart. It is thread safe so cycles can be
+#   rendered in the background while another effect is playing.
+#
+# Cycles are rendered a chunk of frames at a time so rendering one never takes much more memory than the cycle itself.
+#   A cycle that could never fit in the budget isn't rendered up front at all, it's handed back as a 'LazyCycle' that
+#   renders each frame as it's asked for.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import collections
+import hashlib
+import logging
+import math
+import numpy as np
+import os
+import threading
+
+from helpers.Settings import Settings
+
+RENDER_CHUNK_BYTES = 1 << 18    # Frames of a cycle we render in one go, keeps the renderer's float temporaries small.
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Renders a whole cycle into one contiguous array, 'RENDER_CHUNK_BYTES' worth of frames at a time.
+INPUT: num_frames - Number of frames in the cycle.
+       frame_shape - Shape of a single frame, ie. (N, 3).
+       render_frames - Function that renders the frames at an array of frame indices as a (len, N, 3) uint8 array.
+OUTPUT: (num_frames, N, 3) uint8 array of the cycle.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def render_cycle(num_frames: int, frame_shape: tuple[int, ...], render_frames) -> np.ndarray:
+    cycle = np.empty((num_frames, *frame_shape), dtype=np.uint8)
+    step = max(1, RENDER_CHUNK_BYTES // max(math.prod(frame_shape), 1))
+    for start in range(0, num_frames, step):
+        cycle[start:start + step] = render_frames(np.arange(start, min(start + step, num_frames)))
+    return cycle
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Stands in for a cycle too big to keep around, indexing it renders just that frame. Anything that only
+             ever indexes single frames of a cycle (ie. 'CycleRenderer') can use either one.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class LazyCycle:
+    
+    def __init__(self, num_frames: int, render_frames) -> None:
+        self.num_frames = num_frames
+        self.render_frames = render_frames
+    
+    def __len__(self) -> int:
+        return self.num_frames
+    
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self.render_frames(np.array((index,)))[0]
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: LRU cache of rendered cycles with a memory budget. Keys can be anything with a stable 'repr', normally
+             (effect name, args, ...). Cached cycles are read only since they are shared with every caller.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class CycleCache:
+    
+    def __init__(self, budget_bytes: int=Settings.CYCLE_CACHE_BUDGET_MB * 2**20
+                 , cache_dir: str | None=Settings.CYCLE_CACHE_DIR, logger: logging.Logger=None) -> None:
+        self.logger = logger if logger is not None else logging.getLogger()
+        self.budget_bytes = budget_bytes
+        self.cache_dir = cache_dir
+        self.cycles = collections.OrderedDict()
+        self.nbytes = 0
+        self.hits = self.misses = 0
+        self._lock = threading.RLock()
+    
+    def __contains__(self, key) -> bool:
+        return key in self.cycles
+    
+    def __len__(self) -> int:
+        return len(self.cycles)
+    
+    def _path(self, key) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(repr(key).encode()).hexdigest() + '.npy')
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs a cycle from memory, or from 'cache_dir' if it was saved by an earlier run.
+    INPUT: key - Key the cycle was stored under.
+    OUTPUT: (frames, N, 3) uint8 array, or 'None' if we don't have it.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get(self, key) -> np.ndarray:
+        with self._lock:
+            return self._get(key)
+    
+    def _get(self, key) -> np.ndarray:
+        if key in self.cycles:
+            self.cycles.move_to_end(key)
+            self.hits += 1
+            return self.cycles[key]
+        
+        if self.cache_dir is not None and os.path.exists(self._path(key)):
+            try:
+                cycle = np.load(self._path(key))
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Could not load cached cycle {key!r}, re-rendering. exception: {e}")
+            else:
+                self.hits += 1
+                return self._store(key, cycle)
+        
+        self.misses += 1
+        return None
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Adds a rendered cycle to our cache, and to 'cache_dir' if we have one.
+    INPUT: key - Key to store the cycle under.
+           cycle - (frames, N, 3) uint8 array of our rendered cycle.
+    OUTPUT: The cycle as stored (contiguous and read only).
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def put(self, key, cycle: np.ndarray) -> np.ndarray:
+        with self._lock:
+            cycle = self._store(key, cycle)
+            if self.cache_dir is not None:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                np.save(self._path(key), cycle)
+            return cycle
+    
+    def _store(self, key, cycle: np.ndarray) -> np.ndarray:
+        cycle = np.ascontiguousarray(cycle, dtype=np.uint8)
+        cycle.flags.writeable = False
+        if cycle.nbytes > self.budget_bytes:
+            return cycle  # Would never fit, just hand it back uncached.
+        
+        if key in self.cycles:
+            self.nbytes -= self.cycles.pop(key).nbytes
+        while self.cycles and self.nbytes + cycle.nbytes > self.budget_bytes:
+            _, evicted = self.cycles.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+        
+        self.cycles[key] = cycle
+        self.nbytes += cycle.nbytes
+        return cycle
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs a cycle, rendering and caching it first if we don't have it yet.
+    INPUT: key - Key of the cycle.
+           render - Function that renders the full cycle as a (frames, N, 3) uint8 array.
+    OUTPUT: (frames, N, 3) uint8 array of our cycle.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_or_render(self, key, render) -> np.ndarray:
+        cycle = self.get(key)
+        return cycle if cycle is not None else self.put(key, render())
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs a cycle, rendering it with 'render_cycle' and caching it first if we don't have it yet. A cycle
+                 bigger than our whole budget is never rendered up front, we hand back a 'LazyCycle' instead.
+    INPUT: key - Key of the cycle.
+           num_frames - Number of frames in the cycle.
+           frame_shape - Shape of a single frame, ie. (N, 3).
+           render_frames - Function that renders the frames at an array of frame indices, see 'render_cycle'.
+    OUTPUT: (frames, N, 3) uint8 array of our cycle, or a 'LazyCycle' of it.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_or_render_frames(self, key, num_frames: int, frame_shape: tuple[int, ...]
+                             , render_frames) -> np.ndarray | LazyCycle:
+        if num_frames * math.prod(frame_shape) > self.budget_bytes:
+            return LazyCycle(num_frames, render_frames)
+        return self.get_or_render(key, lambda: render_cycle(num_frames, frame_shape, render_frames))
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Drops every cycle from memory, anything saved in 'cache_dir' is left alone.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def clear(self) -> None:
+        with self._lock:
+            self.cycles.clear()
+            self.nbytes = 0
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -0,0 +1,110 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    FADE ENGINE                              CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Reusable decay engine for "trail" style effects. Every LED holds an HSV color, effects paint new colors in wherever
+#   they want and every frame each LED loses a random bit of brightness until it finally drops to black. How much is
+#   lost is defined per 1 / 'rate_hz' seconds, so given each frame's 'dt' the fade takes just as long at any frame rate.
+#
+# All of the state lives in one (N, 3) float32 array so painting, fading, and rendering are all whole array numpy ops,
+#   the cost per frame is the same whether one LED is lit or all of them.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import numpy as np
+
+import helpers.Color_Helpers as CH
+from helpers.Settings import Settings
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: HSV state of every LED plus the random fade applied to it every frame.
+             ie. fade.paint(indices, (hue, 1.0, 1.0)) then fade.step(out=frame) every frame.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class FadeEngine:
+    
+    def __init__(self, num_leds: int, decay_range: tuple[float, float]=Settings.FADE_DECAY_RANGE
+                 , threshold: float=Settings.FADE_THRESHOLD, rng: np.random.Generator=None
+                 , rate_hz: float=Settings.FADE_DECAY_RATE_HZ) -> None:
+        self.hsv = np.zeros((num_leds, 3), dtype=np.float32)
+        self.decay_range = decay_range
+        self.rate_hz = rate_hz
+        self.threshold = threshold
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self._decay = np.empty(num_leds, dtype=np.float32)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Paints 'hsv' onto the selected LEDs. LEDs that are still lit get 'hsv' blended into their current
+                 color (see 'CH.blend_hsv'), LEDs that have basically faded out just take 'hsv' as is.
+    INPUT: where - Index array or boolean mask of which LEDs to paint.
+           hsv - Normalized HSV value we are painting.
+           sat_val - Saturation override for blended LEDs, see 'CH.blend_hsv'.
+           val_val - Value override for blended LEDs, see 'CH.blend_hsv'.
+           lit_threshold - LEDs at or above this value are blended instead of overwritten.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def paint(self, where: np.ndarray, hsv: tuple[float, float, float], sat_val: float=None, val_val: float=None
+              , lit_threshold: float=0.01) -> None:
+        current = self.hsv[where]
+        blended = CH.blend_hsv_array(current, hsv, sat_val=sat_val, val_val=val_val)
+        blended[current[:, 2] < lit_threshold] = hsv
+        self.hsv[where] = blended
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Divides every LED's value by its own random factor within 'decay_range', scaled to however long
+                 'dt' is compared to one step of 'rate_hz'. LEDs that were already at or below our threshold are
+                 reset to black instead.
+    INPUT: dt - Seconds since our last decay, 'None' for exactly one step.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def decay(self, dt: float=None) -> None:
+        low, high = self.decay_range
+        self.rng.random(dtype=np.float32, out=self._decay)
+        self._decay *= high - low
+        self._decay += low
+        if dt is not None and dt * self.rate_hz != 1.0:
+            np.power(self._decay, dt * self.rate_hz, out=self._decay)
+        
+        faded = self.hsv[:, 2] <= self.threshold
+        self.hsv[:, 2] /= self._decay
+        self.hsv[faded] = 0.0
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Renders our current state into gamma corrected RGB.
+    INPUT: out - Optional (N, 3) uint8 array to write our frame into.
+    OUTPUT: (N, 3) uint8 array of gamma corrected RGB values.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def render(self, out: np.ndarray=None) -> np.ndarray:
+        out = np.empty(self.hsv.shape, dtype=np.uint8) if out is None else out
+        CH.hsv_to_rgb_array(self.hsv, out=out)
+        return CH.gamma_correct_array(out, out=out)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: One frame of our fade, decays then renders.
+    INPUT: out - Optional (N, 3) uint8 array to write our frame into.
+           dt - Seconds since the last frame, 'None' for exactly one step of 'rate_hz'.
+    OUTPUT: (N, 3) uint8 array of gamma corrected RGB values.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def step(self, out: np.ndarray=None, dt: float=None) -> np.ndarray:
+        self.decay(dt)
+        return self.render(out)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Whether any LED is still brighter than 'threshold', handy for fading everything out at the end.
+    INPUT: threshold - Value an LED must be above to count as lit.
+    OUTPUT: True if anything is still lit.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def is_lit(self, threshold: float=0.01) -> bool:
+        return bool(np.any(self.hsv[:, 2] > threshold))
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Turns every LED back to black.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def clear(self) -> None:
+        self.hsv.fill(0.0)
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
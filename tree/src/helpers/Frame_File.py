@@ -0,0 +1,212 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    FRAME FILES                              CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Compact binary file format for recorded frames and precompiled animations. A small fixed header followed by every
+#   frame back to back as raw (num_leds, 3) uint8 RGB values, so a file can be read back with 'np.memmap' and no
+#   decoding at all.
+#
+# Header (little endian) -
+#   magic       4s  - b'XMAS'
+#   version     H   - Format version, currently 2.
+#   header_size H   - Byte offset of the first frame, readers should always seek here rather than assume.
+#   num_leds    I   - Number of LEDs in every frame.
+#   fps         f   - Rate the frames were produced/ should be played at.
+#   frame_count Q   - Number of frames in the file, filled in when the writer is closed.
+#   loop_start  Q   - (v2) First frame of the part of the animation that repeats.
+#   loop_end    Q   - (v2) One past the last frame that repeats, 0 means the end of the file.
+#
+# Version 1 files (no loop points) are still read fine, they just loop the whole file. Files can be far bigger than
+#   our RAM, 'FrameFileReader' only ever maps a window of frames at a time.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import numpy as np
+import struct
+from numbers import Real
+
+from helpers.Settings import Settings
+
+FRAME_FILE_MAGIC = b'XMAS'
+FRAME_FILE_VERSION = 2
+FRAME_FILE_HEADER_V1 = struct.Struct('<4sHHIfQ')
+FRAME_FILE_HEADER = struct.Struct('<4sHHIfQQQ')
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Appends frames to a frame file. The frame count in the header is patched in on 'close' so a file that was
+             never closed can still be read, we just work out the count from the file size instead. Loop points
+             default to the whole file.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class FrameFileWriter:
+    
+    def __init__(self, path: str, num_leds: int, fps: Real, loop_start: int=0, loop_end: int=0) -> None:
+        self.path = path
+        self.num_leds = num_leds
+        self.fps = fps
+        self.frame_count = 0
+        self.loop_start = loop_start
+        self.loop_end = loop_end
+        
+        self._file = open(self.path, 'wb')
+        self._write_header()
+    
+    def _write_header(self) -> None:
+        self._file.seek(0)
+        self._file.write(FRAME_FILE_HEADER.pack(FRAME_FILE_MAGIC, FRAME_FILE_VERSION, FRAME_FILE_HEADER.size
+                                                , self.num_leds, self.fps, self.frame_count, self.loop_start
+                                                , self.loop_end))
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Appends a single frame to our file.
+    INPUT: frame - (num_leds, 3) uint8 RGB frame.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def write(self, frame: np.ndarray) -> None:
+        self._file.write(np.ascontiguousarray(frame, dtype=np.uint8).data)
+        self.frame_count += 1
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Fills in our final frame count and closes the file.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._write_header()
+        self._file.close()
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Reads just the header of a frame file.
+INPUT: path - Path to our frame file.
+OUTPUT: Dict of 'version', 'header_size', 'num_leds', 'fps', 'frame_count', 'loop_start', and 'loop_end'. Frame count
+        and loop end are always filled in, even for files that were never closed or have no loop points.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def read_frame_file_header(path: str) -> dict:
+    with open(path, 'rb') as file:
+        raw_header = file.read(FRAME_FILE_HEADER.size)
+        file.seek(0, 2)
+        file_size = file.tell()
+    
+    if raw_header[:4] != FRAME_FILE_MAGIC:
+        raise ValueError(f"'{path}' is not a frame file.")
+    
+    _, version, header_size, num_leds, fps, frame_count = \
+        FRAME_FILE_HEADER_V1.unpack(raw_header[:FRAME_FILE_HEADER_V1.size])
+    if version == 1:
+        loop_start = loop_end = 0
+    elif version == 2:
+        _, version, header_size, num_leds, fps, frame_count, loop_start, loop_end = FRAME_FILE_HEADER.unpack(raw_header)
+    else:
+        raise ValueError(f"'{path}' is frame file version {version}, we only understand up to {FRAME_FILE_VERSION}.")
+    
+    if frame_count == 0:
+        frame_count = (file_size - header_size) // (num_leds * 3)
+    
+    return {'version': version, 'header_size': header_size, 'num_leds': num_leds, 'fps': fps
+            , 'frame_count': frame_count, 'loop_start': min(loop_start, frame_count)
+            , 'loop_end': min(loop_end, frame_count) if loop_end else frame_count}
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Opens a frame file written by 'FrameFileWriter'. Frames are memory mapped, nothing is actually read until
+             you index into them. Maps the whole file at once, use 'FrameFileReader' for anything big.
+INPUT: path - Path to our frame file.
+OUTPUT: Tuple of (header dict, (frame_count, num_leds, 3) uint8 memmap of our frames).
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def read_frame_file(path: str) -> tuple[dict, np.ndarray]:
+    header = read_frame_file_header(path)
+    if header['frame_count'] == 0:
+        return header, np.zeros((0, header['num_leds'], 3), dtype=np.uint8)
+    return header, np.memmap(path, dtype=np.uint8, mode='r', offset=header['header_size']
+                             , shape=(header['frame_count'], header['num_leds'], 3))
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Random access reader for frame files of any size. Only a window of 'window_frames' frames is mapped at a
+             time, reading outside of it just maps the window holding that frame instead. Pages we've already played
+             can be dropped by the OS at any time so a file far bigger than RAM streams through without trouble.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class FrameFileReader:
+    
+    def __init__(self, path: str, window_frames: int=Settings.FRAME_FILE_WINDOW_FRAMES) -> None:
+        self.path = path
+        self.header = read_frame_file_header(path)
+        self.num_leds = self.header['num_leds']
+        self.fps = self.header['fps']
+        self.frame_count = self.header['frame_count']
+        self.loop_start = self.header['loop_start']
+        self.loop_end = self.header['loop_end']
+        self.window_frames = window_frames
+        
+        self._window = None
+        self._window_start = 0
+    
+    def __len__(self) -> int:
+        return self.frame_count
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Maps the window of frames that starts at 'start'.
+    INPUT: start - First frame of our window.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _map_window(self, start: int) -> None:
+        count = min(self.window_frames, self.frame_count - start)
+        self._window = np.memmap(self.path, dtype=np.uint8, mode='r'
+                                 , offset=self.header['header_size'] + start * self.num_leds * 3
+                                 , shape=(count, self.num_leds, 3))
+        self._window_start = start
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs frames [start, stop) without copying them. Never crosses into a second window so it may hand
+                 back fewer frames than asked for, just keep asking from where it left off.
+    INPUT: start - First frame we want.
+           stop - One past the last frame we want.
+    OUTPUT: (frames, num_leds, 3) uint8 read only view of at least 1 frame.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def frames(self, start: int, stop: int) -> np.ndarray:
+        if not 0 <= start < self.frame_count:
+            raise IndexError(f"Frame {start} is out of range for '{self.path}' ({self.frame_count} frames).")
+        
+        if self._window is None or not self._window_start <= start < self._window_start + len(self._window):
+            self._map_window(start)
+        offset = start - self._window_start
+        return self._window[offset:offset + min(stop, self.frame_count) - start]
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs a single frame without copying it.
+    INPUT: index - Which frame we want.
+    OUTPUT: (num_leds, 3) uint8 read only view of our frame.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self.frames(index, index + 1)[0]
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Walks through frames [start, stop) a window at a time.
+    INPUT: start - First frame we want.
+           stop - One past the last frame we want.
+    OUTPUT: Generator of (frames, num_leds, 3) uint8 views, together covering every frame in the range.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def iter_chunks(self, start: int, stop: int):
+        stop = min(stop, self.frame_count)
+        while start < stop:
+            chunk = self.frames(start, stop)
+            yield chunk
+            start += len(chunk)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Which frame is showing 'seconds' into the animation, handy for seeking by time.
+    INPUT: seconds - Time into the animation.
+    OUTPUT: Frame index, clamped to the file.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def frame_at(self, seconds: Real) -> int:
+        return max(0, min(int(seconds * self.fps), self.frame_count - 1))
+    
+    def close(self) -> None:
+        self._window = None
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -0,0 +1,241 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    FRAME RING BUFFER                        CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Fixed ring of preallocated frame slots living in 'multiprocessing.shared_memory'. It replaces sending every frame
+#   through a 'multiprocessing.Queue' which pickles each frame, pushes it through a pipe, and unpickles it again on the
+#   other side. Here the producer (our effects) writes pixels straight into a slot and the consumer (our LED writer
+#   process) reads them straight out of that same memory. Nothing is ever copied or serialized and memory usage is
+#   fixed at 'depth' frames no matter how far ahead the producer gets.
+#
+# Every frame gets a sequence number. Frame 'seq' always lives in slot 'seq % depth' and the slot header records
+#   which sequence number was last committed to it so the reader can always tell what it is looking at. The header
+#   also records when each slot was committed so the reader can tell how long a frame sat in the ring.
+#
+# What happens when the producer gets ahead of the reader is up to our backpressure policy -
+#   'block'       - Classic FIFO, the producer waits for a free slot. Nothing is ever lost but the tree can be up to
+#                   'depth' frames behind what the effect just rendered.
+#   'drop_oldest' - The producer never waits, if the ring is full the oldest unread frame is thrown away.
+#   'mailbox'     - Latest frame wins. The producer never waits and the reader always jumps straight to the newest
+#                   frame, skipping anything older. Lowest possible latency for live control.
+# Every frame lost to a policy is counted in 'stats' as 'frames_overwritten'.
+#
+# The producer can also 'flush' everything still waiting, ie. when switching effects so the frames left over from the
+#   old one never get shown. Those are counted as 'frames_flushed'.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import multiprocessing
+import numpy as np
+import time
+from multiprocessing import shared_memory
+
+from helpers.Frame_Stats import SharedCounters
+
+POLICY_BLOCK = 'block'
+POLICY_DROP_OLDEST = 'drop_oldest'
+POLICY_MAILBOX = 'mailbox'
+POLICIES = (POLICY_BLOCK, POLICY_DROP_OLDEST, POLICY_MAILBOX)
+
+RING_STAT_FIELDS = ('frames_committed', 'frames_overwritten', 'frames_flushed', 'producer_blocks')
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Single producer/ single consumer ring of (num_leds, 3) uint8 frames shared between processes.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class FrameRing:
+    
+    def __init__(self, depth: int, num_leds: int, policy: str=POLICY_BLOCK) -> None:
+        self.depth = depth
+        self.num_leds = num_leds
+        
+        header_size = 2 * self.depth * np.dtype(np.int64).itemsize
+        self._shm = shared_memory.SharedMemory(create=True, size=header_size + self.depth * self.num_leds * 3)
+        self._attach()
+        self.slot_seq[:] = -1
+        
+        self._cond = multiprocessing.Condition()
+        self._write_seq = multiprocessing.RawValue('Q', 0)
+        self._read_seq = multiprocessing.RawValue('Q', 0)
+        self._reading = multiprocessing.RawValue('b', False)
+        self._policy = multiprocessing.RawValue('b', 0)
+        self.stats = SharedCounters(RING_STAT_FIELDS)
+        self.set_policy(policy)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Builds our numpy views on top of the shared memory block. Nothing here copies any data.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _attach(self) -> None:
+        self.slot_seq = np.ndarray((self.depth,), dtype=np.int64, buffer=self._shm.buf)
+        self.slot_commit_ns = np.ndarray((self.depth,), dtype=np.int64, buffer=self._shm.buf
+                                         , offset=self.slot_seq.nbytes)
+        self.frames = np.ndarray((self.depth, self.num_leds, 3), dtype=np.uint8, buffer=self._shm.buf
+                                 , offset=2 * self.slot_seq.nbytes)
+
+    # Only used if a process is 'spawned' instead of forked, we re-attach to the same block by name.
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state['slot_seq'], state['slot_commit_ns'], state['frames']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._shm = shared_memory.SharedMemory(name=self._shm.name)
+        self._attach()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Number of committed frames the reader has not consumed yet.
+    INPUT: NA
+    OUTPUT: Number of frames waiting in the ring.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def pending(self) -> int:
+        return self._write_seq.value - self._read_seq.value
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Switches our backpressure policy, safe to call at any time from either process.
+    INPUT: policy - One of 'POLICIES'.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def set_policy(self, policy: str) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown backpressure policy '{policy}', expected one of {POLICIES}.")
+        with self._cond:
+            self._policy.value = POLICIES.index(policy)
+            self._cond.notify_all()
+    
+    @property
+    def policy(self) -> str:
+        return POLICIES[self._policy.value]
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Hands the producer the next free slot to draw its frame into. If the ring is full we either block or
+                 throw away the oldest unread frame depending on our policy. The frame is not visible to the reader
+                 until 'commit_write' is called.
+    INPUT: timeout - Max seconds to wait for a free slot, 'None' waits forever.
+    OUTPUT: (num_leds, 3) uint8 view of the slot, or 'None' if we timed out.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def acquire_write_slot(self, timeout: float=None) -> np.ndarray:
+        with self._cond:
+            if self.pending() >= self.depth:
+                if self.policy == POLICY_BLOCK:
+                    self.stats['producer_blocks'] += 1
+                    if not self._cond.wait_for(lambda: self.pending() < self.depth, timeout):
+                        return None
+                else:
+                    # The oldest frame might be mid read, that only takes microseconds so just wait it out.
+                    if not self._cond.wait_for(lambda: self.pending() < self.depth or not self._reading.value
+                                               , timeout):
+                        return None
+                    if self.pending() >= self.depth:
+                        self._read_seq.value += 1
+                        self.stats['frames_overwritten'] += 1
+            return self.frames[self._write_seq.value % self.depth]
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Publishes the slot handed out by 'acquire_write_slot' to the reader.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def commit_write(self) -> None:
+        with self._cond:
+            seq = self._write_seq.value
+            self.slot_seq[seq % self.depth] = seq
+            self.slot_commit_ns[seq % self.depth] = time.monotonic_ns()
+            self._write_seq.value = seq + 1
+            self.stats['frames_committed'] += 1
+            self._cond.notify_all()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Convenience for producers that already have a full frame, copies it into the next slot and commits.
+    INPUT: frame - Anything that broadcasts to a (num_leds, 3) uint8 array.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def put(self, frame) -> None:
+        self.acquire_write_slot()[...] = frame
+        self.commit_write()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Hands the reader the oldest committed frame, or the newest one in 'mailbox' mode. The slot stays
+                 owned by the reader, and can't be overwritten, until 'release_read' is called.
+    INPUT: timeout - Max seconds to wait for a frame, 'None' waits forever.
+    OUTPUT: (num_leds, 3) uint8 view of the slot, or 'None' if we timed out.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def acquire_read_slot(self, timeout: float=None) -> np.ndarray:
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.pending() > 0, timeout):
+                return None
+            if self.policy == POLICY_MAILBOX and self.pending() > 1:
+                skipped = self.pending() - 1
+                self._read_seq.value += skipped
+                self.stats['frames_overwritten'] += skipped
+            self._reading.value = True
+            return self.frames[self._read_seq.value % self.depth]
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Throws away every frame the reader hasn't gotten to yet. A frame mid read is left alone, we just wait
+                 it out, it only takes microseconds.
+    INPUT: NA
+    OUTPUT: Number of frames thrown away.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def flush(self) -> int:
+        with self._cond:
+            self._cond.wait_for(lambda: not self._reading.value)
+            flushed = self.pending()
+            self._read_seq.value += flushed
+            self.stats['frames_flushed'] += flushed
+            self._cond.notify_all()
+            return flushed
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Sequence number of the slot currently handed out by 'acquire_read_slot'.
+    INPUT: NA
+    OUTPUT: Sequence number of the frame being read.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def read_seq(self) -> int:
+        return self._read_seq.value
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Sequence number the next committed frame will get.
+    INPUT: NA
+    OUTPUT: Sequence number of the next frame to be written.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def write_seq(self) -> int:
+        return self._write_seq.value
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: When the slot currently handed out by 'acquire_read_slot' was committed.
+    INPUT: NA
+    OUTPUT: 'time.monotonic_ns' timestamp of the commit.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def read_commit_ns(self) -> int:
+        return int(self.slot_commit_ns[self._read_seq.value % self.depth])
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Gives the slot handed out by 'acquire_read_slot' back to the producer.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def release_read(self) -> None:
+        with self._cond:
+            self._read_seq.value += 1
+            self._reading.value = False
+            self._cond.notify_all()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Releases our handle on the shared memory. The owner should also call 'unlink' once every process is
+                 done with it so the block is actually freed.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def close(self) -> None:
+        del self.slot_seq, self.slot_commit_ns, self.frames
+        self._shm.close()
+
+    def unlink(self) -> None:
+        self._shm.unlink()
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -0,0 +1,132 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    FRAME SCHEDULER                          CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Paces our LED writer against absolute deadlines on the monotonic clock. Frame 'n' is always due at
+#   'start + n * interval' so small sleep overshoots never add up into drift over long runs, and wall clock changes
+#   (NTP, daylight savings, etc.) can't affect us at all. 
+#
+# If we fall a little behind we simply show the next frames straight away until we've caught back up to the
+#   schedule. If we fall more than 'max_catch_up' frames behind we give up on those deadlines, count them as dropped,
+#   and carry on with the next one. Waits can optionally finish with a short busy spin since 'time.sleep' on the Pi
+#   tends to overshoot by a good fraction of a millisecond.
+#
+# All of the counters, jitter samples, and our next deadline live in shared memory so the main process can read them
+#   at any time while the scheduler itself runs in our LED process. Effects use that deadline to know when the frame
+#   they are rendering will actually be shown (see 'LEDController.next_frame_time').
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import multiprocessing
+import numpy as np
+import time
+from numbers import Real
+
+from helpers.Frame_Stats import SharedCounters
+from helpers.Settings import Settings
+
+SCHEDULER_STAT_FIELDS = ('frames_shown', 'frames_late', 'frames_dropped', 'jitter_samples')
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Deadline based frame scheduler.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class FrameScheduler:
+    
+    def __init__(self, refresh_rate_hz: Real, spin_us: int=Settings.SCHEDULER_SPIN_US
+                 , max_catch_up: int=Settings.SCHEDULER_MAX_CATCH_UP
+                 , late_threshold_us: int=Settings.SCHEDULER_LATE_THRESHOLD_US) -> None:
+        self.interval_ns = round(1e9 / refresh_rate_hz)
+        self.spin_ns = spin_us * 1000
+        self.max_catch_up = max_catch_up
+        self.late_threshold_ns = late_threshold_us * 1000
+        
+        self._next_deadline_ns = multiprocessing.RawValue('q', -1)
+        self.stats = SharedCounters(SCHEDULER_STAT_FIELDS)
+        self._jitter_ns = multiprocessing.RawArray('q', Settings.SCHEDULER_JITTER_WINDOW)
+    
+    # 'time.monotonic_ns' the next frame is due at, 'None' if we don't have a schedule right now.
+    @property
+    def next_deadline_ns(self) -> int | None:
+        deadline_ns = self._next_deadline_ns.value
+        return None if deadline_ns < 0 else deadline_ns
+    
+    @next_deadline_ns.setter
+    def next_deadline_ns(self, deadline_ns: int | None) -> None:
+        self._next_deadline_ns.value = -1 if deadline_ns is None else deadline_ns
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Throws away our current schedule so the next frame is due one interval from now. Used at startup and
+                 whenever there was simply nothing to show, being idle isn't the same as falling behind.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def resync(self) -> None:
+        self.next_deadline_ns = None
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Sleeps until 'deadline_ns', finishing with a busy spin for the last 'spin_ns' to get sub millisecond
+                 accuracy.
+    INPUT: deadline_ns - Absolute 'time.monotonic_ns' time to wait for.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _sleep_until(self, deadline_ns: int) -> None:
+        remaining_ns = deadline_ns - time.monotonic_ns()
+        if remaining_ns > self.spin_ns:
+            time.sleep((remaining_ns - self.spin_ns) / 1e9)
+        while time.monotonic_ns() < deadline_ns:
+            pass
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Blocks until our next frame is due and then moves the schedule on by one interval. Should be called
+                 right before showing a frame that is already fully prepared.
+    INPUT: NA
+    OUTPUT: Number of deadlines we gave up on because we were too far behind, 0 normally.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def wait_for_next_frame(self) -> int:
+        if self.next_deadline_ns is None:
+            self.next_deadline_ns = time.monotonic_ns()
+        
+        deadline_ns = self.next_deadline_ns
+        # The frame we're about to show has already left the ring, so anyone asking is next in line after it.
+        self.next_deadline_ns = deadline_ns + self.interval_ns
+        now_ns = time.monotonic_ns()
+        if now_ns < deadline_ns:
+            self._sleep_until(deadline_ns)
+            now_ns = time.monotonic_ns()
+        
+        lateness_ns = now_ns - deadline_ns
+        sample = self.stats['jitter_samples']
+        self._jitter_ns[sample % len(self._jitter_ns)] = lateness_ns
+        self.stats['jitter_samples'] = sample + 1
+        if lateness_ns > self.late_threshold_ns:
+            self.stats['frames_late'] += 1
+        
+        # Too far behind to catch up, skip the deadlines we missed but keep our original phase.
+        dropped = lateness_ns // self.interval_ns
+        if dropped > self.max_catch_up:
+            self.stats['frames_dropped'] += dropped
+            deadline_ns += dropped * self.interval_ns
+        else:
+            dropped = 0
+        
+        self.next_deadline_ns = deadline_ns + self.interval_ns
+        self.stats['frames_shown'] += 1
+        return dropped
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs our counters along with jitter percentiles over the last 'SCHEDULER_JITTER_WINDOW' frames.
+                 Jitter is how late (in microseconds) each frame was shown compared to its deadline.
+    INPUT: NA
+    OUTPUT: Dict of all our 'SCHEDULER_STAT_FIELDS' plus 'jitter_us_p50', 'jitter_us_p95', and 'jitter_us_p99'.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_stats(self) -> dict[str, Real]:
+        stats = self.stats.snapshot()
+        samples = np.frombuffer(self._jitter_ns, dtype=np.int64)[:min(stats['jitter_samples'], len(self._jitter_ns))]
+        for percentile in (50, 95, 99):
+            stats[f'jitter_us_p{percentile}'] = float(np.percentile(samples, percentile)) / 1000 if samples.size else 0.0
+        return stats
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -0,0 +1,126 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    FRAME STATS                              CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Small helpers for keeping frame statistics that can be written by our LED writer process and read from the main
+#   process at any time. Everything lives in 'multiprocessing' shared memory and is updated without locks, there is
+#   only ever one writer for any given counter.
+#
+# 'SharedHistograms' keeps fixed size log2 timing histograms per pipeline stage. Recording a sample is one bit_length
+#   and one increment so it is cheap enough to leave on all the time, and memory never grows however long we run.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import multiprocessing
+from numbers import Real
+
+from helpers.Settings import Settings
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Fixed set of named int64 counters in shared memory. Counters are indexed by name.
+             ie. counters['frames_shown'] += 1
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class SharedCounters:
+    
+    def __init__(self, fields: tuple[str]) -> None:
+        self.fields = tuple(fields)
+        self._index = {field: idx for idx, field in enumerate(self.fields)}
+        self._values = multiprocessing.RawArray('q', len(self.fields))
+    
+    def __getitem__(self, field: str) -> int:
+        return self._values[self._index[field]]
+    
+    def __setitem__(self, field: str, value: int) -> None:
+        self._values[self._index[field]] = value
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Resets every counter back to 0.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def reset(self) -> None:
+        for idx in range(len(self.fields)):
+            self._values[idx] = 0
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs a copy of every counter so the caller sees one consistent-ish set of values.
+    INPUT: NA
+    OUTPUT: Dict of {field: value}.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def snapshot(self) -> dict[str, int]:
+        values = self._values[:]
+        return dict(zip(self.fields, values))
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Fixed size timing histogram per named stage in shared memory. Bin 0 holds anything under 1us and bin 'i'
+             holds [2^(i-1), 2^i) us, the last bin catches everything longer.
+             ie. histograms.record('show', end_ns - start_ns)
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class SharedHistograms:
+    
+    def __init__(self, stages: tuple[str], bins: int=Settings.TIMING_HISTOGRAM_BINS) -> None:
+        self.stages = tuple(stages)
+        self.bins = bins
+        self._offset = {stage: idx * self.bins for idx, stage in enumerate(self.stages)}
+        self._counts = multiprocessing.RawArray('q', len(self.stages) * self.bins)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Adds one sample to a stage's histogram.
+    INPUT: stage - Which stage the sample belongs to.
+           duration_ns - How long it took in ns.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def record(self, stage: str, duration_ns: int) -> None:
+        self._counts[self._offset[stage] + min((max(duration_ns, 0) // 1000).bit_length(), self.bins - 1)] += 1
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Clears every histogram.
+    INPUT: NA
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def reset(self) -> None:
+        for idx in range(len(self._counts)):
+            self._counts[idx] = 0
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs a copy of the raw bin counts of every stage.
+    INPUT: NA
+    OUTPUT: Dict of {stage: [count per bin]}.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def snapshot(self) -> dict[str, list[int]]:
+        counts = self._counts[:]
+        return {stage: counts[offset:offset + self.bins] for stage, offset in self._offset.items()}
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Boils every stage's histogram down to a count and percentiles. Percentiles are the upper edge of the
+                 bin they land in so they are accurate to within a factor of 2, plenty to spot where a frame went.
+    INPUT: NA
+    OUTPUT: Dict of {stage: {'count', 'p50_us', 'p95_us', 'p99_us', 'max_us'}}.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def summary(self) -> dict[str, dict[str, Real]]:
+        return {stage: summarize_histogram(counts) for stage, counts in self.snapshot().items()}
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Count and percentiles (in us) of a single 'SharedHistograms' histogram.
+INPUT: counts - Count per bin.
+OUTPUT: Dict of 'count', 'p50_us', 'p95_us', 'p99_us', and 'max_us'.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def summarize_histogram(counts: list[int]) -> dict[str, Real]:
+    total = sum(counts)
+    summary = {'count': total}
+    for percentile in (50, 95, 99, 100):
+        target, running, edge_us = total * percentile / 100, 0, 0
+        for idx, count in enumerate(counts):
+            running += count
+            if count and running >= target:
+                edge_us = 1 << idx
+                break
+        summary['max_us' if percentile == 100 else f'p{percentile}_us'] = edge_us if total else 0
+    return summary
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -7,11 +7,17 @@
 # ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
 # ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
 # Various math helpers we use a lot, like rotating points or converting between polar and cartesian.
+#
+# Rotations all follow the same convention, 'angles' are XYZ degrees and the combined rotation is R = Rz @ Ry @ Rx.
+#   Prefer the batched versions ('rotate_points', 'rotation_matrices') over 'rotate_point' in anything that runs per
+#   frame, they rotate every point with a single matmul.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 import math
 import numpy as np
 from numbers import Real
 
+from helpers.Settings import Settings
+
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Given a single XYZ 'point', rotate it around the origin with XYZ parts of 'angles' 
 INPUT: point - XYZ coord of the point we will be rotating.
@@ -19,26 +25,77 @@ INPUT: point - XYZ coord of the point we will be rotating.
 OUTPUT: Rotated XYZ coordiante.
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 def rotate_point(point: tuple[Real, Real, Real], angles: tuple[Real, Real, Real]) -> tuple[Real, Real, Real]:
-    point = np.array(point)
-    # Convert angles from degrees to radians
-    rx, ry, rz = np.radians(angles)
+    return rotation_matrix(angles) @ np.asarray(point)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Builds the combined rotation matrix for one set of XYZ 'angles'.
+INPUT: angles - XYZ rotation degrees.
+OUTPUT: (3, 3) rotation matrix.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def rotation_matrix(angles: tuple[Real, Real, Real]) -> np.ndarray:
+    return rotation_matrices(np.asarray(angles, dtype=np.float64).reshape(1, 3))[0]
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Builds the combined rotation matrix for every set of XYZ 'angles' at once.
+INPUT: angles - (M, 3) array of XYZ rotation degrees.
+OUTPUT: (M, 3, 3) array of rotation matrices.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def rotation_matrices(angles: np.ndarray) -> np.ndarray:
+    cos_x, cos_y, cos_z = np.cos(np.radians(angles)).T
+    sin_x, sin_y, sin_z = np.sin(np.radians(angles)).T
 
-    # Rotation matrices
-    R_x = np.array([[1, 0, 0]
-                    , [0, np.cos(rx), -np.sin(rx)]
-                    , [0, np.sin(rx), np.cos(rx)]])
+    # R_z @ R_y @ R_x written out by hand so we can build all of them in one go.
+    matrices = np.empty((len(cos_x), 3, 3))
+    matrices[:, 0, 0] = cos_z * cos_y
+    matrices[:, 0, 1] = cos_z * sin_y * sin_x - sin_z * cos_x
+    matrices[:, 0, 2] = cos_z * sin_y * cos_x + sin_z * sin_x
+    matrices[:, 1, 0] = sin_z * cos_y
+    matrices[:, 1, 1] = sin_z * sin_y * sin_x + cos_z * cos_x
+    matrices[:, 1, 2] = sin_z * sin_y * cos_x - cos_z * sin_x
+    matrices[:, 2, 0] = -sin_y
+    matrices[:, 2, 1] = cos_y * sin_x
+    matrices[:, 2, 2] = cos_y * cos_x
+    return matrices
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Rotates every one of 'points' around the origin with a single matmul. Always rotate from your original 
+             points rather than re-rotating already rotated ones, otherwise float error builds up over time.
+INPUT: points - (N, 3) array of XYZ coords we will be rotating.
+       angles - XYZ rotation degrees, or an (M, 3) array of them to get M rotated copies of 'points' back.
+       matrix - Already built rotation matrix (or (M, 3, 3) matrices) to use instead of 'angles'.
+OUTPUT: (N, 3) array of rotated points, or (M, N, 3) if we were given M rotations.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def rotate_points(points: np.ndarray, angles: np.ndarray=None, matrix: np.ndarray=None) -> np.ndarray:
+    if matrix is None:
+        angles = np.asarray(angles, dtype=np.float64)
+        matrix = rotation_matrices(angles.reshape(-1, 3))
+        if angles.ndim == 1:
+            matrix = matrix[0]
+    # Row vectors, so p' = p @ R^T. Works for a single (3, 3) or a stack of (M, 3, 3) matrices.
+    return np.asarray(points) @ np.swapaxes(matrix, -1, -2)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Pool of precomputed random orientations. Building rotation matrices is cheap but not free, effects that
+             want a new random orientation every so often can just draw one from here.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class RotationCache:
     
-    R_y = np.array([[np.cos(ry), 0, np.sin(ry)]
-                    , [0, 1, 0]
-                    , [-np.sin(ry), 0, np.cos(ry)]])
+    def __init__(self, size: int=Settings.ROTATION_CACHE_SIZE, rng: np.random.Generator=None) -> None:
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.matrices = rotation_matrices(self.rng.uniform(0.0, 360.0, (size, 3)))
+        self.matrices.flags.writeable = False
     
-    R_z = np.array([[np.cos(rz), -np.sin(rz), 0]
-                    , [np.sin(rz), np.cos(rz), 0]
-                    , [0, 0, 1]])
-
-    # Combined rotation matrix
-    R = R_z @ R_y @ R_x
-    return R @ point
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs a random orientation out of our pool.
+    INPUT: NA
+    OUTPUT: (3, 3) rotation matrix.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def random(self) -> np.ndarray:
+        return self.matrices[self.rng.integers(len(self.matrices))]
 
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
@@ -0,0 +1,102 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    PROFILING                                CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Hooks for profiling a single effect run so we can find hot spots on the real Pi.
+#
+#   'cprofile' - Deterministic, every call is traced. Exact call counts but it slows Python code down a lot, results
+#                are written out as a '.prof' file for 'pstats', snakeviz, etc.
+#   'sample'   - Grabs the effect thread's stack every 'PROFILE_SAMPLE_INTERVAL_S' from a second thread. Barely slows
+#                the effect down so timings stay realistic, results are written as folded stacks ('a;b;c count') that
+#                flamegraph.pl or speedscope can open directly.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import cProfile
+import collections
+import os
+import sys
+import threading
+import time
+
+from helpers.Settings import Settings
+
+PROFILE_MODES = ('cprofile', 'sample')
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Very small sampling profiler for a single thread. Counts how many times each full stack was seen.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class SamplingProfiler:
+    
+    def __init__(self, thread_id: int, interval_s: float=Settings.PROFILE_SAMPLE_INTERVAL_S) -> None:
+        self.thread_id = thread_id
+        self.interval_s = interval_s
+        self.stacks = collections.Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample_loop, daemon=True)
+    
+    def start(self) -> None:
+        self._thread.start()
+    
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+    
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Writes every stack we've seen in folded format, one 'frame;frame;frame count' per line.
+    INPUT: path - File to write to.
+    OUTPUT: NA
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def write_folded(self, path: str) -> None:
+        with open(path, 'w') as file:
+            for stack, count in self.stacks.most_common():
+                file.write(f"{stack} {count}\n")
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Runs 'func(*args)' under the given profiler and writes its results into 'PROFILE_DIR'. Meant to be run
+             on the thread the effect itself runs on.
+INPUT: func - Function we are profiling.
+       args - Args to call 'func' with.
+       mode - One of 'PROFILE_MODES'.
+       name - Name for our output file, the time is added on so runs don't overwrite each other.
+OUTPUT: Path of the profile we wrote.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def run_profiled(func, args: tuple, mode: str, name: str) -> str:
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode '{mode}', expected one of {PROFILE_MODES}.")
+    
+    os.makedirs(Settings.PROFILE_DIR, exist_ok=True)
+    path = os.path.join(Settings.PROFILE_DIR, f"{name}_{time.strftime('%Y%m%d_%H%M%S')}")
+    
+    if mode == 'cprofile':
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(func, *args)
+        finally:
+            profiler.dump_stats(path := path + '.prof')
+    else:
+        profiler = SamplingProfiler(threading.get_ident())
+        profiler.start()
+        try:
+            func(*args)
+        finally:
+            profiler.stop()
+            profiler.write_folded(path := path + '.folded')
+    return path
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
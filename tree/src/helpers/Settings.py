@@ -29,18 +29,70 @@ class SettingsClass:
     LED_INVERT: bool    = False     # True to invert the signal (when using NPN transistor level shift)
     LED_CHANNEL: int    = 0         # Channel (default is 0)
     LED_ORDER: str      = "GRB"     # Pixel color order (typically 'GRB')
+    LED_SEGMENTS: tuple[tuple[int, int, int], ...] = () # (num_leds, pin, channel) of each chain our LEDs are split
+                                                        #   across in order, ie. ((325, 18, 0), (325, 13, 1)) for
+                                                        #   both PWM channels. Empty drives them all off 'LED_PIN'.
+    
+    # Output Settings
+    LED_OUTPUT: str     = "ws281x"          # Where frames go, 'ws281x' (the real strip), 'null', or 'recording'.
+    RECORDING_PATH: str = "recording.frames" # File the 'recording' output writes to.
+    FRAME_FILE_WINDOW_FRAMES: int = 1024    # Frames we memory map at a time when playing back a frame file.
+    
+    # Playlist Settings
+    PLAYLIST_CROSSFADE_S: float = 1.0   # Default seconds each effect in a playlist crossfades in over.
+    EFFECT_EXIT_BUDGET_S: float = 0.0   # Default seconds an effect gets to wrap up once stopped, see 'exit_budget'.
+    EFFECT_STOP_TIMEOUT_S: float = 0.5  # Extra seconds we wait on an effect past its budget before giving up on it.
+    FLUSH_ON_SWITCH: bool = True        # Throw away the old effect's queued frames as soon as it's told to stop.
+    
+    # Streaming Settings
+    DDP_PORT: int                  = 4048   # UDP port we receive DDP pixel data on (the protocol's default).
+    STREAM_JITTER_BUFFER_MS: float = 30.0   # How long received frames are held before being shown, rides out jitter.
+    STREAM_BUFFER_FRAMES: int      = 8      # Max received frames waiting to be shown, the oldest is dropped past that.
+    STREAM_REORDER_PACKETS: int    = 4      # Out of order packets we hold on to while waiting for a missing one.
     
     # Internal Implementation Settings
     UPDATE_QUEUE_SIZE: int = 60     # Number of updates we can "preprocess" before waiting to calculate further
+    BACKPRESSURE_POLICY: str = "block"  # What to do when the queue is full, 'block', 'drop_oldest', or 'mailbox'.
+    SKIP_UNCHANGED_FRAMES: bool = True  # Don't push frames to the strip that are identical to the last one.
+    KEEPALIVE_INTERVAL_S: float = 1.0   # Push unchanged frames anyway at least this often.
+    
+    SCHEDULER_SPIN_US: int            = 500     # Busy wait the last X us of each frame for accuracy (0 to disable).
+    SCHEDULER_MAX_CATCH_UP: int       = 2       # Frames we can fall behind and still catch up before dropping.
+    SCHEDULER_LATE_THRESHOLD_US: int  = 1000    # How late a frame can be shown before we count it as 'late'.
+    SCHEDULER_JITTER_WINDOW: int      = 1024    # Number of recent frames we compute jitter percentiles over.
+    
+    TIMING_HISTOGRAM_BINS: int       = 24                   # log2 us bins per stage histogram, covers up to ~8s.
+    TIMING_DUMP_PATH: str            = "frame_timings.json" # Where timing histograms get dumped (SIGUSR1, etc.)
+    TIMING_DUMP_EACH_EFFECT: bool    = False                # Also dump them every time an effect finishes.
+    PROFILE_DIR: str                 = "profiles"           # Where profiled effect runs write their results.
+    PROFILE_SAMPLE_INTERVAL_S: float = 0.005                # How often the sampling profiler grabs a stack.
     
     GAMMA_RED: float    = 2.0       # Gamma correction value for 'red'.
     GAMMA_GREEN: float  = 1.8       # Gamma correction value for 'green'.
     GAMMA_BLUE: float   = 1.9       # Gamma correction value for 'blue'.
 
+    HUE_PALETTE_SIZE: int      = 360    # Number of hues in our precomputed rainbow palette.
+    HUE_PALETTE_FINE_SIZE: int = 3600   # Number of hues in our 'fine' palette for smooth gradients and slow fades.
+    
+    CYCLE_CACHE_BUDGET_MB: int = 64     # Max memory our rendered cycle cache can use before evicting old cycles.
+    CYCLE_CACHE_DIR: str | None = None  # Directory to also save rendered cycles to, 'None' keeps them in memory only.
+    
+    ROTATION_CACHE_SIZE: int = 256      # Number of random orientations we precompute for effects to draw from.
+    SPATIAL_INDEX_CELL_SIZE: int = 50   # Edge length of each voxel in our spatial index, same units as our coords.
+    
+    RENDER_FARM_WORKERS: int   = 0      # Processes rendering each effect's frames, 0 renders them in the effect thread.
+    RENDER_FARM_LOOKAHEAD: int = 8      # Max frames the render farm works on ahead of the one being shown.
+    
+    FADE_DECAY_RANGE: tuple[float, float] = (1.0, 1.3)  # Range each LED's value is randomly divided by every step.
+    FADE_DECAY_RATE_HZ: float             = 35.0        # Steps per second of fading, independent of our frame rate.
+    FADE_THRESHOLD: float                 = 0.001       # Value at which a fading LED is reset to black.
+
     BAD_LEDS: tuple[int] = (395,)    # Tuple of LED's we should never turn on.
 
     # Logging Settings
-    FUNCTION_ARG_LOGGING_LEVEL: int = 15
+    FUNCTION_ARG_LOGGING_LEVEL: int   = 15
+    FUNCTION_ARG_REPR_MAX_LENGTH: int = 80  # Max characters of any single logged arg.
+    FUNCTION_ARG_REPR_MAX_ITEMS: int  = 6   # Max items of any list, tuple, dict, etc. we log before cutting it off.
 
 Settings = SettingsClass()
 
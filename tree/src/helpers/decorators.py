@@ -10,6 +10,8 @@
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 import functools
 import logging
+import reprlib
+import weakref
 from typing import Union, Optional
 
 from helpers.Settings import Settings
@@ -38,34 +40,83 @@ def get_file_logger(filename: str, log_level: Union[int, str]=logging.INFO, mode
     return logger
 
 
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: 'reprlib.Repr' that keeps argument logging cheap. Long lists, strings, etc. are cut down to a few
+             elements and numpy arrays are summarized by their shape and dtype instead of their contents.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class _ArgRepr(reprlib.Repr):
+    
+    def __init__(self) -> None:
+        super().__init__()
+        self.maxstring = self.maxother = Settings.FUNCTION_ARG_REPR_MAX_LENGTH
+        self.maxlist = self.maxtuple = self.maxdict = self.maxset = Settings.FUNCTION_ARG_REPR_MAX_ITEMS
+    
+    def repr_ndarray(self, array, level: int) -> str:
+        return f"ndarray(shape={array.shape}, dtype={array.dtype})"
+
+_arg_repr = _ArgRepr()
+
+# Loggers we've already found on an instance so we don't have to dig through its '__dict__' on every call.
+_instance_loggers = weakref.WeakKeyDictionary()
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Finds which logger a call to a 'log_func' wrapped function should use. Loggers passed in directly win,
+             then any logger that is a member of 'self', then the root logger.
+INPUT: args - Positional args of our call.
+       kwargs - Keyword args of our call.
+OUTPUT: Logger to use for this call.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def _find_logger(args: tuple, kwargs: dict) -> logging.Logger:
+    for arg in (*kwargs.values(), *args):
+        if isinstance(arg, logging.Logger):
+            return arg
+    
+    first_arg = args[0] if args else None
+    if not hasattr(first_arg, "__dict__"):  # is first argument `self`
+        return logging.getLogger()
+    
+    try:
+        return _instance_loggers[first_arg]
+    except (KeyError, TypeError):
+        pass
+    
+    logger = next((x for x in first_arg.__dict__.values() if isinstance(x, logging.Logger)), None)
+    if logger is None:
+        # Not cached, '__init__' may simply not have set our logger yet.
+        return logging.getLogger()
+    
+    try:
+        _instance_loggers[first_arg] = logger
+    except TypeError:
+        pass  # Not weak referenceable or hashable, we'll just look it up again next time.
+    return logger
+
+
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Decorator that can auto detect a logger passed in to a function (args or kwargs) or is a member of that 
                 functions class. It uses a default logger if neither are present. It then logs all input args for that
                 function at 'FUNCTION_ARG_LOGGING_LEVEL'. Additionally, it catches any exceptions raised to make sure
                 they make it into the log and also provide us with a mini 'stack trace' if the caller functions also
                 used this decorator through the re-raise.
+
+                Args are only formatted when that level is actually enabled, and even then they are cut down through
+                '_ArgRepr' so a call with a whole frame of pixels doesn't dump the entire frame into the log.
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 def log_func(_func=None):
     def decorator_log(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            logger = logging.getLogger()
+            logger = _find_logger(args, kwargs)
             # Log All Args/ Kwargs
-            try:
-                first_arg = next(iter(args), None)
-                # does kwargs or args have any logger
-                logger_params = [x for x in kwargs.values() if isinstance(x, logging.Logger)] + \
-                    [x for x in args if isinstance(x, logging.Logger)]
-                if hasattr(first_arg, "__dict__"):  # is first argument `self`
-                    # does class (dict) members have any logger
-                    logger_params += [x for x in first_arg.__dict__.values() if isinstance(x, logging.Logger)]
-                    
-                logger = next(iter(logger_params))  # get the first logger
-                args_kwargs_sep = ", ".join([repr(a) for a in args] + [f"{k}={v!r}" for k, v in kwargs.items()])
-                logger.log(Settings.FUNCTION_ARG_LOGGING_LEVEL, f"_function {func.__name__} " \
-                                                                f"called with {args_kwargs_sep}")
-            except Exception:
-                pass
+            if logger.isEnabledFor(Settings.FUNCTION_ARG_LOGGING_LEVEL):
+                try:
+                    args_kwargs_sep = ", ".join([_arg_repr.repr(a) for a in args]
+                                                + [f"{k}={_arg_repr.repr(v)}" for k, v in kwargs.items()])
+                    logger.log(Settings.FUNCTION_ARG_LOGGING_LEVEL, "_function %s called with %s"
+                               , func.__name__, args_kwargs_sep)
+                except Exception:
+                    pass
             # Log Any Exceptions
             try:
                 result = func(*args, **kwargs)
@@ -79,16 +130,37 @@ def log_func(_func=None):
         return decorator_log
     else:
         return decorator_log(_func)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Marks a method so 'LogAllMethods' leaves it alone. Meant for methods called every single frame where
+             even an early out logging check adds up, they also won't get their exceptions logged.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def no_log(func):
+    func._no_log = True
+    return func
     
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
-DESCRIPTION: Applies 'log_func' decorator to every single function in a class.
+DESCRIPTION: Declares how long an effect gets to wrap up gracefully (ie. fade out) once it's told to stop. Past that
+             it is cut off at the next frame it hands over, see 'LEDEffects.run_effect_for_x_seconds'.
+             ie. @exit_budget(1.5)
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def exit_budget(seconds: float):
+    def decorator(func):
+        func._exit_budget_s = seconds
+        return func
+    return decorator
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Applies 'log_func' decorator to every single function in a class, except those marked with 'no_log'.
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 class LogAllMethods:
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         for attr, value in cls.__dict__.items():
-            if callable(value):
+            if callable(value) and not getattr(value, "_no_log", False):
                 setattr(cls, attr, log_func(value))
 
 
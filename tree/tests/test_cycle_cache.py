@@ -0,0 +1,73 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    TEST CYCLE CACHE                         CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Tests for the periodic effects' cycles (see 'Cycle_Cache.py' and 'LEDEffects._cached_cycle'). However slow an effect
+#   runs, building its cycle has to stay within our cache budget. Effects get a stand-in clock instead of a real
+#   'LEDController', building cycles only needs our refresh rate.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import numpy as np
+import pytest
+import tracemalloc
+import types
+
+from Effects import LEDEffects
+from helpers.Cycle_Cache import CycleCache, LazyCycle
+from Renderers import CycleRenderer
+
+REFRESH_RATE_HZ = 35
+SLOW_SPEEDS = (1.0, 0.25)   # Degrees of hue per second, a full cycle takes 6 and 24 minutes.
+
+
+@pytest.fixture
+def effects():
+    return LEDEffects(led_controller=types.SimpleNamespace(refresh_rate_hz=REFRESH_RATE_HZ), render_workers=0)
+
+
+def _build_traced(effects: LEDEffects, speed: float) -> tuple[np.ndarray | LazyCycle, int]:
+    tracemalloc.start()
+    try:
+        cycle, _ = effects._radial_rainbow_cycle(0, speed, 1.0)
+        return cycle, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize('speed', SLOW_SPEEDS)
+def test_slow_cycle_within_budget(effects, speed):
+    cycle, peak = _build_traced(effects, speed)
+    
+    assert isinstance(cycle, np.ndarray)
+    assert cycle.nbytes <= effects.cycle_cache.budget_bytes
+    assert peak <= effects.cycle_cache.budget_bytes
+    assert len(effects.cycle_cache) == 1
+
+
+@pytest.mark.parametrize('speed', SLOW_SPEEDS)
+def test_slow_cycle_over_budget_is_lazy(effects, speed):
+    full, _ = effects._radial_rainbow_cycle(0, speed, 1.0)
+    effects.cycle_cache = CycleCache(budget_bytes=full.nbytes // 2)
+    cycle, peak = _build_traced(effects, speed)
+    
+    assert isinstance(cycle, LazyCycle)
+    assert peak <= effects.cycle_cache.budget_bytes
+    assert len(effects.cycle_cache) == 0
+    assert len(cycle) == len(full)
+    for index in (0, 1, len(full) // 2, len(full) - 1):
+        np.testing.assert_array_equal(cycle[index], full[index])
+
+
+def test_cycle_never_farmed(effects):
+    # Workers would only rebuild the cycle to copy its frames back to us.
+    effects.render_workers = 2
+    renderer = effects.make_renderer('radial_rainbow', (0, 1.0, 1.0))
+    
+    assert isinstance(renderer, CycleRenderer)
+    renderer.close()
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
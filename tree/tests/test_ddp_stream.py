@@ -0,0 +1,157 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    TEST DDP STREAM                          CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Loopback tests for 'Ddp_Stream'. A real 'DDPSender' streams to a real 'DDPReceiver' on localhost, with the sender's
+#   socket swapped for one that lets us send its packets in any order, or not at all. The jitter buffer is turned off
+#   so frames can be read as soon as they are finished.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import numpy as np
+import pytest
+import time
+
+from Ddp_Stream import DDP_MAX_DATA, DDPReceiver, DDPSender
+
+NUM_LEDS = 1000                                         # 3000 bytes, so every frame is split over several packets.
+PACKETS_PER_FRAME = -(-NUM_LEDS * 3 // DDP_MAX_DATA)
+TIMEOUT_S = 2.0
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Stands in for a 'DDPSender's socket. Packets are held on to until 'flush' sends them in whatever order
+             we ask for, leaving a packet out of 'order' drops it.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class ReorderingSocket:
+    
+    def __init__(self, sock) -> None:
+        self.sock = sock
+        self.packets = []
+    
+    def sendmsg(self, buffers, ancdata, flags, address) -> None:
+        self.packets.append((b''.join(buffers), address))
+    
+    def flush(self, order: list[int]) -> None:
+        for index in order:
+            self.sock.sendto(*self.packets[index])
+        self.packets.clear()
+    
+    def close(self) -> None:
+        self.sock.close()
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: An 'out' for 'DDPReceiver.read' that streams 'frame' while 'read' still has its slot checked out, then
+             waits for the receiver to finish it.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class StreamingOut:
+    
+    def __init__(self, sender: DDPSender, receiver: DDPReceiver, frame: np.ndarray) -> None:
+        self.sender = sender
+        self.receiver = receiver
+        self.frame = frame
+        self.copy = np.zeros((NUM_LEDS, 3), dtype=np.uint8)
+    
+    def __setitem__(self, key, value) -> None:
+        self.copy[key] = value
+        finished = _finished(self.receiver) + 1
+        self.sender.send(self.frame)
+        self.sender.sock.flush(range(PACKETS_PER_FRAME))
+        _wait_for_frames(self.receiver, finished)
+
+
+@pytest.fixture
+def receiver(request):
+    receiver = DDPReceiver(NUM_LEDS, port=0, host='127.0.0.1', jitter_buffer_ms=0, **getattr(request, 'param', {}))
+    yield receiver
+    receiver.close()
+
+
+@pytest.fixture
+def sender(receiver):
+    sender = DDPSender('127.0.0.1', receiver.port)
+    sender.sock = ReorderingSocket(sender.sock)
+    yield sender
+    sender.close()
+
+
+def _frames(count: int) -> np.ndarray:
+    return np.random.default_rng(count).integers(0, 256, (count, NUM_LEDS, 3), dtype=np.uint8)
+
+
+def _finished(receiver: DDPReceiver) -> int:
+    stats = receiver.get_stats()
+    return stats['frames_completed'] + stats['frames_incomplete']
+
+
+def _wait_for_frames(receiver: DDPReceiver, count: int) -> None:
+    deadline = time.monotonic() + TIMEOUT_S
+    while _finished(receiver) < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def _stream(sender: DDPSender, receiver: DDPReceiver, frames: np.ndarray, order: list[int]) -> list[np.ndarray]:
+    for frame in frames:
+        sender.send(frame)
+    sender.sock.flush(order)
+    _wait_for_frames(receiver, len(frames))
+    
+    shown = []
+    out = np.empty((NUM_LEDS, 3), dtype=np.uint8)
+    while receiver.read(out):
+        shown.append(out.copy())
+    return shown
+
+
+def test_in_order(sender, receiver):
+    frames = _frames(5)
+    shown = _stream(sender, receiver, frames, range(len(frames) * PACKETS_PER_FRAME))
+    
+    np.testing.assert_array_equal(shown, frames)
+    stats = receiver.get_stats()
+    assert stats['packets_out_of_order'] == stats['packets_lost'] == stats['frames_incomplete'] == 0
+
+
+def test_reordered(sender, receiver):
+    # The first packet sets the sequence we expect so it goes out first, after that we swap packets inside a frame
+    #   and across the end of one.
+    frames = _frames(4)
+    shown = _stream(sender, receiver, frames, [0, 2, 1, 3, 4, 6, 5, 7, 8, 10, 9, 11])
+    
+    np.testing.assert_array_equal(shown, frames)
+    stats = receiver.get_stats()
+    assert stats['packets_out_of_order'] == 3
+    assert stats['packets_lost'] == stats['frames_incomplete'] == 0
+
+
+def test_dropped(sender, receiver):
+    frames = _frames(4)
+    order = [index for index in range(len(frames) * PACKETS_PER_FRAME) if index != PACKETS_PER_FRAME + 1]
+    shown = _stream(sender, receiver, frames, order)
+    
+    np.testing.assert_array_equal(shown, frames[[0, 2, 3]])
+    stats = receiver.get_stats()
+    assert stats['packets_lost'] == stats['frames_incomplete'] == 1
+    assert stats['frames_completed'] == 3
+
+
+@pytest.mark.parametrize('receiver', [{'depth': 0}], indirect=True)
+def test_no_depth_while_reading(sender, receiver):
+    first, second = _frames(2)
+    sender.send(first)
+    sender.sock.flush(range(PACKETS_PER_FRAME))
+    _wait_for_frames(receiver, 1)
+    
+    # 'second' is finished while 'read' is still copying 'first' out of its slot.
+    out = StreamingOut(sender, receiver, second)
+    assert receiver.read(out)
+    
+    np.testing.assert_array_equal(out.copy, first)
+    np.testing.assert_array_equal(_stream(sender, receiver, [], []), [second])
+    assert receiver.get_stats()['frames_overflowed'] == 0
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
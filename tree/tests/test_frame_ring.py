@@ -0,0 +1,135 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    TEST FRAME RING                          CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Tests for 'Frame_Ring.py'. The producer and reader both run in this process, the reader either inline or from a
+#   thread when the producer has to block on it. Every wait has a timeout so a broken ring fails instead of hanging.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import numpy as np
+import pytest
+import threading
+
+from helpers.Frame_Ring import FrameRing, POLICY_BLOCK, POLICY_DROP_OLDEST, POLICY_MAILBOX
+
+DEPTH = 4
+NUM_LEDS = 8
+TIMEOUT_S = 2.0
+SHORT_TIMEOUT_S = 0.05      # For waits we expect to time out.
+
+
+@pytest.fixture
+def ring(request):
+    ring = FrameRing(DEPTH, NUM_LEDS, getattr(request, 'param', POLICY_BLOCK))
+    yield ring
+    ring.close()
+    ring.unlink()
+
+
+def _frame(value: int) -> np.ndarray:
+    return np.full((NUM_LEDS, 3), value, dtype=np.uint8)
+
+
+def _fill(ring: FrameRing, count: int) -> None:
+    for value in range(count):
+        ring.put(_frame(value))
+
+
+def _read_all(ring: FrameRing) -> list[int]:
+    values = []
+    while (frame := ring.acquire_read_slot(timeout=0)) is not None:
+        values.append(int(frame[0, 0]))
+        ring.release_read()
+    return values
+
+
+def test_block_is_fifo(ring):
+    _fill(ring, DEPTH)
+    
+    assert ring.acquire_write_slot(timeout=SHORT_TIMEOUT_S) is None
+    assert _read_all(ring) == list(range(DEPTH))
+    assert ring.stats.snapshot() == {'frames_committed': DEPTH, 'frames_overwritten': 0, 'frames_flushed': 0
+                                     , 'producer_blocks': 1}
+
+
+def test_block_waits_for_reader(ring):
+    _fill(ring, DEPTH)
+    producer = threading.Thread(target=ring.put, args=(_frame(DEPTH),), daemon=True)
+    producer.start()
+    producer.join(SHORT_TIMEOUT_S)
+    assert producer.is_alive()
+    
+    assert int(ring.acquire_read_slot(timeout=0)[0, 0]) == 0
+    ring.release_read()
+    producer.join(TIMEOUT_S)
+    
+    assert not producer.is_alive()
+    assert _read_all(ring) == list(range(1, DEPTH + 1))
+    assert ring.stats['frames_overwritten'] == 0
+
+
+@pytest.mark.parametrize('ring', [POLICY_DROP_OLDEST], indirect=True)
+def test_drop_oldest_overwrites_oldest(ring):
+    _fill(ring, DEPTH + 2)
+    
+    assert _read_all(ring) == list(range(2, DEPTH + 2))
+    assert ring.stats.snapshot() == {'frames_committed': DEPTH + 2, 'frames_overwritten': 2, 'frames_flushed': 0
+                                     , 'producer_blocks': 0}
+
+
+@pytest.mark.parametrize('ring', [POLICY_DROP_OLDEST, POLICY_MAILBOX], indirect=True)
+def test_never_overwrites_frame_being_read(ring):
+    _fill(ring, DEPTH)
+    reading = ring.acquire_read_slot(timeout=0)
+    value = int(reading[0, 0])
+    overwritten = ring.stats['frames_overwritten']
+    # Fill back up so the frame being read is the oldest one left, ie. the one a full ring would overwrite next.
+    for _ in range(DEPTH - ring.pending()):
+        ring.put(_frame(DEPTH))
+    
+    assert ring.acquire_write_slot(timeout=SHORT_TIMEOUT_S) is None
+    assert int(reading[0, 0]) == value
+    assert ring.stats['frames_overwritten'] == overwritten
+    ring.release_read()
+    assert ring.acquire_write_slot(timeout=0) is not None
+
+
+@pytest.mark.parametrize('ring', [POLICY_MAILBOX], indirect=True)
+def test_mailbox_reads_newest(ring):
+    _fill(ring, DEPTH + 2)
+    
+    # Two frames are overwritten on the way in, the reader then skips the three older ones still waiting.
+    assert _read_all(ring) == [DEPTH + 1]
+    assert ring.stats.snapshot() == {'frames_committed': DEPTH + 2, 'frames_overwritten': DEPTH + 1
+                                     , 'frames_flushed': 0, 'producer_blocks': 0}
+
+
+@pytest.mark.parametrize('ring', [POLICY_BLOCK, POLICY_DROP_OLDEST, POLICY_MAILBOX], indirect=True)
+def test_flush_drops_queued(ring):
+    _fill(ring, DEPTH - 1)
+    
+    assert ring.flush() == DEPTH - 1
+    assert ring.pending() == 0
+    assert _read_all(ring) == []
+    assert ring.stats['frames_flushed'] == DEPTH - 1
+    
+    ring.put(_frame(DEPTH))
+    assert _read_all(ring) == [DEPTH]
+
+
+def test_flush_wakes_blocked_producer(ring):
+    _fill(ring, DEPTH)
+    producer = threading.Thread(target=ring.put, args=(_frame(DEPTH),), daemon=True)
+    producer.start()
+    producer.join(SHORT_TIMEOUT_S)
+    
+    assert ring.flush() == DEPTH
+    producer.join(TIMEOUT_S)
+    assert not producer.is_alive()
+    assert _read_all(ring) == [DEPTH]
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -0,0 +1,84 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    TEST FRAME SCHEDULER                     CREATED: 2026-10-18          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Tests for 'Frame_Scheduler.py'. Runs the scheduler against the real monotonic clock at a high refresh rate, falling
+#   behind on purpose by sleeping between frames, and checks every deadline it hands out.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import pytest
+import time
+
+from helpers.Frame_Scheduler import FrameScheduler
+
+REFRESH_RATE_HZ = 100
+MAX_CATCH_UP = 2
+
+
+@pytest.fixture
+def scheduler():
+    return FrameScheduler(REFRESH_RATE_HZ, max_catch_up=MAX_CATCH_UP)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Shows one frame per entry of 'delays', sleeping that many intervals before each one like a slow writer.
+INPUT: scheduler - Scheduler to run.
+       delays - Intervals to sleep before each frame.
+OUTPUT: List of (deadline, time the wait returned, frames dropped) of every frame, all in ns.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def _run(scheduler: FrameScheduler, delays: list[float]) -> list[tuple[int, int, int]]:
+    frames = []
+    for delay in delays:
+        time.sleep(delay * scheduler.interval_ns / 1e9)
+        dropped = scheduler.wait_for_next_frame()
+        shown_ns = time.monotonic_ns()
+        frames.append((scheduler.next_deadline_ns - scheduler.interval_ns, shown_ns, dropped))
+    return frames
+
+
+def _assert_spaced(scheduler: FrameScheduler, frames: list[tuple[int, int, int]]) -> None:
+    for (deadline, _, _), (next_deadline, _, _) in zip(frames, frames[1:]):
+        assert next_deadline - deadline >= scheduler.interval_ns
+    for deadline, shown_ns, _ in frames:
+        assert shown_ns >= deadline
+
+
+def test_on_time(scheduler):
+    frames = _run(scheduler, [0] * 20)
+    
+    _assert_spaced(scheduler, frames)
+    deadlines = [deadline for deadline, _, _ in frames]
+    assert all(b - a == scheduler.interval_ns for a, b in zip(deadlines, deadlines[1:]))
+    assert scheduler.stats['frames_dropped'] == 0
+
+
+def test_catches_up_without_bunching(scheduler):
+    # Falls behind by less than 'MAX_CATCH_UP' frames, those deadlines are kept and shown back to back.
+    frames = _run(scheduler, [0] * 5 + [MAX_CATCH_UP - 0.5] + [0] * 10)
+    
+    _assert_spaced(scheduler, frames)
+    assert sum(dropped for _, _, dropped in frames) == 0
+
+
+def test_drops_when_too_far_behind(scheduler):
+    frames = _run(scheduler, [0] * 5 + [MAX_CATCH_UP + 3] + [0] * 10)
+    
+    _assert_spaced(scheduler, frames)
+    dropped = sum(dropped for _, _, dropped in frames)
+    assert dropped > MAX_CATCH_UP
+    assert scheduler.stats['frames_dropped'] == dropped
+
+
+def test_resync_after_idle(scheduler):
+    frames = _run(scheduler, [0] * 5)
+    scheduler.resync()
+    frames += _run(scheduler, [5] + [0] * 5)
+    
+    _assert_spaced(scheduler, frames)
+    assert scheduler.stats['frames_dropped'] == 0
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file